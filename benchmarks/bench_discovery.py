@@ -0,0 +1,87 @@
+"""Time extension discovery and per-page manifest lookups.
+
+Each startup variant runs in a fresh interpreter so imports are not shared:
+the eager discovery this replaced (load every entry point, then import the
+registry), the lazy discovery on a cold cache, and again on a warm one.  The
+per-page part times ``page_config_overlays`` with and without the manifest
+memo (from an installed checkout)::
+
+    python benchmarks/bench_discovery.py --pages 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+EAGER = """
+import importlib
+from importlib import metadata
+from webifier.core.builder import Builder
+from webifier.core.extensions import ExtensionManager
+
+def discover(self):
+    found = {ep.name: ep.load() for ep in metadata.entry_points().select(group="webifier.extensions")}
+    for extension_id, factory in importlib.import_module("webifier_extensions.registry").EXTENSIONS.items():
+        found.setdefault(extension_id, factory)
+    return found
+
+ExtensionManager.discover = discover
+"""
+
+LAZY = """
+from webifier.core.builder import Builder
+"""
+
+CONFIGURE = """
+import time
+start = time.perf_counter()
+Builder(extension_cache=True).configure_extensions(
+    {"webifier": {"extensions": {"site": {"uses": "webifier.standard"}}}}
+)
+print(time.perf_counter() - start)
+"""
+
+
+def startup(prelude: str, cache_dir: str) -> float:
+    env = {**os.environ, "WEBIFIER_CACHE_DIR": cache_dir}
+    output = subprocess.run(
+        [sys.executable, "-c", prelude + CONFIGURE], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return float(output)
+
+
+def per_page(pages: int, memoized: bool) -> float:
+    from webifier.core.builder import Builder
+
+    builder = Builder(template_cache=False)
+    manager = builder.extensions
+    manager.configure({"webifier": {"extensions": {"site": {"uses": "webifier.standard"}}}})
+    page = {"webifier": {"extensions": {"md": {"uses": "webifier.markdown", "toc": False}}}}
+    start = time.perf_counter()
+    for _ in range(pages):
+        if not memoized:
+            manager._manifests.clear()
+            manager._extensions.clear()
+        manager.page_config_overlays(page)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for label, prelude in (("eager", EAGER), ("lazy, cold cache", LAZY), ("lazy, warm cache", LAZY)):
+            print(f"  startup {label:<18} {startup(prelude, cache_dir) * 1000:8.1f} ms")
+    for label, memoized in (("manifest per page", False), ("memoized manifest", True)):
+        print(f"  {args.pages} pages, {label:<18} {per_page(args.pages, memoized) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
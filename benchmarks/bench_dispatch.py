@@ -0,0 +1,87 @@
+"""Measure time and allocations of ``Builder.process_node`` on deep pages.
+
+Builds a page of nested sections whose innermost level holds a large link
+collection (what a ``${glob:posts/*.yml}`` produces) and renders it with the
+standard extensions, once as-is and once with the deep copies the dispatch
+path used to make at every dict node and link (from an installed checkout)::
+
+    python benchmarks/bench_dispatch.py --depth 8 --links 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import os
+import tempfile
+import time
+import tracemalloc
+
+from webifier.core.base import NodeContext
+from webifier.core.builder import Builder
+
+
+class DeepCopyingBuilder(Builder):
+    """The dispatch path before copy-on-write: deep copies at every node."""
+
+    def process_node(self, data, ctx):
+        if isinstance(data, dict):
+            data = copy.deepcopy(data)
+        return super().process_node(data, ctx)
+
+    def _process_link(self, link, ctx):
+        return super()._process_link(copy.deepcopy(link), ctx)
+
+
+def make_page(depth: int, links: int) -> dict:
+    collection = [
+        {
+            "text": f"Post {i}",
+            "href": f"https://example.com/posts/{i}",
+            "tags": ["python", "static-sites", f"tag-{i % 7}"],
+            "author": {"name": f"Author {i % 13}", "url": f"https://example.com/authors/{i % 13}"},
+        }
+        for i in range(links)
+    ]
+    node: dict = {"label": "Posts", "content": collection}
+    for level in range(depth):
+        node = {"label": f"Level {level}", "intro": f"Section {level}.", f"level-{level}": node}
+    return node
+
+
+def measure(builder_class: type[Builder], page: dict, output: str) -> tuple[float, int]:
+    """Return the render time and the peak traced memory of one pass over *page*."""
+    builder = builder_class(output_dir=output, base_url="", template_cache=False)
+    builder.configure_extensions(
+        {"webifier": {"extensions": {"site": {"uses": "webifier.standard"}, "md": {"uses": "webifier.markdown"}}}}
+    )
+    ctx = NodeContext(depth=1)
+    builder.process_node(page, ctx)  # warm templates and caches
+
+    start = time.perf_counter()
+    builder.process_node(page, ctx)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    builder.process_node(page, ctx)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--links", type=int, default=500)
+    args = parser.parse_args()
+
+    page = make_page(args.depth, args.links)
+    with tempfile.TemporaryDirectory() as output:
+        os.chdir(output)
+        for label, builder_class in (("deep copies", DeepCopyingBuilder), ("copy-on-write", Builder)):
+            seconds, peak = measure(builder_class, page, output)
+            print(f"  {label:<14} {seconds * 1000:8.1f} ms   peak traced memory {peak / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Time and allocations of ``expand`` on pages carrying large static data.
+
+A page with a handful of interpolations has a large data file patched in
+(what ``patch@data: data/catalog.yml`` produces).  Compares the engine with
+the walk it replaced, which rebuilt every dict and list and allocated a
+``Context`` per dict entry (from an installed checkout)::
+
+    python benchmarks/bench_expand_static.py --records 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+from webifier.interface.resolvers import _BUILTINS
+from webifier.interface.resolvers.base import Context
+from webifier.interface.resolvers.engine import Engine
+
+
+class RebuildingEngine(Engine):
+    """The walk before copy-on-write: every container rebuilt, every string resolved."""
+
+    def _walk(self, data, ctx):
+        if isinstance(data, str):
+            return self._resolve_string(data, ctx)
+        if isinstance(data, dict):
+            return {k: self._walk(v, Context(ctx.root, data)) for k, v in data.items()}
+        if isinstance(data, list):
+            return [self._walk(item, ctx) for item in data]
+        return data
+
+
+def make_page(records: int) -> dict:
+    catalog = [
+        {
+            "id": i,
+            "title": f"Item {i}",
+            "price": i * 1.25,
+            "tags": ["static", f"group-{i % 17}"],
+            "details": {"weight": i % 50, "colour": "blue", "available": i % 3 == 0},
+        }
+        for i in range(records)
+    ]
+    return {
+        "title": "Catalog",
+        "heading": "${ref:.title} (${ref:data.count} items)",
+        "data": {"count": records, "items": catalog},
+    }
+
+
+def measure(engine: Engine, page: dict) -> tuple[float, int]:
+    start = time.perf_counter()
+    engine.expand(page)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    engine.expand(page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000)
+    args = parser.parse_args()
+
+    page = make_page(args.records)
+    for label, engine_class in (("rebuilding", RebuildingEngine), ("copy-on-write", Engine)):
+        engine = engine_class()
+        for name, resolver in _BUILTINS.items():
+            engine.register(name, resolver)
+        seconds, peak = measure(engine, page)
+        print(f"  {label:<14} {seconds * 1000:8.1f} ms   peak traced memory {peak / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Time ``sort:git…`` keys: one ``git log`` per item versus one history index.
+
+Creates a temporary repository with *posts* files added over *commits*
+commits, then sorts the globbed collection by ``git`` and ``git:created``
+(from an installed checkout)::
+
+    python benchmarks/bench_git_sort.py --posts 500 --commits 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import tempfile
+import time
+
+from webifier.interface.resolvers import builtins as resolver_builtins
+from webifier.interface.resolvers import expand
+from webifier.interface.resolvers.utils import cache_git_metadata
+
+
+def per_item_git_timestamp(item, key, index=None):
+    """The key before the index: a ``git log`` subprocess for every item."""
+    if not isinstance(item, dict) or "_source" not in item:
+        return 0
+    fmt = "--format=%at" if key in ("git:authored", "git:created") else "--format=%ct"
+    cmd = ["git", "log", "-1", fmt, "--", item["_source"]]
+    if key == "git:created":
+        cmd = ["git", "log", "--follow", "--diff-filter=A", fmt, "--", item["_source"]]
+    try:
+        r = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+        return float(r.stdout.strip() or 0)
+    except Exception:
+        return 0
+
+
+def make_repository(directory: str, posts: int, commits: int) -> None:
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Bench",
+        "GIT_AUTHOR_EMAIL": "bench@example.com",
+        "GIT_COMMITTER_NAME": "Bench",
+        "GIT_COMMITTER_EMAIL": "bench@example.com",
+    }
+    subprocess.run(["git", "init", "-q"], cwd=directory, check=True)
+    os.makedirs(os.path.join(directory, "posts"))
+    per_commit = max(1, posts // commits)
+    for start in range(0, posts, per_commit):
+        for i in range(start, min(posts, start + per_commit)):
+            with open(os.path.join(directory, "posts", f"{i:05}.yml"), "w") as f:
+                f.write(f"title: Post {i}\n")
+        when = f"{1_000_000_000 + start} +0000"
+        subprocess.run(["git", "add", "-A"], cwd=directory, check=True)
+        subprocess.run(
+            ["git", "commit", "-qm", f"posts from {start}"],
+            cwd=directory,
+            check=True,
+            env={**env, "GIT_AUTHOR_DATE": when, "GIT_COMMITTER_DATE": when},
+        )
+
+
+def time_sorts() -> tuple[float, list]:
+    start = time.perf_counter()
+    with cache_git_metadata():
+        result = [
+            expand({"posts": f"${{glob:posts/*.yml | sort:{key} | limit:3 | map:title}}"})["posts"]
+            for key in ("-git", "git:created")
+        ]
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=500)
+    parser.add_argument("--commits", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        make_repository(directory, args.posts, args.commits)
+        os.chdir(directory)
+
+        indexed = resolver_builtins.git_timestamp
+        resolver_builtins.git_timestamp = per_item_git_timestamp
+        seconds, expected = time_sorts()
+        print(f"  git log per item  {seconds * 1000:8.0f} ms")
+        resolver_builtins.git_timestamp = indexed
+        seconds, result = time_sorts()
+        assert result == expected, (result, expected)
+        print(f"  history index     {seconds * 1000:8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Time ``${glob:…}`` on a large post collection used by several pages.
+
+Writes *posts* YAML files to a temporary directory and expands *pages*
+pages that each glob the whole collection, within one build's
+``cache_yaml`` scope.  Compares the sequential, uncached loading the
+resolver used to do with pooled reads alone and with the per-build
+collection cache (from an installed checkout)::
+
+    python benchmarks/bench_glob.py --posts 12000 --pages 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob as _glob
+import os
+import tempfile
+import time
+
+from webifier.interface import io
+from webifier.interface.io import cache_yaml, note_dependency, safe_load_yaml
+from webifier.interface.resolvers import _BUILTINS
+from webifier.interface.resolvers.engine import Engine
+
+
+def sequential_glob(arg, ctx):
+    """The resolver before collection loading: one file after another, every time."""
+    results = []
+    note_dependency(f"glob:{arg}", "glob")
+    for path in sorted(_glob.glob(arg, recursive=True)):
+        note_dependency(path, "glob")
+        with open(path) as f:
+            item = safe_load_yaml(f) or {}
+        item["_source"] = path
+        results.append(item)
+    return results
+
+
+def write_posts(directory: str, posts: int) -> None:
+    os.makedirs(os.path.join(directory, "posts"))
+    for i in range(posts):
+        with open(os.path.join(directory, "posts", f"{i:05}.yml"), "w") as f:
+            f.write(
+                f"title: Post {i}\ndate: 2024-01-{i % 28 + 1:02}\ntags: [python, blog, tag-{i % 11}]\n"
+                f"summary: >\n  A short summary of post {i}, long enough to look like a real one.\n"
+            )
+
+
+def run(engine: Engine, pages: int) -> float:
+    start = time.perf_counter()
+    with cache_yaml():
+        for page in range(pages):
+            engine.expand({"title": f"Page {page}", "posts": "${glob:posts/*.yml | sort:-date | limit:20}"})
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=12000)
+    parser.add_argument("--pages", type=int, default=6)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_posts(directory, args.posts)
+        os.chdir(directory)
+
+        sequential, current = Engine(), Engine()
+        for name, resolver in _BUILTINS.items():
+            sequential.register(name, resolver)
+            current.register(name, resolver)
+        sequential.register("glob", sequential_glob)
+
+        print(f"  sequential, uncached    {run(sequential, args.pages) * 1000:8.0f} ms")
+        load_files = io.YamlCache.load_files
+        io.YamlCache.load_files = lambda self, paths, parse: io._load_files(paths, parse)
+        print(f"  pooled reads, uncached  {run(current, args.pages) * 1000:8.0f} ms")
+        io.YamlCache.load_files = load_files
+        print(f"  pooled reads, cached    {run(current, args.pages) * 1000:8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Time math/code protection in ``build_markdown`` on ordinary and adversarial input.
+
+Compares the single-pass scanner (``protect_markup`` + ``restore_math``) with
+the regex passes it replaced, on documents doubling in size (from an installed
+checkout)::
+
+    python benchmarks/bench_markdown_math.py --size 2000
+
+The scanner's time grows linearly with the input on every corpus; the regex
+passes grow quadratically on unclosed delimiters and on math-heavy notes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+
+from webifier.core.markdown import protect_markup, restore_math
+
+# ── Reference: the regex passes ──────────────────────────────────────────────
+
+MATH_PATTERNS = (
+    re.compile(r"(?<!\\)\$\$(.+?)(?<!\\)\$\$", re.DOTALL),
+    re.compile(r"\\\[(.+?)\\\]", re.DOTALL),
+    re.compile(r"\\\((.+?)\\\)", re.DOTALL),
+    re.compile(r"(?<!\\)\$\s*\\begin\{([a-zA-Z*]+)\}.*?\\end\{\1\}\s*(?<!\\)\$", re.DOTALL),
+    re.compile(r"\\begin\{([a-zA-Z*]+)\}.*?\\end\{\1\}", re.DOTALL),
+    re.compile(r"(?<!\\)(?<!\$)\$(?![\s$]|@@WEBIFIER_MATH_)(?:\\.|[^\n\\$])+?(?<![\s\\])\$(?!\$)"),
+)
+FENCED_CODE_PATTERN = re.compile(r"(^|\n)(`{3,}|~{3,})[^\n]*\n.*?\n\2[ \t]*(?=\n|$)", re.DOTALL)
+INLINE_CODE_PATTERN = re.compile(r"(`+)(.+?)(?<!`)\1", re.DOTALL)
+
+
+def regex_protect(raw: str) -> str:
+    code_spans: list[str] = []
+    math_spans: list[str] = []
+
+    def stash_code(match: re.Match[str]) -> str:
+        code_spans.append(match.group(0))
+        return f"@@WEBIFIER_CODE_{len(code_spans) - 1}@@"
+
+    def stash_math(match: re.Match[str]) -> str:
+        math_spans.append(match.group(0))
+        return f"@@WEBIFIER_MATH_{len(math_spans) - 1}@@"
+
+    protected = FENCED_CODE_PATTERN.sub(stash_code, raw)
+    protected = INLINE_CODE_PATTERN.sub(stash_code, protected)
+    for pattern in MATH_PATTERNS:
+        protected = pattern.sub(stash_math, protected)
+    for index, code in enumerate(code_spans):
+        protected = protected.replace(f"@@WEBIFIER_CODE_{index}@@", code)
+    for index, math_text in enumerate(math_spans):
+        placeholder = f"@@WEBIFIER_MATH_{index}@@"
+        protected = protected.replace(f"<p>{placeholder}</p>", math_text)
+        protected = protected.replace(placeholder, math_text)
+    return protected
+
+
+def scanner_protect(raw: str) -> str:
+    protected, math = protect_markup(raw)
+    return restore_math(protected, math)
+
+
+# ── Corpora ──────────────────────────────────────────────────────────────────
+
+CORPORA = {
+    "lecture notes": lambda n: (
+        (
+            "The bound $h(n) \\leq c(n, a, n') + h(n')$ holds for `every` node.\n\n"
+            "$$\n\\sum_{i=1}^{n} x_i \\geq 0\n$$\n\n"
+            "```python\nprice = '$5'\n```\n\n"
+        )
+        * n
+    ),
+    "unclosed \\[": lambda n: "\\[ x " * n,
+    "unclosed \\begin": lambda n: "\\begin{align} a " * n,
+    "unbalanced $": lambda n: "cost $5 and $ 6, " * n,
+    "unclosed fences": lambda n: "```\ncode\n" * n,
+}
+
+
+def best_of(function, text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1000, help="repetitions of each corpus snippet")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"best of {args.repeat}; time at size n and 2n")
+    for name, corpus in CORPORA.items():
+        small, large = corpus(args.size), corpus(2 * args.size)
+        for label, function in (("regex passes", regex_protect), ("scanner", scanner_protect)):
+            first = best_of(function, small, args.repeat)
+            second = best_of(function, large, args.repeat)
+            print(f"  {name:<18} {label:<13} {first * 1000:9.1f} ms {second * 1000:9.1f} ms  ({second / first:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
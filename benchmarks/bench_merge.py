@@ -0,0 +1,90 @@
+"""Compare config merging against the recursive deep-copying merge it replaced.
+
+Merges realistic extension config trees: the defaults and overlays of a
+builder configured with the first-party extensions, laid over a nested site
+config with navigation, per-section settings and a large ``data`` block::
+
+    python benchmarks/bench_merge.py --sections 50 --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import time
+from typing import Any
+
+from webifier.core.builder import Builder
+from webifier.core.config import deep_merge, freeze, merge
+
+
+def recursive_deep_merge(base: Any, override: Any) -> Any:
+    """The previous merge: a deep copy of the base at every level."""
+    if isinstance(base, dict) and isinstance(override, dict):
+        result = copy.deepcopy(base)
+        for key, value in override.items():
+            result[key] = recursive_deep_merge(result.get(key), value)
+        return result
+    if override is None:
+        return copy.deepcopy(base)
+    return copy.deepcopy(override)
+
+
+def extension_defaults() -> dict:
+    builder = Builder(template_cache=False)
+    builder.configure_extensions(
+        {"webifier": {"extensions": {"site": {"uses": "webifier.standard"}, "md": {"uses": "webifier.markdown"}}}}
+    )
+    return builder.extensions.config_defaults
+
+
+def site_config(sections: int) -> dict:
+    return {
+        "theme": {"colors": {"accent": "#0a7", "background": "#fff"}, "fonts": ["Inter", "serif"]},
+        "nav": [{"text": f"Section {i}", "href": f"/s{i}/", "icon": "book"} for i in range(sections)],
+        "sections": {
+            f"s{i}": {"toc": i % 2 == 0, "search": {"content": True, "weight": i}, "tags": ["a", "b", f"t{i}"]}
+            for i in range(sections)
+        },
+        "data": {
+            "authors": [{"name": f"Author {i}", "links": {"web": f"https://example.com/{i}"}} for i in range(200)],
+        },
+    }
+
+
+def page_override(sections: int) -> dict:
+    return {
+        "theme": {"colors": {"accent": "#c30"}},
+        "sections": {f"s{i}": {"toc": False} for i in range(0, sections, 5)},
+    }
+
+
+def timed(function, base: Any, override: Any, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function(base, override)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    base = deep_merge(extension_defaults(), site_config(args.sections))
+    override = page_override(args.sections)
+    assert recursive_deep_merge(base, override) == deep_merge(base, override) == merge(freeze(base), override)
+
+    frozen = freeze(base)
+    for label, function, tree in (
+        ("recursive deep copy", recursive_deep_merge, base),
+        ("deep_merge", deep_merge, base),
+        ("merge (frozen base)", merge, frozen),
+    ):
+        seconds = timed(function, tree, override, args.repeat)
+        print(f"  {label:<20} {seconds * 1e6:10.1f} us per merge")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Time collection pipelines on large lists, fused and step by step.
+
+Runs typical transform chains over *items* records with the engine's
+step fusion (heap top-k for ``sort | limit``, one slice for
+``offset | limit``, one pass for ``filter``/``exclude`` runs) and with
+every step applied on its own; ``unique`` is compared with the
+quadratic version it replaced (from an installed checkout)::
+
+    python benchmarks/bench_pipeline.py --items 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from webifier.interface.resolvers import _BUILTINS
+from webifier.interface.resolvers.base import Context
+from webifier.interface.resolvers.engine import Engine
+from webifier.interface.resolvers.expressions import parse_pipeline
+
+
+class StepwiseEngine(Engine):
+    """Every transform materializes its own list, as before fusion."""
+
+    def _apply_transforms(self, value, chain, ctx):
+        for resolver, arg in chain:
+            value = resolver(value, arg, ctx)
+        return value
+
+
+def quadratic_unique(data, arg, ctx):
+    """``unique`` without a key before canonical hashing: a list scan per item."""
+    if not isinstance(data, list):
+        return data
+    result = []
+    for item in data:
+        if item not in result:
+            result.append(item)
+    return result
+
+
+PIPELINES = {
+    "sort | limit": "ref:items | sort:-date | limit:5",
+    "offset | limit": "ref:items | offset:50000 | limit:20",
+    "filter chain": "ref:items | filter:published | exclude:tag=t3 | filter:lang=en | exclude:draft",
+}
+
+
+def make_items(count: int) -> list[dict]:
+    return [
+        {
+            "title": f"Item {i}",
+            "date": f"2024-{i % 12 + 1:02}-{i % 28 + 1:02}T{i % 24:02}:{i % 60:02}",
+            "tag": f"t{i % 7}",
+            "lang": "en" if i % 3 else "de",
+            "published": i % 4 != 0,
+            "draft": i % 10 == 0,
+        }
+        for i in range(count)
+    ]
+
+
+def make_engine(engine_class: type[Engine]) -> Engine:
+    engine = engine_class()
+    for name, resolver in _BUILTINS.items():
+        engine.register(name, resolver)
+    return engine
+
+
+def timed(engine: Engine, expr: str, ctx: Context) -> tuple[float, object]:
+    pipeline = parse_pipeline(expr)
+    start = time.perf_counter()
+    result = engine._pipeline(pipeline, ctx)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--unique-items", type=int, default=10000, help="the quadratic baseline is slow")
+    args = parser.parse_args()
+
+    doc = {"items": make_items(args.items)}
+    ctx = Context(doc, doc)
+    stepwise, fused = make_engine(StepwiseEngine), make_engine(Engine)
+    for label, expr in PIPELINES.items():
+        before, expected = timed(stepwise, expr, ctx)
+        after, result = timed(fused, expr, ctx)
+        assert result == expected
+        print(f"  {label:<16} step by step {before * 1000:8.1f} ms   fused {after * 1000:8.1f} ms")
+
+    # Records repeat every 1000 items, so half the list are duplicates.
+    records = make_items(1000)
+    doc = {"items": [dict(records[i % 1000]) for i in range(args.unique_items)]}
+    ctx = Context(doc, doc)
+    stepwise.register("unique", quadratic_unique)
+    before, expected = timed(stepwise, "ref:items | unique", ctx)
+    after, result = timed(fused, "ref:items | unique", ctx)
+    assert result == expected
+    print(
+        f"  {'unique':<16} list scan    {before * 1000:8.1f} ms   hashed {after * 1000:7.1f} ms"
+        f"   ({args.unique_items} items)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from webifier.core.builder import Builder
+from webifier.core.config import FrozenDict, FrozenList, deep_merge, freeze, merge
+
+
+def test_frozen_configs_are_read_only_hashable_and_shared():
+    config = freeze({"search": {"content": True}, "tags": ["a", "b"]})
+
+    assert isinstance(config, dict) and isinstance(config["tags"], list)
+    assert isinstance(config["tags"], FrozenList)
+    with pytest.raises(TypeError):
+        config["search"]["content"] = False
+    with pytest.raises(TypeError):
+        config["tags"].append("c")
+    assert hash(config) == hash(freeze({"tags": ["a", "b"], "search": {"content": True}}))
+    assert copy.deepcopy(config) is config
+    assert pickle.loads(pickle.dumps(config)) == config
+    assert json.loads(json.dumps(config)) == {"search": {"content": True}, "tags": ["a", "b"]}
+    assert dict(config) == config and type(dict(config)) is dict
+
+    merged = merge(config, {"search": {"links": False}, "theme": None})
+    assert merged == {"search": {"content": True, "links": False}, "tags": ["a", "b"], "theme": None}
+    assert merged["tags"] is config["tags"]
+    assert isinstance(merged["search"], FrozenDict)
+
+
+def test_page_configs_are_memoized_per_local_config():
+    builder = Builder()
+    builder.config = {"content_pages": {"toc": True}, "search": {"content": True}}
+
+    base = builder._page_config({"title": "No local config"})
+    assert isinstance(base, FrozenDict) and base == builder.config
+    first = builder._page_config({"config": {"content_pages": {"toc": False}}})
+    second = builder._page_config({"title": "Other", "config": {"content_pages": {"toc": False}}})
+    assert first is second
+    assert first == {"content_pages": {"toc": False}, "search": {"content": True}}
+    assert first["search"] is base["search"]
+
+    # Callers of page_config() get their own mutable copy.
+    config = builder.page_config({"config": {"content_pages": {"toc": False}}})
+    config["content_pages"].update(cleanup=True)
+    assert builder._page_config({"config": {"content_pages": {"toc": False}}}) == first
+
+    # Editing or replacing the global config starts a new memo.
+    builder.config["content_pages"]["cleanup"] = True
+    assert builder.page_config({"config": {"content_pages": {"toc": False}}}) == {
+        "content_pages": {"toc": False, "cleanup": True},
+        "search": {"content": True},
+    }
+    builder.config = {"search": {"content": False}}
+    assert builder.page_config({"config": {"content_pages": {"toc": False}}}) == {
+        "content_pages": {"toc": False},
+        "search": {"content": False},
+    }
+
+
+def test_deep_merge_returns_an_independent_mutable_tree():
+    defaults = {"theme": {"colors": {"accent": "blue"}, "fonts": ["serif"]}, "search": {"content": True}}
+    overrides = {"theme": {"colors": {"text": "black"}}, "nav": [{"text": "Home"}]}
+    frozen = freeze({"links": ["a"]})
+
+    merged = deep_merge(defaults, {**overrides, "extra": frozen})
+    assert merged == {
+        "theme": {"colors": {"accent": "blue", "text": "black"}, "fonts": ["serif"]},
+        "search": {"content": True},
+        "nav": [{"text": "Home"}],
+        "extra": {"links": ["a"]},
+    }
+    assert list(merged) == ["theme", "search", "nav", "extra"]
+    assert type(merged["extra"]) is dict and type(merged["extra"]["links"]) is list
+
+    merged["theme"]["fonts"].append("mono")
+    merged["search"]["content"] = False
+    merged["nav"][0]["text"] = "Start"
+    merged["extra"]["links"].append("b")
+    assert defaults["theme"]["fonts"] == ["serif"] and defaults["search"] == {"content": True}
+    assert overrides["nav"] == [{"text": "Home"}]
+    assert deep_merge({"a": 1}, None) == {"a": 1}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -466,6 +467,72 @@ def test_extension_provider_must_be_object_or_class(monkeypatch):
         )
 
 
+def test_discovery_is_cached_and_providers_load_on_use(tmp_path, monkeypatch):
+    from importlib import metadata
+
+    from webifier.core import discovery
+
+    group = discovery.ENTRY_POINT_GROUP
+    entry_points = metadata.EntryPoints(
+        [
+            metadata.EntryPoint("webifier.standard", "webifier_extensions.standard.extension:StandardExtension", group),
+            metadata.EntryPoint("test.broken", "webifier_no_such_module:Extension", group),
+        ]
+    )
+    monkeypatch.setattr(metadata, "entry_points", lambda: entry_points)
+    cached = discovery.discover_entry_points(str(tmp_path))
+    assert cached["test.broken"].value == "webifier_no_such_module:Extension"
+
+    # A second run in the same environment reads the cache instead of the metadata.
+    monkeypatch.setattr(metadata, "entry_points", lambda: pytest.fail("metadata scanned again"))
+    builder = Builder(cache_dir=str(tmp_path), extension_cache=True)
+    assert set(builder.extensions.discover()) == {"webifier.standard", "test.broken"}
+
+    # The broken provider is never imported because no instance uses it.
+    builder.configure_extensions({"webifier": {"extensions": {"site": {"uses": "webifier.standard"}}}})
+    manifest = builder.extensions._manifest("webifier.standard")
+    page = {"webifier": {"extensions": {"site": {"uses": "webifier.standard", "toc": False}}}}
+    builder.extensions.page_config_overlays(page)
+    assert builder.extensions._manifest("webifier.standard") is manifest
+
+
+def test_discovery_picks_up_new_entry_points_of_installed_distributions(tmp_path, monkeypatch):
+    from webifier.core import discovery
+    from webifier.interface.cli import WebifierArgs, make_builder
+
+    site = tmp_path / "site"
+    dist = site / "webifier_demo-1.0.dist-info"
+    dist.mkdir(parents=True)
+    (dist / "METADATA").write_text("Metadata-Version: 2.1\nName: webifier-demo\nVersion: 1.0\n", encoding="utf-8")
+    entry_points = dist / "entry_points.txt"
+    monkeypatch.syspath_prepend(str(site))
+    cache_dir = str(tmp_path / "cache")
+
+    def install(*names):
+        # Rewritten in place, as reinstalling an editable package does.
+        lines = "".join(f"{name} = webifier_demo:Extension\n" for name in names)
+        entry_points.write_text(f"[webifier.extensions]\n{lines}", encoding="utf-8")
+
+    install("demo.one")
+    assert "demo.one" in discovery.discover_entry_points(cache_dir)
+
+    install("demo.one", "demo.two")
+    stat = os.stat(entry_points)
+    os.utime(entry_points, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert "demo.two" in discovery.discover_entry_points(cache_dir)
+
+    # A change the fingerprint cannot see is picked up by refreshing the cache.
+    stat = os.stat(entry_points)
+    install("demo.one", "demo.two", "demo.three")
+    os.utime(entry_points, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert "demo.three" not in discovery.discover_entry_points(cache_dir)
+    assert "demo.three" in discovery.discover_entry_points(cache_dir, refresh=True)
+    assert "demo.three" in discovery.discover_entry_points(cache_dir)
+
+    builder = make_builder(WebifierArgs(cache_dir=cache_dir, refresh_extensions=True))
+    assert builder.extension_cache and builder.refresh_extensions
+
+
 def test_head_hook_can_inject_from_page_content(tmp_path, monkeypatch):
     from webifier_extensions.registry import EXTENSIONS
 
@@ -796,4 +863,95 @@ def test_content_page_cleanup_demotes_slide_headings_and_excludes_math_headings(
     assert "<h2" in rendered
     assert 'class="wf-math-display"' in rendered
     assert "max_aQ" in rendered
-    assert "href=\"#$-" not in rendered
+    assert 'href="#$-' not in rendered
+
+
+def test_hooks_are_called_through_adapters_built_at_registration(monkeypatch):
+    import inspect
+
+    seen = []
+
+    def plain(builder, *, page, instance_name):
+        seen.append(("plain", page["title"], instance_name))
+        return "<plain>"
+
+    def contextual(builder, **kwargs):
+        seen.append(("contextual", kwargs["hook_context"].area, kwargs["instance_config"]["tone"]))
+        return "<contextual>"
+
+    class HookExtension(Extension):
+        id = "test.hooks"
+        hooks = {"head": [plain, contextual]}
+        default_config = {"tone": "quiet"}
+
+    monkeypatch.setattr(ExtensionManager, "discover", lambda self: {"test.hooks": HookExtension})
+    builder = Builder(template_cache=False)
+    builder.configure_extensions({"webifier": {"extensions": {"hooks": {"uses": "test.hooks"}}}})
+
+    signatures = []
+    monkeypatch.setattr(inspect, "signature", lambda fn: signatures.append(fn))
+    page = {"title": "Home"}
+    assert builder.render_extension_area("head", page=page) == "<plain>\n<contextual>"
+    assert builder.render_extension_area("head", page=page) == "<plain>\n<contextual>"
+    assert signatures == []
+    assert seen[:2] == [("plain", "Home", "hooks"), ("contextual", "head", "quiet")]
+
+
+def test_extension_callbacks_receive_mutable_configs(tmp_path, monkeypatch):
+    from webifier_extensions.registry import EXTENSIONS
+
+    seen = []
+
+    def head(builder, *, config, instance_config, **_kwargs):
+        config.setdefault("seen_by", []).append("head")
+        instance_config["tone"] = "loud"
+        seen.append(("head", instance_config["tone"]))
+        return ""
+
+    class NotesExtension(Extension):
+        id = "test.notes"
+        default_config = {"tone": "quiet"}
+
+        def register(self, ctx):
+            ctx.add_hook("head", head)
+            ctx.consume_page_key("notes", self.consume_notes)
+
+        def consume_notes(self, builder, *, value, config, instance_config, **_kwargs):
+            config["search"]["content"] = "edited"
+            instance_config["tone"] = "loud"
+            builder.config["touched"] = True
+            seen.append(("notes", builder.page_config({})["search"]["content"]))
+            return value
+
+    available = dict(EXTENSIONS)
+    available["test.notes"] = NotesExtension
+    monkeypatch.setattr(ExtensionManager, "discover", lambda self: available)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "index.yml").write_text(
+        """
+title: Notes
+config:
+  webifier:
+    extensions:
+      site:
+        uses: webifier.standard
+      markdown:
+        uses: webifier.markdown
+      notes:
+        uses: test.notes
+nav: false
+notes: remember
+intro: Visible content.
+""",
+        encoding="utf-8",
+    )
+
+    builder = Builder(output_dir="out", templates_dir=".")
+    builder.build()
+
+    # Edits stay with the callback's copy; builder.config stays a plain, editable dict.
+    assert seen[0] == ("notes", False)
+    assert ("head", "loud") in seen
+    assert builder.config["touched"] is True and builder.config["search"]["content"] is False
+    assert "seen_by" not in builder.config
+    assert builder.extensions.hooks["head"][-1].instance_config["tone"] == "quiet"
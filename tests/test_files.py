@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from webifier.interface.cli import WebifierArgs
+from webifier.interface.io import FileManager
+
+
+def _source(tmp_path, name="logo.png", content=b"png"):
+    path = tmp_path / "src" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+def test_copy_file_skips_unchanged_destinations(tmp_path):
+    src = _source(tmp_path)
+    files = FileManager(output_dir=str(tmp_path / "out"))
+
+    url = files.copy_file("logo.png", "logo.png", src_dir=str(src.parent))
+    dest = tmp_path / "out" / "assets" / "logo.png"
+    assert url == "/assets/logo.png"
+    assert dest.read_bytes() == b"png"
+
+    # Repeated references within a build and unchanged files across builds are not copied again.
+    files.copy_file("logo.png", "logo.png", src_dir=str(src.parent))
+    files.reset()
+    files.copy_file("logo.png", "logo.png", src_dir=str(src.parent))
+    assert files.skipped == 1
+    assert files.install(str(src), str(dest)) is False
+
+    # Same size and content but a different mtime still counts as up to date.
+    os.utime(dest, ns=(0, 0))
+    files.reset()
+    assert files.install(str(src), str(dest)) is False
+
+    src.write_bytes(b"new logo")
+    files.reset()
+    assert files.install(str(src), str(dest)) is True
+    assert dest.read_bytes() == b"new logo"
+
+
+def test_hardlink_mode_never_writes_through_to_sources(tmp_path):
+    src = _source(tmp_path)
+    files = FileManager(output_dir=str(tmp_path / "out"), copy_mode="hardlink")
+    files.copy_file("logo.png", "logo.png", src_dir=str(src.parent))
+    dest = tmp_path / "out" / "assets" / "logo.png"
+    assert os.path.samefile(src, dest)
+
+    # Replacing the source file breaks the link; the next install relinks
+    # without modifying the new source through the old inode.
+    src.unlink()
+    src.write_bytes(b"changed")
+    files.reset()
+    assert files.install(str(src), str(dest)) is True
+    assert os.path.samefile(src, dest)
+    assert src.read_bytes() == b"changed"
+
+
+def test_merge_dirs_and_reflink_mode(tmp_path):
+    src = _source(tmp_path, "css/site.css", b"body {}")
+    files = FileManager(output_dir=str(tmp_path / "out"), copy_mode="reflink")
+    files.merge_dirs(str(tmp_path / "src"), str(tmp_path / "out"), overwrite=True)
+    dest = tmp_path / "out" / "css" / "site.css"
+    assert dest.read_bytes() == b"body {}"
+    assert os.stat(dest).st_mtime_ns == os.stat(src).st_mtime_ns
+
+    files.reset()
+    files.merge_dirs(str(tmp_path / "src"), str(tmp_path / "out"), overwrite=True)
+    assert files.skipped == 1
+
+    with pytest.raises(ValueError, match="copy mode"):
+        FileManager(copy_mode="symlink")
+    with pytest.raises(SystemExit):
+        WebifierArgs.make_parser().parse_args(["--copy-mode", "symlink"])
+
+
+def test_last_source_for_a_destination_wins(tmp_path):
+    first = _source(tmp_path, "a/logo.png", b"first")
+    last = _source(tmp_path, "b/logo.png", b"last!")
+    files = FileManager(output_dir=str(tmp_path / "out"))
+    files.copy_file("logo.png", "logo.png", src_dir=str(first.parent))
+    files.copy_file("logo.png", "logo.png", src_dir=str(last.parent))
+    assert (tmp_path / "out" / "assets" / "logo.png").read_bytes() == b"last!"
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+
+from webifier.core.builder import Builder
+from webifier.core.graph import DependencyGraph
+from webifier.interface.cli import main
+
+
+def _write_site(tmp_path):
+    (tmp_path / "nav.yml").write_text("content:\n  - text: Home\n    link: /\n", encoding="utf-8")
+    (tmp_path / "posts").mkdir()
+    (tmp_path / "posts" / "one.yml").write_text("title: One\n", encoding="utf-8")
+    (tmp_path / "logo.png").write_bytes(b"png")
+    (tmp_path / "page.md").write_text("# Page\n\n![Logo](logo.png)", encoding="utf-8")
+    (tmp_path / "sub.yml").write_text(
+        "title: Sub\npatch@nav: nav.yml\nposts:\n  content: ${glob:posts/*.yml | count}\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "index.yml").write_text(
+        """
+title: Test Site
+patch@nav: nav.yml
+config:
+  webifier:
+    extensions:
+      site:
+        uses: webifier.standard
+      markdown:
+        uses: webifier.markdown
+docs:
+  label: Docs
+  content:
+    - text: Page
+      src: page.md
+    - text: Sub
+      src: sub.yml
+""",
+        encoding="utf-8",
+    )
+
+
+def test_build_records_page_dependencies(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_site(tmp_path)
+
+    builder = Builder(output_dir="out")
+    builder.build()
+    graph = builder.graph
+
+    assert graph.pages["index.html"]["nav.yml"] == "patch"
+    assert graph.pages["index.html"]["page.md"] == "link"
+    assert graph.pages["index.html"]["sub.yml"] == "index"
+    assert graph.pages["sub.html"]["glob:posts/*.yml"] == "glob"
+    assert graph.pages["page.html"]["logo.png"] == "asset"
+    assert any(kind == "template" for kind in graph.pages["page.html"].values())
+
+    assert graph.affected_pages("nav.yml") == ["index.html", "sub.html"]
+    assert graph.affected_pages("./posts/one.yml") == ["sub.html"]
+    assert graph.affected_pages("page.md") == ["page.html"]
+    assert ("nav.yml", 2) in graph.fan_in()
+
+    restored = DependencyGraph.from_json(json.loads(graph.dumps()))
+    assert restored.pages == graph.pages
+    assert '"index.html" -> "nav.yml" [label="patch"];' in graph.to_dot()
+
+
+def test_graph_command_lists_affected_pages(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    _write_site(tmp_path)
+
+    main(["graph", "--output", "out", "--affected", "nav.yml"])
+
+    assert capsys.readouterr().out.split() == ["index.html", "sub.html"]
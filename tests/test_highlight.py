@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from markdown.extensions import codehilite
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import PythonLexer
+
+from webifier.core.highlight import HighlightCache, using_highlight_cache
+from webifier.core.markdown import build_markdown
+
+
+def test_code_highlighting_is_served_from_the_cache_directory(tmp_path):
+    builder = SimpleNamespace(assets_dir="assets", markdown_extensions=("fenced_code", "codehilite"))
+    raw = "```python\nvalue = 1\n```\n\n    :::javascript\n    let x = 2;\n"
+
+    uncached = build_markdown(raw, builder, process_html=False)
+    with using_highlight_cache(HighlightCache(str(tmp_path / "highlight"))) as cache:
+        first = build_markdown(raw, builder, process_html=False)
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    # A later build (new cache object, same directory) highlights nothing.
+    with using_highlight_cache(HighlightCache(str(tmp_path / "highlight"))) as cache:
+        second = build_markdown(raw, builder, process_html=False)
+        assert (cache.hits, cache.misses) == (2, 0)
+
+    assert first == second == uncached
+    assert '<span class="n">value</span>' in first
+    assert len(list((tmp_path / "highlight").rglob("*.html"))) == 2
+
+
+def test_highlight_cache_is_only_installed_inside_the_block(tmp_path):
+    original = codehilite.highlight
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    # A cache directory that cannot be created must not fail highlighting.
+    with using_highlight_cache(HighlightCache(str(blocker / "highlight"))) as cache:
+        assert codehilite.highlight is not original
+        assert "value" in cache.highlight("value = 1\n", PythonLexer(), HtmlFormatter())
+    assert codehilite.highlight is original
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from webifier.core.html import process_html
+from webifier.interface.io import FileManager
+
+
+def _builder(tmp_path):
+    links = []
+
+    def process_content_link(link, ctx, kind):
+        links.append((kind, dict(link)))
+        return {**link, "href": f"/{link['src'].removesuffix('.md')}"}
+
+    builder = SimpleNamespace(
+        assets_dir="assets",
+        files=FileManager(output_dir=str(tmp_path / "out")),
+        _content_renderer_key=lambda src, preferred=None: None,
+        _process_content_link=process_content_link,
+    )
+    return builder, links
+
+
+def test_fragments_without_links_or_media_are_returned_verbatim(tmp_path):
+    builder, _ = _builder(tmp_path)
+    raw = "<p class='lead'>a &amp; b<br>\n<abbr title=x>HTML</abbr></p>"
+    assert process_html(builder, raw) is raw
+
+
+def test_only_rewritten_tags_change(tmp_path):
+    builder, links = _builder(tmp_path)
+    (tmp_path / "logo.png").write_bytes(b"png")
+    raw = (
+        "<p class='lead'>Tom &amp; Jerry<br>\n"
+        "<img alt='Logo' src=\"logo.png\" />\n"
+        '<a href="md=docs/intro.md" description="Start here">Intro &lt;1&gt;</a>\n'
+        '<a href="https://example.com">plain</a></p>\n'
+        "<script>if (a<b) { x = '<a href=\"md=no.md\">' }</script>"
+    )
+
+    html = process_html(builder, raw, assets_src_dir=str(tmp_path))
+
+    assert html.startswith("<p class='lead'>Tom &amp; Jerry<br>\n")
+    assert '<img alt="Logo" src="/assets/logo.png"/>' in html
+    assert (
+        '<a href="/docs/intro" description="Start here" data-bs-toggle="tooltip" '
+        'data-bs-html="true" title="Start here">Intro &lt;1&gt;</a>'
+    ) in html
+    assert '<a href="https://example.com">plain</a></p>' in html
+    assert html.endswith("<script>if (a<b) { x = '<a href=\"md=no.md\">' }</script>")
+    assert (tmp_path / "out" / "assets" / "logo.png").read_bytes() == b"png"
+    assert links == [
+        ("md", {"text": "Intro <1>", "description": "Start here", "src": "docs/intro.md"}),
+    ]
+
+
+def test_anchor_icons_and_math_images(tmp_path):
+    builder, links = _builder(tmp_path)
+    raw = (
+        '<a href="md=page.md" icon="fa fa-book"><b>Read</b> more</a> and '
+        '<img src="https://render.githubusercontent.com/render/math?math=a%3Cb">'
+    )
+
+    html = process_html(builder, raw)
+
+    assert html == '<a href="/page"><i aria-hidden="true" class="fa fa-book"></i> Read more</a> and \\(a&lt;b\\)'
+    assert links[0][1]["text"] == "Read more"
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+
+from webifier.core.builder import Builder
+from webifier.core.manifest import BuildManifest
+
+SITE = """
+title: Test Site
+config:
+  webifier:
+    extensions:
+      site:
+        uses: webifier.standard
+      markdown:
+        uses: webifier.markdown
+      search:
+        uses: webifier.search
+nav: false
+docs:
+  label: Docs
+  content:
+    - text: One
+      src: one.md
+    - text: Two
+      src: two.md
+    - text: Sub
+      src: sub.yml
+"""
+
+
+def _write_site(tmp_path):
+    (tmp_path / "one.md").write_text("# One\n\n[Child](md=child.md)", encoding="utf-8")
+    (tmp_path / "child.md").write_text("# Child", encoding="utf-8")
+    (tmp_path / "two.md").write_text("# Two", encoding="utf-8")
+    (tmp_path / "sub.yml").write_text("title: Sub\nnav: false\nintro:\n  content: Sub page.\n", encoding="utf-8")
+    (tmp_path / "index.yml").write_text(SITE, encoding="utf-8")
+
+
+def test_incremental_build_skips_unchanged_pages(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    _write_site(tmp_path)
+
+    Builder(output_dir="out", incremental=True).build()
+    manifest = json.loads((tmp_path / "out" / BuildManifest.FILENAME).read_text(encoding="utf-8"))
+    assert {"index.html", "one.html", "two.html", "child.html", "sub.html"} <= set(manifest["pages"])
+    assert "child.md" in manifest["pages"]["child.html"]["inputs"]
+    search_before = json.loads((tmp_path / "out" / "search.json").read_text(encoding="utf-8"))
+    capsys.readouterr()
+
+    (tmp_path / "two.md").write_text("# Two\n\nEdited.", encoding="utf-8")
+    Builder(output_dir="out", incremental=True).build()
+    output = capsys.readouterr().out
+
+    assert "Writing content page: out/two.html" in output
+    assert "Skipping unchanged content page: out/one.html" in output
+    assert "Skipping unchanged content page: out/child.html" in output
+    assert "Skipping unchanged page: sub.yml" in output
+    assert "Edited." in (tmp_path / "out" / "two.html").read_text(encoding="utf-8")
+    search_after = json.loads((tmp_path / "out" / "search.json").read_text(encoding="utf-8"))
+    assert {item["url"] for item in search_after} == {item["url"] for item in search_before}
+
+
+def test_incremental_build_rebuilds_everything_when_config_changes(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    _write_site(tmp_path)
+
+    Builder(output_dir="out", incremental=True).build()
+    capsys.readouterr()
+
+    (tmp_path / "index.yml").write_text(SITE.replace("config:\n", "config:\n  accent: red\n"), encoding="utf-8")
+    Builder(output_dir="out", incremental=True).build()
+    output = capsys.readouterr().out
+
+    assert "Skipping" not in output
+    assert "Writing content page: out/one.html" in output
+
+
+def test_incremental_build_keeps_reused_pages_in_the_graph(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_site(tmp_path)
+
+    cold = Builder(output_dir="out", incremental=True)
+    cold.build()
+    warm = Builder(output_dir="out", incremental=True)
+    warm.build()
+
+    assert warm.graph.pages == cold.graph.pages
+    assert warm.graph.affected_pages("sub.yml") == ["index.html", "sub.html"]
+    assert warm.graph.affected_pages("child.md") == ["child.html"]
+
+
+def test_incremental_build_attributes_replayed_children_to_the_reused_page(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    _write_site(tmp_path)
+    manifest_path = tmp_path / "out" / BuildManifest.FILENAME
+
+    Builder(output_dir="out", incremental=True).build()
+    before = json.loads(manifest_path.read_text(encoding="utf-8"))["pages"]
+
+    (tmp_path / "two.md").write_text("# Two\n\nEdited.", encoding="utf-8")
+    Builder(output_dir="out", incremental=True).build()
+    (tmp_path / "child.md").write_text("# Child\n\nEdited.", encoding="utf-8")
+    capsys.readouterr()
+    Builder(output_dir="out", incremental=True).build()
+    output = capsys.readouterr().out
+    after = json.loads(manifest_path.read_text(encoding="utf-8"))["pages"]
+
+    assert "Skipping unchanged content page: out/one.html" in output
+    assert "Writing content page: out/child.html" in output
+    assert "Edited." in (tmp_path / "out" / "child.html").read_text(encoding="utf-8")
+    assert after["index.html"]["children"] == before["index.html"]["children"]
+    assert after["index.html"]["search"] == before["index.html"]["search"]
+    assert after["one.html"]["children"] == before["one.html"]["children"]
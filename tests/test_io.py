@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import collections
+import os
+
+from webifier.core.builder import Builder
+from webifier.interface import io
+from webifier.interface.io import cache_yaml, read_yaml
+
+
+def test_cache_yaml_parses_unchanged_files_once(tmp_path):
+    path = tmp_path / "nav.yml"
+    path.write_text("content:\n  - text: Home\n", encoding="utf-8")
+
+    with cache_yaml() as cache:
+        first = read_yaml(str(path))
+        first["content"].append({"text": "Mutated"})
+        with cache_yaml() as nested:
+            assert nested is cache
+            assert read_yaml(str(path)) == {"content": [{"text": "Home"}]}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        path.write_text("content: []\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert read_yaml(str(path)) == {"content": []}
+        assert cache.misses == 2
+
+
+def test_cache_yaml_keeps_a_long_lived_cache_between_blocks(tmp_path):
+    path = tmp_path / "nav.yml"
+    path.write_text("content: []\n", encoding="utf-8")
+    cache = io.YamlCache()
+
+    with cache_yaml(cache):
+        read_yaml(str(path))
+    with cache_yaml(cache) as active:
+        assert active is cache
+        read_yaml(str(path))
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_build_parses_shared_patches_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "nav.yml").write_text("content:\n  - text: Home\n    link: /\n", encoding="utf-8")
+    (tmp_path / "sub.yml").write_text("title: Sub\npatch@nav: nav.yml\n", encoding="utf-8")
+    (tmp_path / "index.yml").write_text(
+        """
+title: Test Site
+patch@nav: nav.yml
+config:
+  webifier:
+    extensions:
+      site:
+        uses: webifier.standard
+docs:
+  content:
+    - text: Sub
+      src: sub.yml
+""",
+        encoding="utf-8",
+    )
+    parsed = []
+    load_yaml = io.load_yaml
+
+    def counting_load(stream):
+        parsed.append(os.path.basename(stream.name))
+        return load_yaml(stream)
+
+    monkeypatch.setattr(io, "load_yaml", counting_load)
+    Builder(output_dir="out").build()
+
+    assert sorted(parsed) == ["index.yml", "nav.yml", "sub.yml"]
+
+
+def test_yaml_loaders_preserve_key_order():
+    text = "zeta: 1\nalpha:\n  beta: 2\n  aardvark: 3\n"
+    loaded = io.load_yaml(text)
+    assert isinstance(loaded, collections.OrderedDict)
+    assert list(loaded) == ["zeta", "alpha"]
+    assert list(loaded["alpha"]) == ["beta", "aardvark"]
+    assert list(io.safe_load_yaml(text)["alpha"]) == ["beta", "aardvark"]
+
+
+def test_glob_collections_load_once_per_build(tmp_path, monkeypatch):
+    from webifier.interface.resolvers import expand
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "posts").mkdir()
+    for i in range(20):
+        (tmp_path / "posts" / f"{i:02}.yml").write_text(f"title: Post {i}\n", encoding="utf-8")
+    parsed = []
+    safe_load_yaml = io.safe_load_yaml
+    monkeypatch.setattr(
+        "webifier.interface.resolvers.builtins.safe_load_yaml",
+        lambda text: parsed.append(text) or safe_load_yaml(text),
+    )
+
+    with cache_yaml() as cache:
+        home = expand({"posts": "${glob:posts/*.yml | limit:3}"})
+        archive = expand({"posts": "${glob:posts/*.yml}"})
+        assert len(parsed) == 20 and (cache.hits, cache.misses) == (1, 1)
+        assert [post["title"] for post in home["posts"]] == ["Post 0", "Post 1", "Post 2"]
+        assert home["posts"][0] is archive["posts"][0]
+        assert archive["posts"][19] == {"title": "Post 19", "_source": os.path.join("posts", "19.yml")}
+
+        path = tmp_path / "posts" / "05.yml"
+        path.write_text("title: Edited\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert expand({"posts": "${glob:posts/*.yml}"})["posts"][5]["title"] == "Edited"
+        assert len(parsed) == 40
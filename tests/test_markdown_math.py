@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
-from webifier.core.markdown import build_markdown
+from webifier.core.markdown import MarkdownCache, build_markdown, markdown_converter, protect_markup, restore_math
+from webifier.interface.io import FileManager, collect_dependencies
 
 
 def test_markdown_preserves_math_delimiters_and_code():
@@ -38,7 +39,7 @@ def test_old_github_math_images_become_mathjax_text():
         builder,
     )
 
-    assert 'render.githubusercontent.com/render/math' not in html
+    assert "render.githubusercontent.com/render/math" not in html
     assert "\\(X_i \\leq Y_i + Z_i\\)" in html
 
 
@@ -57,3 +58,50 @@ def test_mermaid_fences_become_mermaid_blocks():
     assert "flowchart LR" in html
     assert "A --&gt; B" in html
     assert "print('kept as code')" in html
+
+
+def test_markdown_converters_are_reused_and_reset():
+    builder = SimpleNamespace(assets_dir="assets", markdown_extensions=("footnotes",))
+    first = build_markdown("Text[^1]\n\n[^1]: First note.", builder, process_html=False)
+    second = build_markdown("Plain text.", builder, process_html=False)
+
+    assert "First note." in first
+    assert "First note." not in second
+    assert markdown_converter(("footnotes",)) is markdown_converter(["footnotes"])
+
+
+def test_markdown_fragments_are_cached_unless_they_touch_files(tmp_path):
+    (tmp_path / "logo.png").write_bytes(b"png")
+    builder = SimpleNamespace(
+        assets_dir="assets",
+        base_url="",
+        markdown_extensions=("md_in_html",),
+        markdown_cache=MarkdownCache(),
+        files=FileManager(output_dir=str(tmp_path / "out")),
+    )
+
+    first = build_markdown("A *card* description.", builder)
+    assert build_markdown("A *card* description.", builder) == first
+    assert (builder.markdown_cache.hits, builder.markdown_cache.misses) == (1, 1)
+
+    for _ in range(2):
+        with collect_dependencies() as noted:
+            build_markdown("![Logo](logo.png)", builder, assets_src_dir=str(tmp_path))
+        assert noted == {str(tmp_path / "logo.png"): "asset"}
+    assert builder.markdown_cache.uncacheable == 2
+
+
+def test_protection_is_a_single_left_to_right_pass():
+    raw = (
+        "$$a `b` c$$ and \\(x\\) but `$y$` and \\[ never closed\n\n"
+        "```\n$fenced$\n```\n"
+        'cost $5 and $ 6 <img src="https://render.githubusercontent.com/render/math?math=k%5E2">'
+    )
+    protected, math = protect_markup(raw)
+
+    assert math == ["$$a `b` c$$", "\\(x\\)", "\\(k^2\\)"]
+    assert protected.startswith("@@WEBIFIER_MATH_0@@ and @@WEBIFIER_MATH_1@@ but `$y$` and \\[ never closed")
+    assert "```\n$fenced$\n```\ncost $5 and $ 6 @@WEBIFIER_MATH_2@@" in protected
+    assert restore_math("<p>@@WEBIFIER_MATH_1@@</p> @@WEBIFIER_MATH_0@@ @@WEBIFIER_MATH_9@@", math) == (
+        "\\(x\\) $$a `b` c$$ @@WEBIFIER_MATH_9@@"
+    )
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+
+import pytest
+
+from webifier.core.builder import Builder
+from webifier.core.parallel import fork_available
+
+pytestmark = pytest.mark.skipif(not fork_available(), reason="parallel builds need the fork start method")
+
+
+def _write_site(tmp_path):
+    (tmp_path / "docs").mkdir()
+    for i in range(6):
+        (tmp_path / "docs" / f"page-{i}.md").write_text(
+            f"# Page {i}\n\n[Shared](md=docs/shared.md)" + ("\n\n[Note](md=docs/note-b.md)" if i == 0 else ""),
+            encoding="utf-8",
+        )
+    (tmp_path / "docs" / "shared.md").write_text("# Shared", encoding="utf-8")
+    (tmp_path / "docs" / "note-b.md").write_text("# Note B\n\nIndexed once.", encoding="utf-8")
+    (tmp_path / "sub.yml").write_text(
+        """
+title: Sub
+nav: false
+more:
+  label: More
+  content:
+    - text: Page 5
+      src: docs/page-5.md
+    - text: Nested
+      src: nested.md
+""",
+        encoding="utf-8",
+    )
+    (tmp_path / "nested.md").write_text("# Nested", encoding="utf-8")
+    links = "\n".join(f"    - text: Page {i}\n      src: docs/page-{i}.md" for i in range(5))
+    (tmp_path / "index.yml").write_text(
+        f"""
+title: Test Site
+config:
+  webifier:
+    extensions:
+      site:
+        uses: webifier.standard
+      markdown:
+        uses: webifier.markdown
+      search:
+        uses: webifier.search
+nav: false
+docs:
+  label: Docs
+  content:
+{links}
+    - text: Sub
+      src: sub.yml
+    - text: Note B
+      src: docs/note-b.md
+""",
+        encoding="utf-8",
+    )
+
+
+def _html_files(root):
+    return {path.relative_to(root).as_posix(): path.read_text(encoding="utf-8") for path in root.rglob("*.html")}
+
+
+def test_parallel_build_matches_serial_build(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_site(tmp_path)
+
+    Builder(output_dir="serial").build()
+    Builder(output_dir="parallel", jobs=3).build()
+
+    serial = _html_files(tmp_path / "serial")
+    parallel = {path: html.replace("parallel/", "serial/") for path, html in _html_files(tmp_path / "parallel").items()}
+    assert "docs/shared.html" in serial
+    assert "nested.html" in serial
+    assert parallel == serial
+
+    serial_search = json.loads((tmp_path / "serial" / "search.json").read_text(encoding="utf-8"))
+    parallel_search = json.loads((tmp_path / "parallel" / "search.json").read_text(encoding="utf-8"))
+    key = lambda item: item["url"]  # noqa: E731
+    assert sorted(parallel_search, key=key) == sorted(serial_search, key=key)
+
+
+def test_parallel_build_writes_incremental_manifest(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    _write_site(tmp_path)
+
+    Builder(output_dir="out", jobs=2, incremental=True).build()
+    capsys.readouterr()
+    shutil.rmtree(tmp_path / "out" / "docs")
+    Builder(output_dir="out", jobs=2, incremental=True).build()
+    output = capsys.readouterr().out
+
+    assert "Skipping unchanged content page: out/nested.html" in output
+    assert (tmp_path / "out" / "docs" / "shared.html").is_file()
+    assert (tmp_path / "out" / "docs" / "page-0.html").is_file()
+
+
+def _files(root):
+    return {path.relative_to(root).as_posix(): path.read_bytes() for path in root.rglob("*") if path.is_file()}
+
+
+def _build_in(site, **options):
+    site.mkdir()
+    os.chdir(site)
+    _write_site(site)
+    Builder(output_dir="out", **options).build()
+    return site / "out"
+
+
+@pytest.mark.parametrize("jobs", [2, 4])
+def test_parallel_build_output_is_identical_to_serial_build(tmp_path, monkeypatch, jobs):
+    monkeypatch.chdir(tmp_path)
+    serial = _build_in(tmp_path / "serial")
+    parallel = _build_in(tmp_path / "parallel", jobs=jobs)
+
+    assert _files(parallel) == _files(serial)
+    # docs/note-b.md is claimed by page-0's link, which does not index it.
+    search = json.loads((serial / "search.json").read_text(encoding="utf-8"))
+    assert "Note B" not in [item["title"] for item in search]
+
+
+def test_incremental_parallel_build_keeps_the_serial_search_index(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    serial = _build_in(tmp_path / "serial", incremental=True)
+    parallel = _build_in(tmp_path / "parallel", jobs=2, incremental=True)
+
+    for out in (serial, parallel):
+        os.chdir(out.parent)
+        (out.parent / "docs" / "page-1.md").write_text("# Page 1\n\nEdited.", encoding="utf-8")
+        Builder(output_dir="out", jobs=2 if out == parallel else 1, incremental=True).build()
+
+    assert (parallel / "search.json").read_bytes() == (serial / "search.json").read_bytes()
+    assert (parallel / "docs" / "page-1.html").read_bytes() == (serial / "docs" / "page-1.html").read_bytes()
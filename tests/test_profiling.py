@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+
+from webifier.interface.cli import main
+from webifier.interface.profiling import Profiler, phase
+
+
+def test_profiler_attributes_self_time_to_pages():
+    profiler = Profiler()
+    with profiler.phase("page", page="index.html"), profiler.phase("render", renderer="page"):
+        with profiler.phase("page", page="sub.html"):
+            pass
+        with profiler.phase("markdown"):
+            pass
+
+    spans = {(span.name, span.page): span for span in profiler.spans}
+    assert spans[("markdown", "index.html")].renderer == "page"
+    assert spans[("page", "sub.html")].outermost is False
+    render = spans[("render", "index.html")]
+    assert render.self_time <= render.duration
+
+    summary = profiler.summary()
+    assert {row["name"] for row in summary["pages"]} == {"index.html", "sub.html"}
+    assert [row["name"] for row in summary["renderers"]] == ["page"]
+    assert {event["ph"] for event in profiler.trace_events()} == {"X"}
+
+    # Without an active profiler, phases are no-ops.
+    with phase("render"):
+        pass
+
+
+def test_profile_option_writes_trace_and_summary(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "one.md").write_text("# One\n\nHello.", encoding="utf-8")
+    (tmp_path / "index.yml").write_text(
+        """
+title: Test Site
+config:
+  webifier:
+    extensions:
+      site:
+        uses: webifier.standard
+      markdown:
+        uses: webifier.markdown
+docs:
+  content:
+    - text: One
+      src: one.md
+""",
+        encoding="utf-8",
+    )
+
+    main(["--output", "out", "--profile", "profile.json"])
+
+    out = capsys.readouterr().out
+    assert "Build profile" in out
+    assert "slowest pages" in out
+    trace = json.loads((tmp_path / "profile.json").read_text(encoding="utf-8"))
+    names = {event["name"] for event in trace["traceEvents"]}
+    assert {"build", "discovery", "preload", "patches", "expand", "render", "markdown", "html"} <= names
+    assert {row["name"] for row in trace["summary"]["pages"]} == {"index.html", "one.html"}
+    assert any(event["args"].get("renderer") == ".md" for event in trace["traceEvents"])
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import ClassVar
+
+import pytest
+
+from webifier.core import base
+from webifier.core.base import GenericTemplateRenderer, NodeContext, RendererModule, register_renderer
+from webifier.core.builder import Builder
+
+
+class BadgeRenderer(RendererModule):
+    def render(self, data, ctx, builder):
+        return "badge"
+
+
+def test_renderer_resolution_is_cached_until_the_registry_or_search_path_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(base, "_REGISTRY", dict(base._REGISTRY))
+    builder = Builder(templates_dir=str(tmp_path / "templates"))
+    probes = []
+    get_template = builder.jinja_env.get_template
+
+    def counting_get_template(name, *args, **kwargs):
+        probes.append(name)
+        return get_template(name, *args, **kwargs)
+
+    builder.jinja_env.get_template = counting_get_template
+
+    for _ in range(3):
+        with pytest.raises(ValueError, match="Unknown renderer kind 'test-badge'"):
+            builder.renderers.resolve("test-badge")
+    assert probes == ["renderers/test-badge.html"]
+
+    # A template directory added by an extension makes the template visible.
+    extra = tmp_path / "extra" / "renderers"
+    extra.mkdir(parents=True)
+    (extra / "test-badge.html").write_text("{{ data.text }}", encoding="utf-8")
+    builder.jinja_env.loader.searchpath.append(str(extra.parent))
+    builder.renderers.invalidate()
+    first = builder.renderers.resolve("test-badge")
+    assert isinstance(first, GenericTemplateRenderer)
+    assert first.template == "renderers/test-badge.html"
+    assert builder.renderers.resolve("test-badge") is not first
+    assert len(probes) == 2
+
+    # Registering a renderer takes precedence without an explicit invalidation.
+    register_renderer("test-badge", BadgeRenderer)
+    assert isinstance(builder.renderers.resolve("test-badge"), BadgeRenderer)
+
+
+class CaptureRenderer(RendererModule):
+    captured: ClassVar[list] = []
+
+    def process(self, data, ctx, builder):
+        return data
+
+    def render(self, data, ctx, builder):
+        self.captured.append(data)
+        return ""
+
+
+def test_dispatch_copies_nodes_shallowly_and_never_edits_the_input(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(base, "_REGISTRY", dict(base._REGISTRY))
+    register_renderer("test-capture", CaptureRenderer)
+    (tmp_path / "logo.png").write_bytes(b"png")
+    builder = Builder(output_dir=str(tmp_path / "out"), base_url="")
+
+    posts = [{"title": f"Post {i}", "tags": ["a", "b"]} for i in range(3)]
+    node = {"kind": "test-capture", "posts": posts}
+    builder.process_node(node, NodeContext(depth=1))
+    assert node == {"kind": "test-capture", "posts": posts}
+    assert CaptureRenderer.captured[-1]["posts"] is posts
+
+    link = {"href": "https://example.com", "image": {"src": "logo.png", "alt": "Logo"}}
+    processed = builder._process_link(link, NodeContext(depth=1))
+    assert processed["image"] == {"src": "/assets/logo.png", "alt": "Logo"}
+    assert link["image"] == {"src": "logo.png", "alt": "Logo"}
+
+
+class IconRenderer(RendererModule):
+    """Edits nested link dicts in place, as the bundled people renderer does."""
+
+    def process(self, data, ctx, builder):
+        for person in data["people"]:
+            for link in person["links"]:
+                link["icon"] = f"icon-{ctx.key}"
+                link["href"] = link["href"].removeprefix("mailto://")
+        return data
+
+    def render(self, data, ctx, builder):
+        return data["people"][0]["links"][0]["icon"]
+
+
+def test_renderers_editing_nested_values_do_not_leak_across_pages(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(base, "_REGISTRY", dict(base._REGISTRY))
+    register_renderer("test-icons", IconRenderer)
+    builder = Builder(output_dir=str(tmp_path / "out"), base_url="")
+    builder.extensions_configured = True
+
+    # Two pages listing the same loaded items, as ${glob:} collections do.
+    people = [{"name": "Ada", "links": [{"href": "mailto://ada@example.com"}]}]
+    assert builder.process_node({"kind": "test-icons", "people": people}, NodeContext(key="a")) == "icon-a"
+    assert builder.process_node({"kind": "test-icons", "people": people}, NodeContext(key="b")) == "icon-b"
+    assert people == [{"name": "Ada", "links": [{"href": "mailto://ada@example.com"}]}]
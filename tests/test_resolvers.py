@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+import subprocess
+
+from webifier.interface.resolvers import expand
+from webifier.interface.resolvers.expressions import Interpolation, compile_template
+from webifier.interface.resolvers.utils import GitIndex, GitTimes, cache_git_metadata, git_index
+
+
+def test_expand_resolves_nested_typed_and_partial_interpolations():
+    page = {
+        "site": {"title": "Docs", "tags": ["b", "a"]},
+        "key": "site.title",
+        "field": "title",
+        "title": "${ref:site.title}",
+        "heading": "Welcome to ${ref:.title}!",
+        "tags": "${ref:site.tags | sort}",
+        "count": "  ${ref:site.tags | count}  ",
+        "nested": "${ref:${ref:.key}}",
+        "dynamic": "${ref:site.${ref:.field}} / ${ref:site.${ref:.field}}",
+        "unknown": "${nope:x} and ${nope:x}",
+        "literal": "${} ${a {b} ${ref:site.title}} $${ref:.field}",
+        "unclosed": "${ref:site.title",
+    }
+    result = expand(page)
+
+    assert result["title"] == "Docs"
+    assert result["heading"] == "Welcome to Docs!"
+    assert result["tags"] == ["a", "b"]
+    assert result["count"] == 2
+    assert result["nested"] == "Docs"
+    assert result["dynamic"] == "Docs / Docs"
+    assert result["unknown"] == "nope:x and nope:x"
+    assert result["literal"] == "${} ${a {b} Docs} $title"
+    assert result["unclosed"] == "${ref:site.title"
+
+
+def test_templates_are_compiled_once_and_self_references_terminate():
+    template = compile_template("${ref:a} and ${ref:b | sort}")
+    assert template is compile_template("${ref:a} and ${ref:b | sort}")
+    assert [segment.pipeline.steps for segment in template.segments if isinstance(segment, Interpolation)] == [
+        (("ref", "a"),),
+        (("ref", "b"), ("sort", "")),
+    ]
+
+    result = expand({"loop": "again ${ref:.loop}"})
+    assert result["loop"].startswith("again again again")
+
+
+def test_expand_returns_static_subtrees_untouched():
+    data = {"rows": [{"name": f"row {i}", "values": [i, i * 2]} for i in range(3)], "meta": {"title": "Static"}}
+    page = {"title": "${ref:data.meta.title}", "data": data, "items": ["a", "${ref:data.meta.title}"]}
+
+    result = expand(page)
+    assert result is not page
+    assert result["data"] is data
+    assert result["title"] == "Static"
+    assert result["items"] == ["a", "Static"]
+    assert page["items"] == ["a", "${ref:data.meta.title}"]
+    assert expand(data) is data
+
+
+T = 1_000_000_000  # a timestamp git accepts as a raw date
+
+
+def _commit(repo, message, when):
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_DATE": f"{when} +0000",
+        "GIT_COMMITTER_DATE": f"{when + 50} +0000",
+        "GIT_AUTHOR_NAME": "Test",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "Test",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+    }
+    subprocess.run(["git", "add", "-A"], cwd=repo, check=True)
+    subprocess.run(["git", "commit", "-qm", message], cwd=repo, check=True, env=env)
+
+
+def test_git_sort_keys_read_one_history_index(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert GitIndex().lookup("missing.yml") is None  # not a repository
+
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    posts = tmp_path / "posts"
+    posts.mkdir()
+    (posts / "old.yml").write_text("title: Old\n", encoding="utf-8")
+    (posts / "new.yml").write_text("title: New\n", encoding="utf-8")
+    _commit(tmp_path, "add posts", T)
+    (posts / "old.yml").rename(posts / "renamed.yml")
+    _commit(tmp_path, "rename", T + 100)
+    (posts / "new.yml").write_text("title: New, edited\n", encoding="utf-8")
+    _commit(tmp_path, "edit", T + 200)
+
+    calls = []
+    run = subprocess.run
+    monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: calls.append(args) or run(*args, **kwargs))
+    with cache_git_metadata():
+        index = git_index()
+        assert index.lookup("posts/renamed.yml") == GitTimes(authored=T + 100, committed=T + 150, created=T)
+        assert index.lookup("posts/new.yml") == GitTimes(authored=T + 200, committed=T + 250, created=T)
+        by_modified = expand({"posts": "${glob:posts/*.yml | sort:-git | map:title}"})
+        by_created = expand({"posts": "${glob:posts/*.yml | sort:git:created | map:_source}"})
+    assert by_modified["posts"] == ["New, edited", "Old"]
+    assert by_created["posts"] == [os.path.join("posts", "new.yml"), os.path.join("posts", "renamed.yml")]
+    assert len(calls) == 2  # rev-parse and a single git log
+
+
+def test_fused_transforms_match_step_by_step_results():
+    from webifier.interface.resolvers import _BUILTINS
+    from webifier.interface.resolvers.engine import Engine
+
+    class StepwiseEngine(Engine):
+        def _apply_transforms(self, value, chain, ctx):
+            for resolver, arg in chain:
+                value = resolver(value, arg, ctx)
+            return value
+
+    posts = [{"title": f"Post {i}", "date": i % 7, "draft": i % 5 == 0, "tag": f"t{i % 3}"} for i in range(40)]
+    page = {
+        "posts": posts,
+        "latest": "${ref:.posts | sort:-date | limit:5}",
+        "oldest": "${ref:.posts | sort:date | limit:5 | map:title}",
+        "page": "${ref:.posts | offset:10 | limit:5 | map:title}",
+        "published": "${ref:.posts | exclude:draft | filter:tag=t1 | exclude:date=3 | count}",
+    }
+    stepwise = StepwiseEngine()
+    for name, resolver in _BUILTINS.items():
+        stepwise.register(name, resolver)
+    assert expand(page) == stepwise.expand(page)
+    assert [post["date"] for post in expand(page)["latest"]] == [6, 6, 6, 6, 6]
+
+
+def test_unique_hashes_canonical_keys():
+    data = {
+        "items": [{"a": 1, "b": [1, 2]}, {"b": [1, 2], "a": 1}, {"a": 1, "b": (1, 2)}, [1], [1], 1, True, "1"],
+        "authors": [{"name": "A", "links": {"web": "x"}}, {"name": "B", "links": {"web": "x"}}],
+    }
+    result = expand({**data, "unique": "${ref:items | unique}", "by_links": "${ref:authors | unique:links}"})
+    assert result["unique"] == [{"a": 1, "b": [1, 2]}, {"a": 1, "b": (1, 2)}, [1], 1, "1"]
+    assert result["by_links"] == [{"name": "A", "links": {"web": "x"}}]
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import os
+import threading
+import urllib.request
+
+from webifier.core.builder import Builder
+from webifier.interface.serve import RELOAD_SCRIPT, DevServer
+
+
+def _write_site(tmp_path):
+    (tmp_path / "nav.yml").write_text("content:\n  - text: Home\n    link: /\n", encoding="utf-8")
+    (tmp_path / "one.md").write_text("# One", encoding="utf-8")
+    (tmp_path / "two.md").write_text("# Two", encoding="utf-8")
+    (tmp_path / "index.yml").write_text(
+        """
+title: Test Site
+patch@nav: nav.yml
+config:
+  webifier:
+    extensions:
+      site:
+        uses: webifier.standard
+      markdown:
+        uses: webifier.markdown
+docs:
+  label: Docs
+  content:
+    - text: One
+      src: one.md
+    - text: Two
+      src: two.md
+""",
+        encoding="utf-8",
+    )
+
+
+def _touch(path, text):
+    path.write_text(text, encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_dev_server_rebuilds_only_affected_pages(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_site(tmp_path)
+    server = DevServer(lambda: Builder(output_dir="out"), port=0)
+    try:
+        builder = server.builder
+        two_before = (tmp_path / "out" / "two.html").stat().st_mtime_ns
+
+        _touch(tmp_path / "one.md", "# One\n\nEdited.")
+        assert server.poll() == ["one.html"]
+        assert server.builder is builder
+        assert server.generation == 1
+        assert "Edited." in (tmp_path / "out" / "one.html").read_text(encoding="utf-8")
+        assert (tmp_path / "out" / "two.html").stat().st_mtime_ns == two_before
+
+        _touch(tmp_path / "nav.yml", "content:\n  - text: Start\n    link: /\n")
+        assert "two.html" in server.poll()
+        assert server.builder is builder
+        assert "Start" in (tmp_path / "out" / "two.html").read_text(encoding="utf-8")
+
+        assert server.poll() == []
+    finally:
+        server.shutdown()
+
+
+def test_dev_server_injects_reload_script(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_site(tmp_path)
+    server = DevServer(lambda: Builder(output_dir="out"), port=0)
+    thread = threading.Thread(target=server.httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with urllib.request.urlopen(f"{server.address}one.html", timeout=5) as response:
+            html = response.read().decode("utf-8")
+        assert RELOAD_SCRIPT in html
+        assert html.index(RELOAD_SCRIPT) < html.lower().rindex("</body>")
+    finally:
+        server.httpd.shutdown()
+        server.shutdown()
+
+
+def test_dev_server_rebuilds_pages_globbing_a_new_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_site(tmp_path)
+    index = (tmp_path / "index.yml").read_text(encoding="utf-8")
+    (tmp_path / "index.yml").write_text(index + "    - text: Sub\n      src: sub.yml\n", encoding="utf-8")
+    (tmp_path / "posts").mkdir()
+    (tmp_path / "posts" / "a.yml").write_text("title: A\n", encoding="utf-8")
+    (tmp_path / "sub.yml").write_text(
+        "title: Sub\nintro:\n  content: 'Posts: ${glob:posts/*.yml | count}'\n", encoding="utf-8"
+    )
+    server = DevServer(lambda: Builder(output_dir="out"), port=0)
+    try:
+        assert "Posts: 1" in (tmp_path / "out" / "sub.html").read_text(encoding="utf-8")
+
+        (tmp_path / "posts" / "b.yml").write_text("title: B\n", encoding="utf-8")
+        assert server.poll() == ["sub.html"]
+        assert "Posts: 2" in (tmp_path / "out" / "sub.html").read_text(encoding="utf-8")
+    finally:
+        server.shutdown()
+
+
+def test_incremental_dev_server_rebuilds_every_page_reading_a_changed_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_site(tmp_path)
+    index = (tmp_path / "index.yml").read_text(encoding="utf-8")
+    (tmp_path / "index.yml").write_text(
+        index.replace("docs:\n", "posts:\n  content: 'Root: ${glob:posts/*.yml | map:title}'\ndocs:\n", 1)
+        + "    - text: Sub\n      src: sub/index.yml\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "posts").mkdir()
+    (tmp_path / "posts" / "p5.yml").write_text("title: Five\n", encoding="utf-8")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "index.yml").write_text(
+        "title: Sub\nposts:\n  content: 'Sub: ${glob:posts/*.yml | map:title}'\n", encoding="utf-8"
+    )
+    server = DevServer(lambda: Builder(output_dir="out", incremental=True), port=0)
+    try:
+        _touch(tmp_path / "posts" / "p5.yml", "title: Cinq\n")
+        assert "sub/index.html" in server.poll()
+        assert "Cinq" in (tmp_path / "out" / "index.html").read_text(encoding="utf-8")
+        assert "Cinq" in (tmp_path / "out" / "sub" / "index.html").read_text(encoding="utf-8")
+    finally:
+        server.shutdown()
+
+
+def test_dev_server_rebuilds_content_pages_as_a_full_build_would(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_site(tmp_path)
+    index = (tmp_path / "index.yml").read_text(encoding="utf-8")
+    (tmp_path / "index.yml").write_text(
+        index.replace(
+            "        uses: webifier.markdown\n",
+            "        uses: webifier.markdown\n      search:\n        uses: webifier.search\n",
+        ),
+        encoding="utf-8",
+    )
+    server = DevServer(lambda: Builder(output_dir="out"), port=0)
+    try:
+        _touch(tmp_path / "one.md", "# One\n\nEdited.")
+        assert server.poll() == ["one.html"]
+    finally:
+        server.shutdown()
+
+    Builder(output_dir="fresh").build()
+    for name in ("one.html", "search.json"):
+        assert (tmp_path / "out" / name).read_bytes() == (tmp_path / "fresh" / name).read_bytes()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import jinja2
+
+from webifier.core.builder import Builder
+from webifier.interface.cli import WebifierArgs, make_builder
+
+
+def test_templates_are_compiled_once_across_builders(tmp_path, monkeypatch):
+    templates = tmp_path / "templates"
+    (templates / "renderers").mkdir(parents=True)
+    (templates / "renderers" / "card.html").write_text("<div>{{ data.title }}</div>", encoding="utf-8")
+    (templates / "broken.html").write_text("{% if %}", encoding="utf-8")
+    (templates / ".hidden").mkdir()
+    (templates / ".hidden" / "skip.html").write_text("{{ x }}", encoding="utf-8")
+    (templates / "notes.txt").write_text("{{ not a template", encoding="utf-8")
+
+    compiled = []
+    compile_template = jinja2.Environment.compile
+
+    def counting_compile(self, source, name=None, *args, **kwargs):
+        compiled.append(name)
+        return compile_template(self, source, name, *args, **kwargs)
+
+    monkeypatch.setattr(jinja2.Environment, "compile", counting_compile)
+    cache_dir = str(tmp_path / "cache")
+
+    builder = Builder(templates_dir=str(templates), cache_dir=cache_dir, template_cache=True)
+    builder.extensions_configured = True
+    assert builder.precompile() == (["renderers/card.html"], ["broken.html"])
+    assert compiled == ["broken.html", "renderers/card.html"]
+
+    # A fresh builder (a later build) loads the bytecode instead of compiling.
+    builder = Builder(templates_dir=str(templates), cache_dir=cache_dir, template_cache=True)
+    assert builder.jinja_env.get_template("renderers/card.html").render(data={"title": "Hi"}) == "<div>Hi</div>"
+    assert compiled == ["broken.html", "renderers/card.html"]
+
+    # Editing the source compiles it again.
+    (templates / "renderers" / "card.html").write_text("<p>{{ data.title }}</p>", encoding="utf-8")
+    builder = Builder(templates_dir=str(templates), cache_dir=cache_dir, template_cache=True)
+    assert builder.jinja_env.get_template("renderers/card.html").render(data={"title": "Hi"}) == "<p>Hi</p>"
+    assert compiled[-1] == "renderers/card.html"
+
+    # Library use writes nothing to disk unless asked to; the CLI turns the cache on.
+    assert Builder(templates_dir=str(templates)).jinja_env.bytecode_cache is None
+    assert make_builder(WebifierArgs(cache_dir=cache_dir)).jinja_env.bytecode_cache is not None
+    assert make_builder(WebifierArgs(no_template_cache=True)).jinja_env.bytecode_cache is None
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import importlib
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -12,13 +14,17 @@ if TYPE_CHECKING:
 # ---------------------------------------------------------------------------
 
 _REGISTRY: dict[str, type[RendererModule]] = {}
+# Bumped on every registration so resolution caches know to start over.
+_registry_version = 0
 
 
 def register(name: str):
     """Class decorator — register a RendererModule under *name*."""
 
     def decorator(cls: type[RendererModule]):
+        global _registry_version
         _REGISTRY[name] = cls
+        _registry_version += 1
         return cls
 
     return decorator
@@ -32,9 +38,7 @@ def _renderer_class(renderer: str | type[RendererModule]) -> type[RendererModule
         cls = getattr(mod, class_name)
 
     if not isinstance(cls, type) or not issubclass(cls, RendererModule):
-        raise TypeError(
-            f"Renderer '{renderer}' must point to a RendererModule subclass, got {cls!r}."
-        )
+        raise TypeError(f"Renderer '{renderer}' must point to a RendererModule subclass, got {cls!r}.")
     return cls
 
 
@@ -62,7 +66,9 @@ def register_renderer(
             f"Renderer '{name}' is already registered by {existing.__module__}.{existing.__name__}. "
             "Set override: true on the later extension instance to replace it."
         )
+    global _registry_version
     _REGISTRY[name] = cls
+    _registry_version += 1
 
 
 def resolve_renderer(
@@ -77,16 +83,21 @@ def resolve_renderer(
       2. Template file lookup (``renderers/<name>.html`` in Jinja2 search path)
       3. Dotted Python import (``some.module.ClassName``)
     """
+    return _renderer_factory(name, jinja_env)()
+
+
+def _renderer_factory(name: str, jinja_env=None) -> Callable[[], RendererModule]:
+    """Find what :func:`resolve_renderer` instantiates for *name*."""
     # 1. Registry
     if name in _REGISTRY:
-        return _REGISTRY[name]()
+        return _REGISTRY[name]
 
     # 2. Template file
     if jinja_env is not None:
         template_path = f"renderers/{name}.html"
         try:
             jinja_env.get_template(template_path)
-            return GenericTemplateRenderer(template=template_path)
+            return functools.partial(GenericTemplateRenderer, template=template_path)
         except Exception:
             pass
 
@@ -97,7 +108,7 @@ def resolve_renderer(
             mod = importlib.import_module(module_path)
             cls = getattr(mod, class_name)
             if isinstance(cls, type) and issubclass(cls, RendererModule):
-                return cls()
+                return cls
         except (ImportError, AttributeError) as exc:
             raise ValueError(
                 f"Could not import renderer '{name}': {exc}\n"
@@ -114,6 +125,39 @@ def resolve_renderer(
     )
 
 
+class RendererResolver:
+    """Memoized :func:`resolve_renderer` for one builder.
+
+    Remembers what each kind resolved to (a class, a template, or an error),
+    so dispatch skips the template probe and import.  The cache starts over
+    when a renderer is registered; call :meth:`invalidate` when the template
+    search path changes.  Every call still returns a fresh instance.
+    """
+
+    def __init__(self, jinja_env=None) -> None:
+        self.jinja_env = jinja_env
+        self.factories: dict[str, Callable[[], RendererModule] | ValueError] = {}
+        self.version = _registry_version
+
+    def invalidate(self) -> None:
+        self.factories.clear()
+
+    def resolve(self, name: str) -> RendererModule:
+        if self.version != _registry_version:
+            self.factories.clear()
+            self.version = _registry_version
+        factory = self.factories.get(name)
+        if factory is None:
+            try:
+                factory = _renderer_factory(name, self.jinja_env)
+            except ValueError as exc:
+                factory = exc
+            self.factories[name] = factory
+        if isinstance(factory, ValueError):
+            raise ValueError(str(factory)) from factory.__cause__
+        return factory()
+
+
 # ---------------------------------------------------------------------------
 # NodeContext
 # ---------------------------------------------------------------------------
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import contextlib
 import copy
+import dataclasses
 import json
 import os
 import re
@@ -10,13 +12,40 @@ from typing import Any
 
 import jinja2
 
-from webifier.interface.io import FileManager, prepend_baseurl, strip_suffixes
-
-from .base import GenericTemplateRenderer, NodeContext, resolve_renderer
+from webifier.interface.io import (
+    FileManager,
+    YamlCache,
+    cache_yaml,
+    collect_dependencies,
+    note_dependency,
+    prepend_baseurl,
+    read_file,
+    strip_suffixes,
+)
+from webifier.interface.profiling import active_profiler, phase, profiled
+from webifier.interface.resolvers.utils import cache_git_metadata
+
+from .base import GenericTemplateRenderer, NodeContext, RendererResolver
+from .config import FrozenDict, freeze, merge, thaw
 from .extensions import ExtensionManager
 from .frontmatter import split_yaml_front_matter
+from .graph import DependencyGraph
+from .highlight import HighlightCache, using_highlight_cache
 from .loader import apply_defaults, load_and_resolve, read_yaml, resolve_patches
-from .markdown import build_markdown
+from .manifest import BuildManifest, digest_value, extension_versions
+from .markdown import MarkdownCache, build_markdown
+from .parallel import PageResult, PageTask, fork_available, render_parallel
+from .templates import TemplateBytecodeCache, default_cache_dir, precompile_templates
+
+
+class TemplateEnvironment(jinja2.Environment):
+    """Jinja2 environment that notes every template a page renders with."""
+
+    def get_template(self, name, parent=None, globals=None):
+        template = super().get_template(name, parent=parent, globals=globals)
+        if template.filename:
+            note_dependency(template.filename, "template")
+        return template
 
 
 @dataclass
@@ -32,6 +61,13 @@ class Builder:
     output_dir: str = "webified"
     assets_dir: str = "assets"
     templates_dir: str = "."
+    incremental: bool = False
+    jobs: int = 1
+    copy_mode: str = "copy"
+    cache_dir: str | None = None
+    template_cache: bool = False
+    extension_cache: bool = False
+    refresh_extensions: bool = False
     markdown_extensions: tuple[str, ...] = (
         "md_in_html",
         "codehilite",
@@ -56,21 +92,62 @@ class Builder:
 
     # Jinja2 environment
     jinja_env: jinja2.Environment = field(default=None, init=False, repr=False)
+    renderers: RendererResolver = field(default=None, init=False, repr=False)
     extensions: ExtensionManager = field(default=None, init=False, repr=False)
 
+    # Incremental build manifest (``None`` when incremental builds are off)
+    manifest: BuildManifest | None = field(default=None, init=False, repr=False)
+
+    # Parsed YAML, kept between builds and rebuilds (invalidated by mtime and size)
+    yaml_cache: YamlCache = field(default_factory=YamlCache, init=False, repr=False)
+
+    # Rendered markdown fragments that are safe to reuse (descriptions, blurbs)
+    markdown_cache: MarkdownCache = field(default_factory=MarkdownCache, init=False, repr=False)
+
+    # Pygments output kept across builds under ``cache_dir``
+    highlight_cache: HighlightCache | None = field(default=None, init=False, repr=False)
+
+    # What every generated page was built from
+    graph: DependencyGraph = field(default_factory=DependencyGraph, init=False, repr=False)
+
+    # Parallel builds: while set, the page being rendered records the search
+    # entries it adds and the pages it links to here instead of claiming and
+    # building them (see ``_apply_walk``).
+    _walk: list[tuple] | None = field(default=None, init=False, repr=False)
+
+    # What a link to an already claimed index page shows, by index file, and
+    # the context of the link that claimed each content page (for rebuilds)
+    _index_summaries: dict[str, dict] = field(default_factory=dict, init=False, repr=False)
+    _link_contexts: dict[str, NodeContext] = field(default_factory=dict, init=False, repr=False)
+
+    # A frozen snapshot of ``config``, and the merged page configs made from it
+    # by page-local config.  Extensions only ever see mutable copies.
+    _frozen_config: FrozenDict | None = field(default=None, init=False, repr=False)
+    _page_configs: dict[tuple, FrozenDict] = field(default_factory=dict, init=False, repr=False)
+
     def __post_init__(self):
         self.files = FileManager(
             output_dir=self.output_dir,
             assets_dir=self.assets_dir,
             baseurl=self.base_url,
+            copy_mode=self.copy_mode,
         )
 
-        self.jinja_env = jinja2.Environment(
+        bytecode_cache = None
+        if self.template_cache:
+            bytecode_cache = TemplateBytecodeCache(os.path.join(self.cache_dir or default_cache_dir(), "jinja"))
+        self.jinja_env = TemplateEnvironment(
             loader=jinja2.FileSystemLoader([self.templates_dir]),
             autoescape=False,
             extensions=["jinja2.ext.loopcontrols"],
+            bytecode_cache=bytecode_cache,
         )
+        self.renderers = RendererResolver(self.jinja_env)
         self.extensions = ExtensionManager(self)
+        if self.incremental:
+            self.manifest = BuildManifest(self.output_dir)
+        if self.cache_dir:
+            self.highlight_cache = HighlightCache(os.path.join(self.cache_dir, "highlight"))
 
     # ------------------------------------------------------------------
     # Extension runup
@@ -80,9 +157,12 @@ class Builder:
         """Load enough of the root page to configure extensions before interpolation."""
         if not index_file.endswith((".yml", ".yaml")):
             index_file = f"{index_file}.yml"
-        data = read_yaml(index_file)
-        data = resolve_patches(data)
-        data = apply_defaults(data)
+        with phase("preload"):
+            data = read_yaml(index_file)
+            with phase("patches"):
+                data = resolve_patches(data)
+            with phase("defaults"):
+                data = apply_defaults(data)
         config: dict[str, Any] = {}
         if isinstance(data, dict) and isinstance(data.get("config"), dict):
             config = dict(data["config"])
@@ -107,23 +187,52 @@ class Builder:
         return self.extensions.render_area(area, **kwargs)
 
     def page_config(self, data: dict | None = None) -> dict:
-        """Return global config merged with page-local config."""
-        config = copy.deepcopy(self.config)
+        """Return global config merged with page-local config.
+
+        The result is the caller's own copy and may be edited freely.
+        """
+        return thaw(self._page_config(data))
+
+    def _frozen_global_config(self) -> FrozenDict:
+        """Return :attr:`config` frozen, reusing the last snapshot while it still matches."""
+        snapshot = self._frozen_config
+        if snapshot is None or snapshot != self.config:
+            snapshot = self._frozen_config = freeze(self.config)
+            self._page_configs = {}
+        return snapshot
+
+    def _page_config(self, data: dict | None = None) -> FrozenDict:
+        """Frozen :meth:`page_config`, shared by every page with the same local config."""
+        page_configs = []
         if isinstance(data, dict):
-            page_configs = []
             if isinstance(data.get("config"), dict):
                 page_configs.append(data["config"])
             metadata = data.get("metadata")
             if isinstance(metadata, dict) and isinstance(metadata.get("config"), dict):
                 page_configs.append(metadata["config"])
+        for page_config in page_configs:
+            self.extensions.configure_page_extensions(page_config)
+
+        base = self._frozen_global_config()
+        if not page_configs:
+            return base
+
+        page_configs = [freeze(page_config) for page_config in page_configs]
+        key = config = None
+        try:
+            key = tuple(page_configs)
+            config = self._page_configs.get(key)
+        except TypeError:  # unhashable values in a page config
+            key = None
+        if config is None:
+            config = base
             for page_config in page_configs:
-                self.extensions.configure_page_extensions(page_config)
-                for key, value, reset in self.extensions.page_config_overlays(page_config):
-                    if reset:
-                        config[key] = copy.deepcopy(value)
-                    else:
-                        config[key] = _deep_merge(config.get(key, {}), value)
-                config = _deep_merge(config, page_config)
+                for name, value, reset in self.extensions.page_config_overlays(page_config):
+                    overlay = freeze(value) if reset else merge(config.get(name, {}), value)
+                    config = FrozenDict({**config, name: overlay})
+                config = merge(config, page_config)
+            if key is not None:
+                self._page_configs[key] = config
         return config
 
     def page_navigation(self, config: dict | None = None, data: dict | None = None, ctx=None) -> dict:
@@ -186,9 +295,7 @@ class Builder:
         active_index = None
         for i, entry in enumerate(entries):
             normalized_entry = {
-                _normalize_page_nav_value(value, suffixes)
-                for value in (entry.get("href"), entry.get("src"))
-                if value
+                _normalize_page_nav_value(value, suffixes) for value in (entry.get("href"), entry.get("src")) if value
             }
             if normalized_current & normalized_entry:
                 active_index = i
@@ -233,24 +340,35 @@ class Builder:
         """
         if isinstance(data, str):
             kind = self.config_defaults.get("markdown", "markdown")
-            renderer = resolve_renderer(kind, jinja_env=self.jinja_env)
-            return renderer.render({"content": data}, ctx, self)
+            renderer = self.renderers.resolve(kind)
+            with phase("render", renderer=kind):
+                return renderer.render({"content": data}, ctx, self)
 
         if isinstance(data, list):
             kind = self.config_defaults.get("links", "links")
-            renderer = resolve_renderer(kind, jinja_env=self.jinja_env)
+            renderer = self.renderers.resolve(kind)
             processed_items = []
             for i, item in enumerate(data):
                 if isinstance(item, dict):
                     processed_items.append(self._process_link(item, ctx.child(str(i))))
                 else:
                     processed_items.append(item)
-            return renderer.render({"items": processed_items}, ctx, self)
+            with phase("render", renderer=kind):
+                return renderer.render({"items": processed_items}, ctx, self)
 
         if isinstance(data, dict):
-            data = copy.deepcopy(data)
+            extension_data = None
             if ctx.depth == 0:
-                data = self.extensions.consume_page_keys(data, ctx=ctx, config=self.page_config(data))
+                # Pages share loaded data (glob items, cached documents) and
+                # renderers, third-party ones included, may edit nested values
+                # of their input, so each page renders from a private copy.
+                # Nested levels only pop top-level keys of that copy.
+                data = copy.deepcopy(data)
+                data = self.extensions.consume_page_keys(data, ctx=ctx, config=self._page_config(data))
+                # Consumer results are for templates, not sections to render.
+                extension_data = data.pop("_extension_data", None)
+            else:
+                data = dict(data)
 
             # template: path (inline override) takes precedence, but only
             # at the page level (depth 0). At section level, `template` is
@@ -260,8 +378,12 @@ class Builder:
             if "template" in data and ctx.depth == 0:
                 tmpl_path = data.pop("template")
                 renderer = GenericTemplateRenderer(template=tmpl_path)
-                processed = renderer.process(data, ctx, self)
-                return renderer.render(processed, ctx, self)
+                with phase("process", renderer=tmpl_path):
+                    processed = renderer.process(data, ctx, self)
+                if extension_data is not None:
+                    processed["_extension_data"] = extension_data
+                with phase("render", renderer=tmpl_path):
+                    return renderer.render(processed, ctx, self)
 
             # kind: name (named lookup)
             kind = data.pop("kind", None)
@@ -272,9 +394,13 @@ class Builder:
                 else:
                     kind = self.config_defaults.get("section", "section")
 
-            renderer = resolve_renderer(kind, jinja_env=self.jinja_env)
-            processed = renderer.process(data, ctx, self)
-            return renderer.render(processed, ctx, self)
+            renderer = self.renderers.resolve(kind)
+            with phase("process", renderer=kind):
+                processed = renderer.process(data, ctx, self)
+            if extension_data is not None:
+                processed["_extension_data"] = extension_data
+            with phase("render", renderer=kind):
+                return renderer.render(processed, ctx, self)
 
         return str(data)
 
@@ -283,8 +409,12 @@ class Builder:
     # ------------------------------------------------------------------
 
     def _process_link(self, link: dict, ctx: NodeContext) -> dict:
-        """Process a single link dict — resolve src, href, and content files."""
-        link = copy.deepcopy(link)
+        """Process a single link dict — resolve src, href, and content files.
+
+        Returns a new dict and replaces nested values rather than editing
+        them, so *link* is left as it was.
+        """
+        link = dict(link)
 
         # src: path — content files can generate sub-pages via extensions.
         if "src" in link:
@@ -325,10 +455,7 @@ class Builder:
                 target_dir=ctx.assets_target_dir or self.assets_dir,
             )
             if new_path:
-                if isinstance(img, dict):
-                    link["image"]["src"] = new_path
-                else:
-                    link["image"] = new_path
+                link["image"] = {**img, "src": new_path} if isinstance(img, dict) else new_path
 
         return link
 
@@ -347,43 +474,66 @@ class Builder:
     def _process_content_link(self, link: dict, ctx: NodeContext, kind: str) -> dict:
         """Process a content link — render a sub-page."""
         src = link["src"]
-        if src in self.processed_pages:
-            # Already built — just return the URL
-            slug = strip_suffixes(src, self._content_suffixes())
-            link["href"] = prepend_baseurl(slug, baseurl=self.base_url)
-            return link
+        note_dependency(src, "link")
+        if self.manifest is not None:
+            self.manifest.note_child(
+                kind,
+                src,
+                search_content=ctx.search_content,
+                search_links=ctx.search_links,
+                assets_src_dir=ctx.assets_src_dir,
+                assets_target_dir=ctx.assets_target_dir,
+            )
+        # The link looks the same whether or not this link builds the page.
+        slug = strip_suffixes(src, self._content_suffixes())
+        link["href"] = prepend_baseurl(slug, baseurl=self.base_url)
+        if "text" not in link:
+            link["text"] = os.path.basename(slug).replace("-", " ").replace("_", " ").title()
+        # Search indexing, only by the link that builds the page
+        item = (link["href"], link["href"], link.get("text", ""), link.get("description")) if ctx.search_links else None
 
-        self.processed_pages.add(src)
+        if self._walk is not None:
+            self._walk.append(("page", src, kind, dataclasses.replace(ctx, parent=None), item))
+        elif self._build_content_page(src, kind, ctx) and item is not None:
+            self._add_search_item(*item)
+        return link
 
-        slug = strip_suffixes(src, self._content_suffixes())
-        target_html = os.path.join(self.output_dir, f"{slug}.html")
+    def _build_content_page(self, src: str, kind: str, ctx: NodeContext) -> bool:
+        """Build the content page *src* unless it was already claimed; return whether it was."""
+        if src in self.processed_pages:
+            return False
+        self.processed_pages.add(src)
+        self._link_contexts[src] = dataclasses.replace(ctx, parent=None)
 
         renderer_key = self._content_renderer_key(src, kind)
         if renderer_key is None:
             raise ValueError(f"No content renderer registered for '{src}' ({kind}).")
-        content = self.content_renderers[renderer_key](self, src, ctx)
 
-        if content:
-            # Write the content page
-            os.makedirs(os.path.dirname(target_html) or ".", exist_ok=True)
-            with open(target_html, "w") as f:
-                f.write(content)
-            print(f"  Writing content page: {target_html}")
+        output = self._content_output(src)
+        if self.manifest is not None and self.manifest.is_fresh(output):
+            self._replay_page(output, self.manifest.reuse(output))
+            print(f"  Skipping unchanged content page: {os.path.join(self.output_dir, output)}")
+        else:
+            self._render_content_page(src, renderer_key, ctx)
+        return True
 
-        link["href"] = prepend_baseurl(slug, baseurl=self.base_url)
-        if "text" not in link:
-            link["text"] = os.path.basename(slug).replace("-", " ").replace("_", " ").title()
+    def _content_output(self, src: str) -> str:
+        return os.path.normpath(f"{strip_suffixes(src, self._content_suffixes())}.html")
 
-        # Search indexing
-        if ctx.search_links:
-            self._add_search_item(
-                slug=link["href"],
-                url=link["href"],
-                title=link.get("text", ""),
-                description=link.get("description"),
-            )
+    def _render_content_page(self, src: str, renderer_key: str, ctx: NodeContext) -> None:
+        """Render a content page through its content renderer and write it."""
+        slug = strip_suffixes(src, self._content_suffixes())
+        target_html = os.path.join(self.output_dir, f"{slug}.html")
+        with self._record_page(os.path.relpath(target_html, self.output_dir), src):
+            with phase("render", renderer=renderer_key):
+                content = self.content_renderers[renderer_key](self, src, ctx)
 
-        return link
+            if content:
+                # Write the content page
+                os.makedirs(os.path.dirname(target_html) or ".", exist_ok=True)
+                with open(target_html, "w") as f:
+                    f.write(content)
+                print(f"  Writing content page: {target_html}")
 
     def _content_suffixes(self) -> list[str]:
         suffixes = [key for key in self.content_renderers if key.startswith(".")]
@@ -395,11 +545,12 @@ class Builder:
             print(f"  Warning: markdown file not found: {src}")
             return None
 
-        with open(src) as fh:
-            raw = fh.read()
+        raw = read_file(src)
 
         metadata_path = os.path.join(os.path.dirname(src), "page.yml")
         if not os.path.isfile(metadata_path):
+            # A page.yml created later must invalidate this page.
+            note_dependency(metadata_path)
             metadata_path = os.path.join(os.path.dirname(src), "metadata.yml")
         metadata = read_yaml(metadata_path) if os.path.isfile(metadata_path) else {}
         front_metadata, raw = split_yaml_front_matter(raw)
@@ -416,7 +567,7 @@ class Builder:
         )
 
         # Render content page using content-page renderer
-        renderer = resolve_renderer("content-page", jinja_env=self.jinja_env)
+        renderer = self.renderers.resolve("content-page")
         page_data = {
             "content": body_html,
             "metadata": metadata,
@@ -446,7 +597,7 @@ class Builder:
             print(f"  Warning: notebook conversion failed for {src}: {exc}")
             return None
 
-        renderer = resolve_renderer("content-page", jinja_env=self.jinja_env)
+        renderer = self.renderers.resolve("content-page")
         page_data = {
             "content": body_html,
             "metadata": {},
@@ -461,8 +612,7 @@ class Builder:
             nb_dir = os.path.dirname(src)
             nb_name = strip_suffixes(os.path.basename(src), [".ipynb"])
             page_data["colab"] = (
-                f"https://colab.research.google.com/github/"
-                f"{self.repo_full_name}/blob/master/{nb_dir}/{nb_name}.ipynb"
+                f"https://colab.research.google.com/github/{self.repo_full_name}/blob/master/{nb_dir}/{nb_name}.ipynb"
             )
         return renderer.render(page_data, ctx, self)
 
@@ -473,9 +623,7 @@ class Builder:
 
         if "text" not in link:
             link["text"] = (
-                index_data.get("title")
-                or index_data.get("header", {}).get("title")
-                or os.path.basename(index_file)
+                index_data.get("title") or index_data.get("header", {}).get("title") or os.path.basename(index_file)
             )
         if "description" not in link and "header" in index_data:
             desc = index_data["header"].get("description")
@@ -533,15 +681,23 @@ class Builder:
 
     def _add_search_item(self, slug: str, url: str, title: str, description: str | None = None):
         """Add an item to the search index."""
+        if self._walk is not None:
+            self._walk.append(("search", slug, url, title, description))
+            return
         if slug in self.search_entries:
             return
         entry = {"title": title, "url": url}
         if description:
             entry["description"] = description
         self.search_entries[slug] = entry
+        if self.manifest is not None:
+            self.manifest.note_search(slug, entry)
 
     def _add_search_content(self, slug: str, content: str, title: str | None = None):
         """Add content to an existing search entry."""
+        if self._walk is not None:
+            self._walk.append(("search_content", slug, str(content), title))
+            return
         if slug not in self.search_entries:
             self.search_entries[slug] = {"title": title or slug, "url": slug}
         existing = self.search_entries[slug].get("content", "")
@@ -549,7 +705,10 @@ class Builder:
         cleaned = re.sub(r"\s+", " ", cleaned).strip()
         if cleaned:
             self.search_entries[slug]["content"] = f"{existing} {cleaned}" if existing else cleaned
+        if self.manifest is not None:
+            self.manifest.note_search(slug, self.search_entries[slug])
 
+    @profiled("search-index")
     def save_search_json(self):
         """Write search.json to the output directory."""
         path = os.path.join(self.output_dir, "search.json")
@@ -566,28 +725,292 @@ class Builder:
             json.dump(items, f, indent=2)
         print(f"  Writing search index: {path}")
 
+    # ------------------------------------------------------------------
+    # Incremental builds
+    # ------------------------------------------------------------------
+
+    @contextlib.contextmanager
+    def _record_page(self, output: str, source: str, dependencies: dict[str, str] | None = None):
+        """Collect what *output* is built from into the graph and the manifest.
+
+        Yields the manifest record for the page, or ``None`` when
+        incremental builds are off.
+        """
+        record = self.manifest.push(source) if self.manifest is not None else None
+        try:
+            with phase("page", page=output), collect_dependencies() as collected:
+                yield record
+        finally:
+            if record is not None:
+                self.manifest.pop()
+        collected = {**(dependencies or {}), **collected, source: "source"}
+        self.graph.add_page(output, collected)
+        if record is not None:
+            self.manifest.store(output, record, collected)
+
+    def _replay_page(self, output: str, entry: dict) -> None:
+        """Re-apply the side effects of a page reused from the previous build."""
+        self.graph.add_page(output, entry.get("dependencies", {}))
+        for slug, item in entry.get("search", {}).items():
+            if self._walk is not None:
+                self._walk.append(("reuse", slug, item))
+            else:
+                self.search_entries.setdefault(slug, dict(item))
+        # The reused entry already lists its children, search entries and
+        # dependencies; record the replay into a scratch page so none of it
+        # is attributed to the page that linked here.
+        self.manifest.push(entry["source"])
+        try:
+            with collect_dependencies():
+                for child in entry.get("children", []):
+                    if child["kind"] == "index":
+                        self.build_page(child["src"])
+                        continue
+                    ctx = NodeContext(
+                        search_content=child.get("search_content", False),
+                        search_links=child.get("search_links", False),
+                        assets_src_dir=child.get("assets_src_dir"),
+                        assets_target_dir=child.get("assets_target_dir"),
+                    )
+                    self._process_content_link({"src": child["src"]}, ctx, kind=child["kind"])
+        finally:
+            self.manifest.pop()
+
+    def _site_fingerprint(self) -> str:
+        """Hash everything that affects every page: config, extensions, build options."""
+        root = self.root_data or {}
+        loader = self.jinja_env.loader
+        return digest_value(
+            {
+                "versions": extension_versions(),
+                "config": self.config,
+                "nav": root.get("nav"),
+                "footer": root.get("footer"),
+                "base_url": self.base_url,
+                "repo_full_name": self.repo_full_name,
+                "assets_dir": self.assets_dir,
+                "markdown_extensions": list(self.markdown_extensions),
+                "template_path": list(getattr(loader, "searchpath", [])),
+            }
+        )
+
+    def _loaded_templates(self) -> list[str]:
+        """Return the files of all templates compiled during this build."""
+        cache = self.jinja_env.cache
+        if cache is None:
+            return []
+        return [template.filename for template in cache.values() if template.filename]
+
+    # ------------------------------------------------------------------
+    # Parallel builds
+    # ------------------------------------------------------------------
+
+    def _render_task(self, task: PageTask) -> PageResult:
+        """Render a page inside a worker process, recording its walk."""
+        self._walk = []
+        mounts_before = len(self.extensions.asset_mounts)
+        if self.manifest is not None:
+            self.manifest.pages = {}
+        self.graph = DependencyGraph()
+        profiler = active_profiler()
+        spans_before = len(profiler.spans) if profiler is not None else 0
+
+        if task.kind == "index":
+            with self._record_page(self._index_output(task.src), task.src) as record:
+                data, ctx = self._load_index_page(task.src, is_root=False)
+                if record is not None:
+                    record.summary = _page_summary(data)
+                self._render_index_page(task.src, data, ctx)
+        else:
+            self._render_content_page(task.src, task.kind, task.ctx)
+
+        return PageResult(
+            walk=self._walk,
+            asset_mounts=self.extensions.asset_mounts[mounts_before:],
+            manifest_pages=self.manifest.pages if self.manifest is not None else {},
+            graph_pages=self.graph.pages,
+            spans=profiler.spans[spans_before:] if profiler is not None else [],
+        )
+
+    def _merge_page_result(self, result: PageResult) -> None:
+        """Merge a worker's side effects, apart from its walk."""
+        for mount in result.asset_mounts:
+            if mount not in self.extensions.asset_mounts:
+                self.extensions.asset_mounts.append(mount)
+        if self.manifest is not None:
+            self.manifest.pages.update(result.manifest_pages)
+        self.graph.update(result.graph_pages)
+        profiler = active_profiler()
+        if profiler is not None:
+            profiler.spans.extend(result.spans)
+
+    def _apply_walk(self, walk: list[tuple], output: str, render: Callable[[PageTask], PageResult]) -> None:
+        """Claim pages and index search entries from the walk of the page *output*, as a serial build would.
+
+        A walk lists what rendering a page did in order: ``search``,
+        ``search_content`` and ``reuse`` events add search entries, ``page``
+        and ``index`` events link to a content or sub-index page.  The first
+        link to a page claims it; its own walk (from *render*, or replayed
+        from the manifest) is applied before the linking page's walk
+        continues, so claims and the search index come out in serial order.
+        """
+        stack = [self._walk_frame(walk, output)]
+        while stack:
+            events, output, record = stack[-1]
+            event = next(events, None)
+            if event is None:
+                stack.pop()
+                if record is not None:
+                    self.manifest.pop()
+                    page = self.manifest.pages.get(output) if output is not None else None
+                    if page is not None:
+                        page.setdefault("search", {}).update(record.search)
+                continue
+            kind = event[0]
+            if kind == "search":
+                self._add_search_item(*event[1:])
+            elif kind == "search_content":
+                self._add_search_content(*event[1:])
+            elif kind == "reuse":
+                self.search_entries.setdefault(event[1], dict(event[2]))
+            else:
+                claimed = self._claim_walk_page(event, render)
+                if claimed is None:
+                    continue
+                if kind == "page" and event[4] is not None:
+                    # The link's own entry follows everything the linked page added.
+                    stack.append(self._walk_frame([("search", *event[4])], output))
+                stack.append(self._walk_frame(*claimed))
+
+    def _walk_frame(self, walk: list[tuple], output: str | None) -> tuple:
+        # Search entries are noted on the page whose walk added them;
+        # replayed pages (``output`` is None) already list theirs.
+        record = self.manifest.push(output or "") if self.manifest is not None else None
+        return iter(walk), output, record
+
+    def _claim_walk_page(
+        self, event: tuple, render: Callable[[PageTask], PageResult]
+    ) -> tuple[list[tuple], str | None] | None:
+        """Claim the page a walk *event* links to; return its walk and output (``None`` when reused)."""
+        src = event[1]
+        if src in self.processed_pages:
+            return None
+        self.processed_pages.add(src)
+        if event[0] == "page":
+            self._link_contexts[src] = event[3]
+        output = self._walk_output(event)
+        if self.manifest is not None and self.manifest.is_fresh(output):
+            entry = self.manifest.reuse(output)
+            if event[0] == "index":
+                summary = entry.get("summary", {})
+                if isinstance(summary.get("config"), dict):
+                    self.extensions.configure_page_extensions(summary["config"])
+                self._index_summaries[src] = summary
+            self._walk, walk = [], self._walk
+            try:
+                self._replay_page(output, entry)
+            finally:
+                self._walk, walk = walk, self._walk
+            if event[0] == "index":
+                print(f"Skipping unchanged page: {src}")
+            else:
+                print(f"  Skipping unchanged content page: {os.path.join(self.output_dir, output)}")
+            return walk, None
+
+        if event[0] == "index":
+            print(f"Processing page: {src}")
+        task = self._walk_task(event)
+        if task is None:
+            raise ValueError(f"No content renderer registered for '{src}' ({event[2]}).")
+        result = render(task)
+        self._merge_page_result(result)
+        return result.walk, output
+
+    def _walk_task(self, event: tuple) -> PageTask | None:
+        """Return the render task for the page a walk *event* links to, if it still needs one."""
+        if event[0] not in ("page", "index"):
+            return None
+        src = event[1]
+        if event[0] == "index":
+            return PageTask(kind="index", src=src, ctx=NodeContext())
+        renderer_key = self._content_renderer_key(src, event[2])
+        return None if renderer_key is None else PageTask(kind=renderer_key, src=src, ctx=event[3])
+
+    def _walk_pending(self, event: tuple) -> bool:
+        """Whether the page a walk *event* links to is unclaimed and cannot be reused."""
+        if event[1] in self.processed_pages:
+            return False
+        return self.manifest is None or not self.manifest.is_fresh(self._walk_output(event))
+
+    def _walk_output(self, event: tuple) -> str:
+        return self._index_output(event[1]) if event[0] == "index" else self._content_output(event[1])
+
     # ------------------------------------------------------------------
     # Top-level build
     # ------------------------------------------------------------------
 
     def build_page(self, index_file: str) -> dict:
         """Load and process an index file, writing the rendered HTML page."""
-        if index_file in self.processed_pages:
-            return read_yaml(index_file)
-
         # Ensure .yml extension
         if not index_file.endswith((".yml", ".yaml")):
             index_file = f"{index_file}.yml"
 
+        # The linking page shows this page's title, so it is a real input.
+        note_dependency(index_file, "index")
+        if self.manifest is not None:
+            self.manifest.note_child("index", index_file)
+        if self._walk is not None and self.root_data is not None:
+            self._walk.append(("index", index_file))
+            return self._index_summary(index_file)
+        if index_file in self.processed_pages:
+            return self._index_summary(index_file)
+
         if not os.path.isfile(index_file):
             raise FileNotFoundError(f"Index file not found: {index_file}")
 
         self._ensure_extensions_configured(index_file)
 
-        print(f"Processing page: {index_file}")
         self.processed_pages.add(index_file)
 
         is_root = self.root_data is None
+        output = self._index_output(index_file)
+
+        # The root page is always rendered: it establishes the config and
+        # the shared nav/footer every other page inherits.
+        if not is_root and self.manifest is not None and self.manifest.is_fresh(output):
+            entry = self.manifest.reuse(output)
+            summary = self._index_summaries[index_file] = entry.get("summary", {})
+            if isinstance(summary.get("config"), dict):
+                self.extensions.configure_page_extensions(summary["config"])
+            self._replay_page(output, entry)
+            print(f"Skipping unchanged page: {index_file}")
+            return summary
+
+        print(f"Processing page: {index_file}")
+        with self._record_page(output, index_file) as record:
+            data, ctx = self._load_index_page(index_file, is_root)
+            summary = self._index_summaries[index_file] = _page_summary(data)
+            if record is not None:
+                record.summary = summary
+            self._render_index_page(index_file, data, ctx)
+        return data
+
+    def _index_output(self, index_file: str) -> str:
+        return os.path.normpath(f"{strip_suffixes(index_file, ['.yml', '.yaml'])}.html")
+
+    def _index_summary(self, index_file: str) -> dict:
+        """Return what a link shows of *index_file* without building it."""
+        summary = self._index_summaries.get(index_file)
+        if summary is None:
+            if not os.path.isfile(index_file):
+                raise FileNotFoundError(f"Index file not found: {index_file}")
+            # Resolving for the link text is not an input of the linking page.
+            with collect_dependencies():
+                summary = self._index_summaries[index_file] = _page_summary(load_and_resolve(index_file))
+        return dict(summary)
+
+    def _load_index_page(self, index_file: str, is_root: bool) -> tuple[dict, NodeContext]:
+        """Resolve an index page and build its root rendering context."""
         data = load_and_resolve(index_file)
         assert isinstance(data, dict), f"Index file must be a YAML mapping, got {type(data)}"
         if not is_root and isinstance(data.get("config"), dict):
@@ -596,11 +1019,11 @@ class Builder:
         # Process config on root page
         if is_root:
             self.config = self.extensions.apply_config(data.get("config", {}))
-            self.config_defaults = self.config.get("defaults", {})
             search_cfg = self.config.get("search", False)
             if isinstance(search_cfg, bool):
                 search_cfg = {"content": search_cfg, "links": search_cfg}
             self.config["search"] = search_cfg
+            self.config_defaults = self.config.get("defaults", {})
             data["config"] = self.config
 
         # Build context
@@ -618,20 +1041,37 @@ class Builder:
         )
 
         if is_root:
+            # Set root_data before rendering so sub-pages generated while
+            # rendering the root can inherit global nav/footer/config.
             self.root_data = data
+            if self.manifest is not None:
+                self.manifest.fingerprint = self._site_fingerprint()
+
+        return data, ctx
 
-        # Render the page. Set root_data first so sub-pages generated while
-        # rendering the root can inherit global nav/footer/config.
+    def _render_index_page(self, index_file: str, data: dict, ctx: NodeContext) -> None:
+        """Render a resolved index page and write its HTML."""
         html = self.process_node(data, ctx)
 
         # Write HTML
+        slug = strip_suffixes(index_file, [".yml", ".yaml"])
         target_html = os.path.join(self.output_dir, f"{slug}.html")
         os.makedirs(os.path.dirname(target_html) or ".", exist_ok=True)
         with open(target_html, "w") as f:
             f.write(html)
         print(f"  Writing page: {target_html}")
 
-        return data
+    def precompile(self, index_file: str = "index.yml") -> tuple[list[str], list[str]]:
+        """Compile every template the build can use into the bytecode cache.
+
+        Configures extensions first so their template directories are on the
+        search path.  Returns the compiled and the failed template names.
+        """
+        self._ensure_extensions_configured(index_file)
+        exclude = [os.path.relpath(self.output_dir, self.templates_dir)]
+        if self.cache_dir:
+            exclude.append(os.path.relpath(self.cache_dir, self.templates_dir))
+        return precompile_templates(self.jinja_env, exclude=tuple(exclude))
 
     def build(self, index_file: str = "index.yml"):
         """Full site build — entry point.
@@ -639,37 +1079,101 @@ class Builder:
         Builds the root page (which recursively builds sub-pages),
         copies assets, and writes the search index.
         """
-        self._ensure_extensions_configured(index_file)
-
-        # Copy user static files
-        self.files.merge_dirs(".", self.output_dir, allow_list=["favicon.ico", "CNAME", "assets"])
-
-        # Copy assets from enabled extensions.
-        self._copy_extension_assets()
-
-        self.extensions.run_hooks("before_build", index_file=index_file)
-
-        # Build root page
-        self.build_page(index_file)
-
-        # Page-local extensions may register additional assets while pages render.
-        self._copy_extension_assets()
-
-        self.extensions.run_hooks("after_build", index_file=index_file)
-
+        # Parse every YAML file (shared patches, page.yml, …) once, and
+        # read the git history once per build.
+        with cache_yaml(self.yaml_cache), cache_git_metadata(), using_highlight_cache(self.highlight_cache):
+            self._ensure_extensions_configured(index_file)
+            self.files.reset()
+            if self.manifest is not None:
+                self.manifest.load()
+
+            # Copy user static files
+            self.files.merge_dirs(".", self.output_dir, allow_list=["favicon.ico", "CNAME", "assets"])
+
+            # Copy assets from enabled extensions.
+            self._copy_extension_assets()
+
+            self.extensions.run_hooks("before_build", index_file=index_file)
+
+            # Build root page. With several jobs, the pages it links to are
+            # recorded in its walk and rendered across a process pool.
+            parallel = self.jobs > 1 and fork_available()
+            if self.jobs > 1 and not parallel:
+                print("  Warning: parallel builds need the 'fork' start method; building serially.")
+            self._walk = [] if parallel else None
+            try:
+                self.build_page(index_file)
+                walk = self._walk
+            finally:
+                self._walk = None
+            if walk:
+                root = index_file if index_file.endswith((".yml", ".yaml")) else f"{index_file}.yml"
+                render_parallel(self, walk, self._index_output(root), self.jobs)
+
+            # Page-local extensions may register additional assets while pages render.
+            self._copy_extension_assets()
+
+            self.extensions.run_hooks("after_build", index_file=index_file)
+
+            if self.manifest is not None:
+                self.manifest.save(templates=self._loaded_templates())
         print(f"\nBuild complete! Output: {self.output_dir}/")
 
+    def reset(self) -> None:
+        """Forget the pages built so far, keeping extensions and templates warm."""
+        self.processed_pages = set()
+        self.search_entries = {}
+        self.root_data = None
+        self.graph = DependencyGraph()
+        self._index_summaries = {}
+        self._link_contexts = {}
 
-def _deep_merge(base: Any, override: Any) -> Any:
-    """Recursively merge mappings, with override values winning."""
-    if isinstance(base, dict) and isinstance(override, dict):
-        result = copy.deepcopy(base)
-        for key, value in override.items():
-            result[key] = _deep_merge(result.get(key), value)
-        return result
-    if override is None:
-        return copy.deepcopy(base)
-    return copy.deepcopy(override)
+    def rebuild_pages(self, outputs: list[str], changed: list[str], index_file: str = "index.yml") -> None:
+        """Re-render already generated pages in place after *changed* files were edited.
+
+        Reuses the configured builder (Jinja environment, extensions, root
+        data); *outputs* are output paths as recorded in :attr:`graph`.
+        """
+        with cache_yaml(self.yaml_cache), cache_git_metadata(), using_highlight_cache(self.highlight_cache):
+            self.files.reset()
+            # A renderer template may have been added since the last build.
+            self.renderers.invalidate()
+            if self.manifest is not None:
+                self.manifest.invalidate(changed)
+            for output in outputs:
+                src = self.graph.source_of(output)
+                if src is None or not os.path.isfile(src):
+                    continue
+                self.processed_pages.discard(src)
+                if src.endswith((".yml", ".yaml")):
+                    self.build_page(src)
+                    continue
+                renderer_key = self._content_renderer_key(src)
+                if renderer_key is None:
+                    continue
+                # Render with the context of the link that first built the page.
+                ctx = self._link_contexts.get(src) or NodeContext(
+                    assets_src_dir=os.path.dirname(src) or ".", assets_target_dir=self.assets_dir
+                )
+                self._process_content_link({"src": src}, ctx, kind=renderer_key)
+
+            self._copy_extension_assets()
+            self.extensions.run_hooks("after_build", index_file=index_file)
+            if self.manifest is not None:
+                self.manifest.save(templates=self._loaded_templates())
+
+
+def _page_summary(data: dict) -> dict:
+    """Keep what a parent link and page-local extensions need from a page."""
+    summary: dict[str, Any] = {}
+    if isinstance(data.get("title"), str):
+        summary["title"] = data["title"]
+    header = data.get("header")
+    if isinstance(header, dict):
+        summary["header"] = {key: header[key] for key in ("title", "description") if isinstance(header.get(key), str)}
+    if isinstance(data.get("config"), dict):
+        summary["config"] = data["config"]
+    return summary
 
 
 def _normalize_page_nav_value(value: str, suffixes: list[str]) -> str:
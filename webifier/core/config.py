@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable
+from typing import Any, NoReturn
+
+
+def _immutable(self, *args, **kwargs) -> NoReturn:
+    raise TypeError(f"{type(self).__name__} is immutable; copy it with dict()/list() to change it.")
+
+
+class FrozenDict(dict):
+    """A read-only, hashable ``dict``.
+
+    Still a ``dict`` (``isinstance`` checks, JSON, Jinja and ``dict(...)``
+    copies keep working), but every mutator raises ``TypeError``.  Copying
+    returns the object itself, so frozen subtrees are shared, not duplicated.
+    """
+
+    __slots__ = ("_hash",)
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    def __copy__(self) -> FrozenDict:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> FrozenDict:
+        return self
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(list):
+    """A read-only, hashable ``list``; see :class:`FrozenDict`."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(tuple(self))
+
+    def __copy__(self) -> FrozenList:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> FrozenList:
+        return self
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+def freeze(value: Any) -> Any:
+    """Return *value* with every dict and list replaced by its frozen counterpart.
+
+    Already frozen values are returned as they are.
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def merge(base: Any, override: Any) -> Any:
+    """Deep-merge *override* into *base* without modifying either; the result is frozen.
+
+    Mappings merge key by key, ``None`` keeps *base*, anything else replaces
+    it.  Subtrees the override does not touch are shared with *base*.
+    """
+    return _merge(base, override, freeze, FrozenDict)
+
+
+def deep_merge(base: Any, override: Any) -> Any:
+    """Like :func:`merge`, but the result is a mutable tree owning its values.
+
+    Every node of either input is copied at most once (frozen subtrees are
+    thawed), so the cost is linear in the size of the inputs.
+    """
+    return _merge(base, override, thaw, dict)
+
+
+def _merge(base: Any, override: Any, leaf: Callable[[Any], Any], mapping: type[dict]) -> Any:
+    if isinstance(base, dict) and isinstance(override, dict):
+        result = {}
+        for key, value in base.items():
+            result[key] = _merge(value, override[key], leaf, mapping) if key in override else leaf(value)
+        for key, value in override.items():
+            if key not in base:
+                result[key] = leaf(value)
+        return result if mapping is dict else mapping(result)
+    return leaf(base if override is None else override)
+
+
+def thaw(value: Any) -> Any:
+    """Return a mutable deep copy of *value*, frozen subtrees included; scalars are shared."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    return copy.deepcopy(value)
+
+
+__all__ = ["FrozenDict", "FrozenList", "deep_merge", "freeze", "merge", "thaw"]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from importlib import metadata
+
+ENTRY_POINT_GROUP = "webifier.extensions"
+_DISTRIBUTION_SUFFIXES = (".dist-info", ".egg-info", ".egg-link", ".pth")
+_METADATA_SUFFIXES = (".dist-info", ".egg-info")
+
+
+def environment_fingerprint() -> str:
+    """Hash of ``sys.path`` and the distributions installed on it.
+
+    Installing, upgrading or removing a package adds, renames or rewrites a
+    ``*.dist-info`` directory, which changes the fingerprint; so does
+    rewriting a distribution's ``entry_points.txt`` in place, as reinstalling
+    an editable package can.  Only directory listings and stats are needed,
+    no metadata is read.
+    """
+    digest = hashlib.sha1(sys.version.encode())
+    for path in sys.path:
+        digest.update(b"\0" + os.fsencode(path))
+        try:
+            entries = sorted(os.scandir(path or "."), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.endswith(_DISTRIBUTION_SUFFIXES):
+                digest.update(f"\0{entry.name}:{_mtime(entry.path)}".encode())
+                if entry.name.endswith(_METADATA_SUFFIXES):
+                    digest.update(f":{_mtime(os.path.join(entry.path, 'entry_points.txt'))}".encode())
+    return digest.hexdigest()
+
+
+def _mtime(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def discover_entry_points(cache_dir: str | None = None, refresh: bool = False) -> dict[str, metadata.EntryPoint]:
+    """Return the ``webifier.extensions`` entry points by name, without loading them.
+
+    With *cache_dir*, the names and targets are kept in a JSON file keyed by
+    :func:`environment_fingerprint`, so later runs in the same environment
+    skip scanning every distribution's metadata.  *refresh* ignores the
+    cached list and scans again, replacing it.
+    """
+    cache_path = None
+    if cache_dir:
+        cache_path = os.path.join(cache_dir, "extensions", f"{environment_fingerprint()}.json")
+    if cache_path and not refresh:
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                return {name: _entry_point(name, value) for name, value in json.load(f).items()}
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        selected = entry_points.select(group=ENTRY_POINT_GROUP)
+    else:
+        selected = entry_points.get(ENTRY_POINT_GROUP, [])
+    found = {ep.name: ep for ep in selected}
+
+    if cache_path:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump({name: ep.value for name, ep in found.items()}, f)
+        except OSError:
+            pass
+    return found
+
+
+def _entry_point(name: str, value: str) -> metadata.EntryPoint:
+    return metadata.EntryPoint(name=name, value=value, group=ENTRY_POINT_GROUP)
+
+
+__all__ = ["ENTRY_POINT_GROUP", "discover_entry_points", "environment_fingerprint"]
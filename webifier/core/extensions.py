@@ -11,10 +11,14 @@ from typing import TYPE_CHECKING, Any
 
 import jinja2
 
+from webifier.interface.profiling import phase, profiled
 from webifier.interface.resolvers import register_resolver
 
 from .base import RendererModule, register_renderer
+from .config import FrozenDict, deep_merge, freeze, thaw
+from .discovery import discover_entry_points
 from .loader import register_format
+from .templates import default_cache_dir
 
 if TYPE_CHECKING:
     from .builder import Builder
@@ -55,8 +59,7 @@ class ExtensionManifest:
         for dependency in self.dependencies:
             if dependency not in ctx.manager.enabled_extension_ids:
                 raise ValueError(
-                    f"Extension '{self.id}' requires '{dependency}'. "
-                    f"Enable it before instance '{ctx.instance_name}'."
+                    f"Extension '{self.id}' requires '{dependency}'. Enable it before instance '{ctx.instance_name}'."
                 )
 
         for template_dir in self.template_dirs:
@@ -152,12 +155,42 @@ class ExtensionHookContext:
     instance_config: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class _CallAdapter:
+    """Calls a hook with only the keyword arguments its signature accepts.
+
+    The signature is inspected once, when the hook is registered.
+    """
+
+    fn: Callable
+    accepts: frozenset[str] | None  # None: the callable takes **kwargs, pass everything
+
+    @classmethod
+    def wrap(cls, fn: Callable) -> _CallAdapter:
+        try:
+            params = inspect.signature(fn).parameters
+        except (TypeError, ValueError):
+            return cls(fn, None)
+        if any(param.kind == inspect.Parameter.VAR_KEYWORD for param in params.values()):
+            return cls(fn, None)
+        return cls(fn, frozenset(params) - {"builder"})
+
+    def wants(self, name: str) -> bool:
+        return self.accepts is None or name in self.accepts
+
+    def __call__(self, builder: Builder, kwargs: dict[str, Any]):
+        if self.accepts is None:
+            return self.fn(builder, **kwargs)
+        return self.fn(builder, **{key: kwargs[key] for key in self.accepts if key in kwargs})
+
+
 @dataclass(frozen=True)
 class RegisteredHook:
     callback: Hook
     extension_id: str
     instance_name: str
     instance_config: dict[str, Any]
+    adapter: _CallAdapter
 
 
 @dataclass(frozen=True)
@@ -167,6 +200,7 @@ class RegisteredPageKeyConsumer:
     extension_id: str
     instance_name: str
     instance_config: dict[str, Any]
+    adapter: _CallAdapter
 
 
 class ExtensionContext:
@@ -199,11 +233,10 @@ class ExtensionContext:
             return
         if template_dir not in loader.searchpath:
             loader.searchpath.append(template_dir)
+            self.builder.renderers.invalidate()
 
     def add_asset_dir(self, source: str, target: str) -> None:
-        self.manager.asset_mounts.append(
-            AssetMount(source=source, target=target.format(instance=self.instance_name))
-        )
+        self.manager.asset_mounts.append(AssetMount(source=source, target=target.format(instance=self.instance_name)))
 
     def register_renderer(self, name: str, renderer: str | type[RendererModule]) -> None:
         register_renderer(name, renderer, override=self.override)
@@ -231,7 +264,8 @@ class ExtensionContext:
             callback=target,
             extension_id=self.extension.id,
             instance_name=self.instance_name,
-            instance_config=copy.deepcopy(self.config),
+            instance_config=freeze(self.config),
+            adapter=_CallAdapter.wrap(target),
         )
 
     def register_resolver(self, name: str, resolver: str | Callable) -> None:
@@ -241,12 +275,14 @@ class ExtensionContext:
         register_format(extension, self._import_object(loader))
 
     def add_hook(self, area: str, hook: str | Hook) -> None:
+        callback = self._import_object(hook)
         self.manager.hooks[area].append(
             RegisteredHook(
-                callback=self._import_object(hook),
+                callback=callback,
                 extension_id=self.extension.id,
                 instance_name=self.instance_name,
-                instance_config=copy.deepcopy(self.config),
+                instance_config=freeze(self.config),
+                adapter=_CallAdapter.wrap(callback),
             )
         )
 
@@ -256,7 +292,7 @@ class ExtensionManager:
 
     def __init__(self, builder: Builder) -> None:
         self.builder = builder
-        self.available: dict[str, type[Extension] | Extension] = {}
+        self.available: dict[str, type[Extension] | Extension | metadata.EntryPoint] = {}
         self.instances: list[ExtensionInstance] = []
         self.instances_by_name: dict[str, ExtensionInstance] = {}
         self.enabled_instance_names: set[str] = set()
@@ -266,16 +302,17 @@ class ExtensionManager:
         self.asset_mounts: list[AssetMount] = []
         self.hooks: dict[str, list[RegisteredHook]] = defaultdict(list)
         self.page_key_consumers: dict[str, RegisteredPageKeyConsumer] = {}
+        # Loaded extensions and their manifests, per extension id.
+        self._extensions: dict[str, Extension] = {}
+        self._manifests: dict[str, ExtensionManifest] = {}
 
     def configure(self, config: dict[str, Any]) -> None:
         """Configure extension instances from a root site config."""
         self.available = self.discover()
         for instance in self._parse_instances(config):
             self._register_instance(instance)
-            self.config_overlays[instance.name] = _deep_merge(
-                self.config_overlays.get(instance.name, {}),
-                copy.deepcopy(instance.config),
-            )
+            overlay = self.config_overlays.get(instance.name, {})
+            self.config_overlays[instance.name] = deep_merge(overlay, instance.config)
 
     def configure_page_extensions(self, config: dict[str, Any]) -> None:
         """Register page-local extension instances before rendering that page."""
@@ -286,36 +323,37 @@ class ExtensionManager:
                 continue
             self._register_instance(instance)
 
-    def discover(self) -> dict[str, type[Extension] | Extension]:
-        """Discover installed extension classes."""
-        found: dict[str, type[Extension] | Extension] = {}
-
+    @profiled("discovery")
+    def discover(self) -> dict[str, Any]:
+        """Discover installed extensions.
+
+        Entry points are returned unloaded; :meth:`_load` imports a provider
+        only once a ``uses:`` value names it.  The list is cached between
+        builds when the builder's ``extension_cache`` is set.
+        """
+        cache_dir = None
+        if self.builder.extension_cache:
+            cache_dir = self.builder.cache_dir or default_cache_dir()
         try:
-            entry_points = metadata.entry_points()
-            if hasattr(entry_points, "select"):
-                selected = entry_points.select(group="webifier.extensions")
-            else:
-                selected = entry_points.get("webifier.extensions", [])
-            for ep in selected:
-                found[ep.name] = ep.load()
+            found = discover_entry_points(cache_dir, refresh=self.builder.refresh_extensions)
         except Exception:
-            pass
+            found = {}
+        return found or self._registry_extensions()
 
+    @staticmethod
+    def _registry_extensions() -> dict[str, type[Extension] | Extension]:
         # Editable/local development fallback when the package is on sys.path.
         try:
             registry = importlib.import_module("webifier_extensions.registry")
-            for extension_id, factory in registry.EXTENSIONS.items():
-                found.setdefault(extension_id, factory)
+            return dict(registry.EXTENSIONS)
         except Exception:
-            pass
-
-        return found
+            return {}
 
     def apply_config(self, config: dict[str, Any]) -> dict[str, Any]:
         """Merge extension defaults and exported instance config into site config."""
-        merged = _deep_merge(copy.deepcopy(self.config_defaults), copy.deepcopy(config))
+        merged = deep_merge(self.config_defaults, config)
         for key, value in self.config_overlays.items():
-            merged[key] = _deep_merge(copy.deepcopy(value), copy.deepcopy(merged.get(key, {})))
+            merged[key] = deep_merge(value, merged.get(key, {}))
         return merged
 
     def page_config_overlays(self, config: dict[str, Any]) -> list[tuple[str, dict[str, Any], bool]]:
@@ -324,12 +362,8 @@ class ExtensionManager:
             self.available = self.discover()
         overlays = []
         for instance in self._parse_instances(config):
-            extension = self._load(instance.uses)
-            manifest = extension.manifest()
-            merged_instance_config = _deep_merge(
-                copy.deepcopy(manifest.default_config),
-                copy.deepcopy(instance.config),
-            )
+            manifest = self._manifest(instance.uses)
+            merged_instance_config = deep_merge(manifest.default_config, instance.config)
             overlays.append((instance.name, merged_instance_config, instance.reset))
         return overlays
 
@@ -357,23 +391,16 @@ class ExtensionManager:
         """Let extensions consume page-level keys before section rendering."""
         if not self.page_key_consumers:
             return data
-        config = config or self.builder.config
+        # Extension code gets mutable copies; frozen configs stay internal.
+        config = thaw(config) if config else self.builder.config
         remaining = dict(data)
         for key in list(data):
             consumer = self.page_key_consumers.get(key)
             if consumer is None:
                 continue
-            value = remaining.pop(key, data[key])
-            consumer_context = ExtensionHookContext(
-                area="page_key",
-                builder=self.builder,
-                config=config,
-                page=remaining,
-                ctx=ctx,
-                extension_id=consumer.extension_id,
-                instance_name=consumer.instance_name,
-                instance_config=copy.deepcopy(consumer.instance_config),
-            )
+            # The page tree is shared with the caller; consumers get their own value.
+            value = copy.deepcopy(remaining.pop(key, data[key]))
+            instance_config = thaw(consumer.instance_config)
             call_kwargs = {
                 "key": key,
                 "value": value,
@@ -381,12 +408,23 @@ class ExtensionManager:
                 "page": remaining,
                 "config": config,
                 "ctx": ctx,
-                "hook_context": consumer_context,
                 "extension_id": consumer.extension_id,
                 "instance_name": consumer.instance_name,
-                "instance_config": copy.deepcopy(consumer.instance_config),
+                "instance_config": instance_config,
             }
-            result = _call_with_supported_kwargs(consumer.callback, self.builder, call_kwargs)
+            if consumer.adapter.wants("hook_context"):
+                call_kwargs["hook_context"] = ExtensionHookContext(
+                    area="page_key",
+                    builder=self.builder,
+                    config=config,
+                    page=remaining,
+                    ctx=ctx,
+                    extension_id=consumer.extension_id,
+                    instance_name=consumer.instance_name,
+                    instance_config=instance_config,
+                )
+            with phase(f"page_key:{key}", extension=consumer.instance_name):
+                result = consumer.adapter(self.builder, call_kwargs)
             if result is not None:
                 extension_data = remaining.setdefault("_extension_data", {})
                 if isinstance(extension_data, dict):
@@ -397,31 +435,42 @@ class ExtensionManager:
         config = kwargs.get("config")
         if config is None:
             config = self.builder.config
+        elif isinstance(config, FrozenDict):
+            config = thaw(config)
+        instance_config = thaw(hook.instance_config)
         page = kwargs.get("page") or kwargs.get("data")
-        hook_context = ExtensionHookContext(
-            area=area,
-            builder=self.builder,
-            config=config,
-            page=page,
-            ctx=kwargs.get("ctx"),
-            extension_id=hook.extension_id,
-            instance_name=hook.instance_name,
-            instance_config=copy.deepcopy(hook.instance_config),
-        )
         call_kwargs = {
             **kwargs,
             "area": area,
             "config": config,
             "page": page,
-            "hook_context": hook_context,
             "extension_id": hook.extension_id,
             "instance_name": hook.instance_name,
-            "instance_config": copy.deepcopy(hook.instance_config),
+            "instance_config": instance_config,
         }
-        return _call_with_supported_kwargs(hook.callback, self.builder, call_kwargs)
+        if hook.adapter.wants("hook_context"):
+            call_kwargs["hook_context"] = ExtensionHookContext(
+                area=area,
+                builder=self.builder,
+                config=config,
+                page=page,
+                ctx=kwargs.get("ctx"),
+                extension_id=hook.extension_id,
+                instance_name=hook.instance_name,
+                instance_config=instance_config,
+            )
+        with phase(f"hook:{area}", extension=hook.instance_name):
+            return hook.adapter(self.builder, call_kwargs)
 
     def _load(self, extension_id: str) -> Extension:
+        extension = self._extensions.get(extension_id)
+        if extension is not None:
+            return extension
         provider = self.available.get(extension_id)
+        if provider is None:
+            provider = self._registry_extensions().get(extension_id)
+        if isinstance(provider, metadata.EntryPoint):
+            provider = provider.load()
         if provider is None:
             available = ", ".join(sorted(self.available)) or "none"
             raise ValueError(
@@ -433,17 +482,23 @@ class ExtensionManager:
         elif inspect.isclass(provider) and issubclass(provider, Extension):
             extension = provider()
         else:
-            raise TypeError(
-                f"Extension '{extension_id}' must expose an Extension subclass or instance."
-            )
-        declared_id = extension.manifest().id
-        if declared_id != extension_id:
+            raise TypeError(f"Extension '{extension_id}' must expose an Extension subclass or instance.")
+        manifest = extension.manifest()
+        if manifest.id != extension_id:
             raise ValueError(
-                f"Extension entry '{extension_id}' declares id '{declared_id}'. "
+                f"Extension entry '{extension_id}' declares id '{manifest.id}'. "
                 "The entry point name, registry key, and extension id must match."
             )
+        self._extensions[extension_id] = extension
+        self._manifests[extension_id] = manifest
         return extension
 
+    def _manifest(self, extension_id: str) -> ExtensionManifest:
+        """The manifest of an extension, built once per manager."""
+        if extension_id not in self._manifests:
+            self._load(extension_id)
+        return self._manifests[extension_id]
+
     def _parse_instances(self, config: dict[str, Any]) -> list[ExtensionInstance]:
         webifier_cfg = config.get("webifier", {}) if isinstance(config, dict) else {}
         raw = webifier_cfg.get("extensions", {}) if isinstance(webifier_cfg, dict) else {}
@@ -486,19 +541,15 @@ class ExtensionManager:
 
     def _register_instance(self, instance: ExtensionInstance) -> ExtensionManifest:
         extension = self._load(instance.uses)
-        manifest = extension.manifest()
-        merged_instance_config = _deep_merge(
-            copy.deepcopy(manifest.default_config),
-            copy.deepcopy(instance.config),
-        )
+        manifest = self._manifest(instance.uses)
+        merged_instance_config = deep_merge(manifest.default_config, instance.config)
         instance.config.clear()
         instance.config.update(merged_instance_config)
 
         for dependency in manifest.dependencies:
             if dependency not in self.enabled_extension_ids:
                 raise ValueError(
-                    f"Extension '{manifest.id}' requires '{dependency}'. "
-                    f"Enable it before instance '{instance.name}'."
+                    f"Extension '{manifest.id}' requires '{dependency}'. Enable it before instance '{instance.name}'."
                 )
 
         ctx = ExtensionContext(manager=self, extension=manifest, instance=instance)
@@ -507,22 +558,10 @@ class ExtensionManager:
         self.instances_by_name[instance.name] = copy.deepcopy(instance)
         self.enabled_instance_names.add(instance.name)
         self.enabled_extension_ids.add(manifest.id)
-        self.config_defaults = _deep_merge(self.config_defaults, manifest.config_defaults)
+        self.config_defaults = deep_merge(self.config_defaults, manifest.config_defaults)
         return manifest
 
 
-def _deep_merge(base: Any, override: Any) -> Any:
-    """Recursively merge mappings, with override values winning."""
-    if isinstance(base, dict) and isinstance(override, dict):
-        result = copy.deepcopy(base)
-        for key, value in override.items():
-            result[key] = _deep_merge(result.get(key), value)
-        return result
-    if override is None:
-        return copy.deepcopy(base)
-    return copy.deepcopy(override)
-
-
 __all__ = [
     "AssetMount",
     "Extension",
@@ -532,21 +571,3 @@ __all__ = [
     "ExtensionManifest",
     "ExtensionManager",
 ]
-
-
-def _call_with_supported_kwargs(fn: Callable, builder: Builder, kwargs: dict[str, Any]):
-    """Call a hook, filtering kwargs for simple hook signatures."""
-    try:
-        signature = inspect.signature(fn)
-    except (TypeError, ValueError):
-        return fn(builder, **kwargs)
-    params = signature.parameters
-    if any(param.kind == inspect.Parameter.VAR_KEYWORD for param in params.values()):
-        return fn(builder, **kwargs)
-
-    supported = {
-        key: value
-        for key, value in kwargs.items()
-        if key in params and key != "builder"
-    }
-    return fn(builder, **supported)
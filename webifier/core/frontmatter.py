@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-import yaml
+from webifier.interface.io import safe_load_yaml
 
 
 def split_yaml_front_matter(raw: str) -> tuple[dict[str, Any], str]:
@@ -19,7 +19,7 @@ def split_yaml_front_matter(raw: str) -> tuple[dict[str, Any], str]:
     if closing_index is None:
         return {}, raw
 
-    metadata = yaml.safe_load("".join(lines[1:closing_index])) or {}
+    metadata = safe_load_yaml("".join(lines[1:closing_index])) or {}
     if not isinstance(metadata, dict):
         raise TypeError("YAML front matter must be a mapping.")
     return metadata, "".join(lines[closing_index + 1 :])
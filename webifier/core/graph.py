@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import os
+from collections import Counter
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from typing import Any
+
+#: Edge kinds that make a page's output depend on the target.  ``link``
+#: edges point at other generated pages and do not.
+LINK_KIND = "link"
+
+
+class DependencyGraph:
+    """Build-wide graph from generated pages to everything they depend on.
+
+    Every page built records an edge to each file it read, labelled with
+    how the file was used: ``source``, ``patch``, ``load``, ``glob``,
+    ``asset``, ``template``, ``index`` (a sub-index whose title the page
+    shows), or ``link`` (another generated page it links to).
+    """
+
+    def __init__(self) -> None:
+        self.pages: dict[str, dict[str, str]] = {}
+
+    def add_page(self, output: str, dependencies: dict[str, str]) -> None:
+        """Record (or replace) the dependencies of the page written to *output*."""
+        self.pages[output] = {_normalize(path): kind for path, kind in dependencies.items()}
+
+    def update(self, other: DependencyGraph | dict[str, dict[str, str]]) -> None:
+        """Merge the pages of *other* (e.g. a worker's graph) into this graph."""
+        pages = other.pages if isinstance(other, DependencyGraph) else other
+        for output, edges in pages.items():
+            self.add_page(output, edges)
+
+    # -- queries -----------------------------------------------------------
+
+    def source_of(self, output: str) -> str | None:
+        """Return the source file *output* was generated from."""
+        for path, kind in self.pages.get(output, {}).items():
+            if kind == "source":
+                return path
+        return None
+
+    def affected_pages(self, path: str) -> list[str]:
+        """Return the pages that must be rebuilt when *path* changes.
+
+        ``glob:<pattern>`` edges match any path the pattern covers, so a file
+        added to a globbed directory rebuilds the pages that list it.
+        """
+        path = _normalize(path)
+        return sorted(
+            output
+            for output, edges in self.pages.items()
+            if edges.get(path, LINK_KIND) != LINK_KIND
+            or any(
+                kind != LINK_KIND and dependency.startswith("glob:") and _glob_matches(dependency[5:], path)
+                for dependency, kind in edges.items()
+            )
+        )
+
+    def fan_in(self, limit: int | None = None) -> list[tuple[str, int]]:
+        """Return dependencies sorted by how many pages depend on them."""
+        counts = Counter(path for edges in self.pages.values() for path, kind in edges.items() if kind != LINK_KIND)
+        return counts.most_common(limit)
+
+    # -- serialization -----------------------------------------------------
+
+    def to_json(self) -> dict[str, Any]:
+        return {"pages": {output: dict(sorted(edges.items())) for output, edges in sorted(self.pages.items())}}
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> DependencyGraph:
+        graph = cls()
+        graph.update(data.get("pages", {}))
+        return graph
+
+    def dumps(self) -> str:
+        return json.dumps(self.to_json(), indent=2)
+
+    def to_dot(self) -> str:
+        """Render the graph in Graphviz DOT format."""
+        lines = ["digraph webifier {", "  rankdir=LR;"]
+        for output, edges in sorted(self.pages.items()):
+            lines.append(f"  {json.dumps(output)} [shape=box];")
+            for path, kind in sorted(edges.items()):
+                lines.append(f"  {json.dumps(output)} -> {json.dumps(path)} [label={json.dumps(kind)}];")
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+
+def _normalize(path: str) -> str:
+    if path.startswith("glob:"):
+        return path
+    return os.path.normpath(path)
+
+
+@lru_cache(maxsize=1024)
+def _glob_parts(pattern: str) -> tuple[str, ...]:
+    return tuple(part for part in os.path.normpath(pattern).split(os.sep) if part)
+
+
+def _glob_matches(pattern: str, path: str) -> bool:
+    """Whether ``glob.glob(pattern, recursive=True)`` would return *path*."""
+    return _match_parts(_glob_parts(pattern), tuple(part for part in path.split(os.sep) if part))
+
+
+def _match_parts(pattern: tuple[str, ...], parts: tuple[str, ...]) -> bool:
+    if not pattern:
+        return not parts
+    head = pattern[0]
+    if head == "**":
+        return any(
+            _match_parts(pattern[1:], parts[i:])
+            for i in range(len(parts) + 1)
+            if not any(part.startswith(".") for part in parts[:i])
+        )
+    if not parts:
+        return False
+    # Like glob, wildcards do not match a leading dot.
+    if parts[0].startswith(".") and not head.startswith("."):
+        return False
+    return fnmatchcase(parts[0], head) and _match_parts(pattern[1:], parts[1:])
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterator
+from typing import Any
+
+import pygments
+from markdown.extensions import codehilite
+
+
+class HighlightCache:
+    """Pygments output stored on disk, keyed by code, lexer and formatter options.
+
+    Entries live in *directory* (one file per highlighted block, sharded by
+    key prefix) so they survive between builds, e.g. as a CI cache.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, code: str, lexer: Any, formatter: Any) -> str:
+        payload = json.dumps(
+            [
+                pygments.__version__,
+                f"{type(lexer).__module__}.{type(lexer).__qualname__}",
+                getattr(lexer, "options", {}),
+                f"{type(formatter).__module__}.{type(formatter).__qualname__}",
+                getattr(formatter, "options", {}),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.sha256(payload.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(code.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.html")
+
+    def get(self, key: str) -> str | None:
+        try:
+            with open(self._path(key), encoding="utf-8") as fh:
+                html = fh.read()
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return html
+
+    def put(self, key: str, html: str) -> None:
+        path = self._path(key)
+        tmp = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write then rename, so parallel workers never read a partial entry.
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(html)
+            os.replace(tmp, path)
+        except OSError:
+            # An unwritable cache only costs speed, never the build.
+            if tmp is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
+
+    def highlight(self, code: str, lexer: Any, formatter: Any) -> str:
+        key = self.key(code, lexer, formatter)
+        html = self.get(key)
+        if html is None:
+            html = _highlight(code, lexer, formatter)
+            self.put(key, html)
+        return html
+
+
+# ``codehilite`` (and ``fenced_code``, through it) call the module-level
+# ``highlight``; :func:`using_highlight_cache` routes it through the cache
+# for the duration of a build and puts the original back afterwards.
+_highlight = codehilite.highlight
+_active: HighlightCache | None = None
+
+
+def _cached_highlight(code: str, lexer: Any, formatter: Any, outfile: Any = None) -> Any:
+    if _active is None or outfile is not None:
+        return _highlight(code, lexer, formatter, outfile)
+    return _active.highlight(code, lexer, formatter)
+
+
+@contextlib.contextmanager
+def using_highlight_cache(cache: HighlightCache | None) -> Iterator[HighlightCache | None]:
+    """Serve code highlighting from *cache* while the block runs (no-op for ``None``)."""
+    global _active
+    if cache is None:
+        yield cache
+        return
+    previous, patched = _active, codehilite.highlight
+    _active = cache
+    codehilite.highlight = _cached_highlight
+    try:
+        yield cache
+    finally:
+        _active = previous
+        codehilite.highlight = patched
+
+
+__all__ = ["HighlightCache", "using_highlight_cache"]
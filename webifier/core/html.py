@@ -2,16 +2,23 @@ from __future__ import annotations
 
 import os
 import re
+from html import escape
+from html.parser import HTMLParser
 from urllib.parse import unquote, urlsplit
 
-from bs4 import BeautifulSoup, NavigableString
+from webifier.interface.profiling import profiled
 
 # Matches optional type prefix (md=, index=, pdf=, notebook=) followed by a URL
-HREF_REGEX = re.compile(
-    r"((?P<type>(index|pdf|md|notebook))=)?(?P<url>((http|ftp)s?://)?(-\.)?[\w\d\S]+)"
-)
+HREF_REGEX = re.compile(r"((?P<type>(index|pdf|md|notebook))=)?(?P<url>((http|ftp)s?://)?(-\.)?[\w\d\S]+)")
 
+# Tags whose ``src`` points at a local asset to copy.
+MEDIA_TAGS = frozenset({"img", "audio", "embed", "iframe", "script", "source", "track", "video"})
 
+# Fragments without any of these tags are returned untouched, without parsing.
+_REWRITE_TAG_PATTERN = re.compile(r"<(?:a|img|audio|embed|iframe|script|source|track|video)[\s/>]", re.IGNORECASE)
+
+
+@profiled("html")
 def process_html(
     builder,
     raw_html: str,
@@ -19,92 +26,219 @@ def process_html(
     assets_target_dir=None,
     search_links: bool = False,
 ) -> str:
-    """Post-process HTML — resolve anchors and local asset paths."""
+    """Post-process HTML — resolve anchors and local asset paths.
+
+    Only the start tags that change are re-serialized; everything else is
+    copied through verbatim.
+    """
+    if not _REWRITE_TAG_PATTERN.search(raw_html):
+        return raw_html
     assets_target_dir = assets_target_dir if assets_target_dir is not None else builder.assets_dir
-    soup = BeautifulSoup(raw_html, features="html.parser")
-
-    for image in soup.find_all("img", src=True):
-        src = image["src"]
-        parsed = urlsplit(src)
-        if parsed.netloc == "render.githubusercontent.com" and parsed.path == "/render/math":
-            math = ""
-            if parsed.query.startswith("math="):
-                math = unquote(parsed.query.removeprefix("math="))
-            if math:
-                image.replace_with(NavigableString(f"\\({math}\\)"))
-
-    # Resolve anchor hrefs (md=, index=, pdf=, notebook= prefixes)
-    for anchor in soup.find_all("a"):
-        _process_html_anchor(
-            builder,
-            soup,
-            anchor,
-            assets_src_dir=assets_src_dir,
-            assets_target_dir=assets_target_dir,
-            search_links=search_links,
-        )
+    rewriter = _HtmlRewriter(
+        builder,
+        raw_html,
+        assets_src_dir=assets_src_dir,
+        assets_target_dir=assets_target_dir,
+        search_links=search_links,
+    )
+    return rewriter.rewrite()
+
+
+# ── Streaming rewriter ────────────────────────────────────────────────────
+
+
+class _HtmlRewriter(HTMLParser):
+    """Single pass over an HTML fragment, rewriting ``<a href>`` and media ``src``.
+
+    The parser only reports where tags start; output is assembled from
+    slices of the original source, with rewritten start tags spliced in.
+    Anchors with a ``md=``/``index=``/``pdf=``/``notebook=`` prefix are held
+    until their closing tag, since building the link needs the anchor text.
+    """
+
+    def __init__(self, builder, source: str, *, assets_src_dir, assets_target_dir, search_links: bool) -> None:
+        super().__init__(convert_charrefs=True)
+        self.builder = builder
+        self.source = source
+        self.assets_src_dir = assets_src_dir
+        self.assets_target_dir = assets_target_dir
+        self.search_links = search_links
+        self.line_starts = [0] + [match.end() for match in re.finditer("\n", source)]
+        self.out: list[str] = []
+        self.emitted = 0
+        # Pending prefixed anchor: (index in out, attrs, self-closing, text parts)
+        self.anchor: tuple[int, dict[str, str | None], bool, list[str]] | None = None
+
+    def rewrite(self) -> str:
+        self.feed(self.source)
+        self.close()
+        self._flush(len(self.source))
+        if self.anchor is not None:
+            self._finish_anchor()
+        return "".join(self.out)
+
+    # -- source bookkeeping ------------------------------------------------
+
+    def _offset(self) -> int:
+        line, column = self.getpos()
+        return self.line_starts[line - 1] + column
+
+    def _flush(self, upto: int) -> None:
+        if upto > self.emitted:
+            self.out.append(self.source[self.emitted : upto])
+            self.emitted = upto
 
-    # Resolve src attributes on media tags
-    for tag in ["img", "audio", "embed", "iframe", "script", "source", "track", "video"]:
-        for src_tag in soup.find_all(tag, src=True):
-            src = src_tag["src"]
-            local_src = src
-            if "://" not in src and not src.startswith("data:"):
-                local_src = unquote(urlsplit(src).path)
-            try:
-                new_src = builder.files.copy_file(
-                    local_src,
-                    local_src,
-                    src_dir=assets_src_dir,
-                    target_dir=assets_target_dir,
-                )
-            except FileNotFoundError:
-                fallback_src = os.path.join("files", local_src)
-                if not assets_src_dir or local_src.startswith("files/") or not os.path.isfile(
-                    os.path.join(assets_src_dir, fallback_src)
-                ):
-                    raise
-                new_src = builder.files.copy_file(
-                    fallback_src,
-                    fallback_src,
-                    src_dir=assets_src_dir,
-                    target_dir=assets_target_dir,
-                )
+    def _replace_tag(self, replacement: str) -> None:
+        """Emit *replacement* instead of the start tag being handled."""
+        start = self._offset()
+        self._flush(start)
+        self.out.append(replacement)
+        self.emitted = start + len(self.get_starttag_text())
+
+    # -- parser callbacks --------------------------------------------------
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._start(tag, attrs, self_closing=False)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._start(tag, attrs, self_closing=True)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "a" and self.anchor is not None:
+            self._flush(self._offset())
+            self._finish_anchor()
+
+    def handle_data(self, data: str) -> None:
+        if self.anchor is not None:
+            self.anchor[3].append(data)
+
+    def _start(self, tag: str, attr_list: list[tuple[str, str | None]], self_closing: bool) -> None:
+        if tag == "a":
+            self._start_anchor(dict(attr_list), self_closing)
+        elif tag in MEDIA_TAGS:
+            attrs = dict(attr_list)
+            if attrs.get("src") is None:
+                return
+            if tag == "img":
+                math = _github_math(attrs["src"])
+                if math:
+                    text = f"\\({math}\\)"
+                    self._replace_tag(escape(text, quote=False))
+                    if self.anchor is not None:
+                        self.anchor[3].append(text)
+                    return
+            new_src = self._copy_media(attrs["src"])
             if new_src:
-                src_tag["src"] = new_src
+                attrs["src"] = new_src
+                self._replace_tag(_format_start_tag(tag, attrs, self_closing))
+
+    # -- anchors -----------------------------------------------------------
 
-    return str(soup)
+    def _start_anchor(self, attrs: dict[str, str | None], self_closing: bool) -> None:
+        href = attrs.get("href")
+        if not href:
+            return
+        match = re.match(HREF_REGEX, href)
+        if not match or not match.group("type"):
+            # No prefix — leave as-is (normal URL or anchor)
+            return
+        if self.anchor is not None:
+            # Anchors do not nest; an open one ends where the next begins.
+            self._flush(self._offset())
+            self._finish_anchor()
+        self._replace_tag("")
+        self.anchor = (len(self.out) - 1, attrs, self_closing, [])
+
+    def _finish_anchor(self) -> None:
+        index, attrs, self_closing, text_parts = self.anchor
+        self.anchor = None
+        text = "".join(text_parts)
+        attrs, icon = _process_html_anchor(
+            self.builder,
+            attrs,
+            text,
+            assets_src_dir=self.assets_src_dir,
+            assets_target_dir=self.assets_target_dir,
+            search_links=self.search_links,
+        )
+        self.out[index] = _format_start_tag("a", attrs, self_closing)
+        if icon is not None:
+            del self.out[index + 1 :]
+            self.out.append(f'<i aria-hidden="true" class="{escape(icon)}"></i> {escape(text, quote=False)}')
+
+    # -- media -------------------------------------------------------------
+
+    def _copy_media(self, src: str) -> str | None:
+        builder = self.builder
+        local_src = src
+        if "://" not in src and not src.startswith("data:"):
+            local_src = unquote(urlsplit(src).path)
+        try:
+            return builder.files.copy_file(
+                local_src,
+                local_src,
+                src_dir=self.assets_src_dir,
+                target_dir=self.assets_target_dir,
+            )
+        except FileNotFoundError:
+            fallback_src = os.path.join("files", local_src)
+            assets_src_dir = self.assets_src_dir
+            if (
+                not assets_src_dir
+                or local_src.startswith("files/")
+                or not os.path.isfile(os.path.join(assets_src_dir, fallback_src))
+            ):
+                raise
+            return builder.files.copy_file(
+                fallback_src,
+                fallback_src,
+                src_dir=assets_src_dir,
+                target_dir=self.assets_target_dir,
+            )
+
+
+def _github_math(src: str) -> str:
+    """Return the TeX of an old GitHub math-render image URL, or ``""``."""
+    parsed = urlsplit(src)
+    if (
+        parsed.netloc == "render.githubusercontent.com"
+        and parsed.path == "/render/math"
+        and parsed.query.startswith("math=")
+    ):
+        return unquote(parsed.query.removeprefix("math="))
+    return ""
+
+
+def _format_start_tag(tag: str, attrs: dict[str, str | None], self_closing: bool) -> str:
+    parts = [tag]
+    for key, value in attrs.items():
+        parts.append(key if value is None else f'{key}="{escape(value)}"')
+    return f"<{' '.join(parts)}{'/' if self_closing else ''}>"
 
 
 def _process_html_anchor(
     builder,
-    soup,
-    anchor,
+    attrs: dict[str, str | None],
+    text: str,
     assets_src_dir=None,
     assets_target_dir=None,
     search_links=False,
-):
-    """Process a single ``<a>`` tag — resolve md=/index=/pdf= link prefixes."""
-    if "href" not in anchor.attrs or not anchor["href"]:
-        return
-
-    href = anchor["href"]
-    match = re.match(HREF_REGEX, href)
-    if not match:
-        return
+) -> tuple[dict[str, str | None], str | None]:
+    """Process a single ``<a>`` tag — resolve md=/index=/pdf= link prefixes.
 
+    Returns the anchor's new attributes and, when the link asks for one, the
+    icon class to render in front of the anchor text.
+    """
+    attrs = dict(attrs)
+    match = re.match(HREF_REGEX, attrs["href"])
     match_dict = match.groupdict()
     link_type = match_dict.get("type")
     url = match_dict.get("url", "")
 
-    if not link_type:
-        # No prefix — leave as-is (normal URL or anchor)
-        return
-
-    link = {"text": anchor.text or ""}
-    for key in anchor.attrs:
+    link = {"text": text or ""}
+    for key, value in attrs.items():
         if key not in ("href", "class"):
-            link[key] = anchor[key]
+            link[key] = "" if value is None else value
 
     if link_type in ("md", "notebook") or (link_type == "pdf" and builder._content_renderer_key(url, "pdf")):
         # Build a content sub-page
@@ -117,7 +251,7 @@ def _process_html_anchor(
             search_links=search_links,
         )
         link = builder._process_content_link(link, ctx, kind=link_type)
-        anchor["href"] = link.get("href", "#")
+        attrs["href"] = link.get("href", "#")
 
     elif link_type == "index":
         # Build a sub-page from an index file
@@ -130,7 +264,7 @@ def _process_html_anchor(
             search_links=search_links,
         )
         link = builder._process_index_link(link, ctx)
-        anchor["href"] = link.get("href", "#")
+        attrs["href"] = link.get("href", "#")
 
     elif link_type == "pdf":
         new_path = builder.files.copy_file(
@@ -138,22 +272,17 @@ def _process_html_anchor(
             url,
             target_dir="assets",
         )
-        anchor["href"] = new_path if new_path else url
+        attrs["href"] = new_path if new_path else url
 
     # Add tooltip for description
     if "description" in link:
-        anchor["data-bs-toggle"] = "tooltip"
-        anchor["data-bs-html"] = "true"
-        anchor["title"] = link["description"]
+        attrs["data-bs-toggle"] = "tooltip"
+        attrs["data-bs-html"] = "true"
+        attrs["title"] = link["description"]
 
     # Add icon if specified
+    icon = None
     if "icon" in link:
-        text = anchor.text
-        anchor.clear()
-        icon_tag = soup.new_tag("i")
-        icon_tag["aria-hidden"] = "true"
-        icon_tag["class"] = link["icon"]
-        anchor.append(icon_tag)
-        anchor.append(f" {text}")
-        if "icon" in anchor.attrs:
-            del anchor["icon"]
+        icon = link["icon"]
+        attrs.pop("icon", None)
+    return attrs, icon
@@ -5,7 +5,8 @@ import copy
 import os
 from typing import Any
 
-from webifier.interface.io import read_file, read_yaml
+from webifier.interface.io import note_dependency, read_file, read_yaml
+from webifier.interface.profiling import phase
 from webifier.interface.resolvers import expand
 from webifier.interface.resolvers.utils import place_at_path
 
@@ -55,6 +56,7 @@ _register_builtin_formats()
 
 # --- Key parsing -----------------------------------------------------------
 
+
 def _is_patch_key(key: str) -> bool:
     """Return True if *key* is a ``patch`` directive.
 
@@ -98,7 +100,7 @@ def _parse_patch_key(key: str) -> tuple[str | None, str | None]:
     >>> _parse_patch_key("patch@a.b!yaml")
     ('a.b', 'yaml')
     """
-    rest = key[len(_PATCH_KEY):]
+    rest = key[len(_PATCH_KEY) :]
     if not rest:
         return None, None
 
@@ -119,9 +121,7 @@ def _parse_patch_key(key: str) -> tuple[str | None, str | None]:
     # What remains after stripping !modifier is @location
     if rest:
         if not rest.startswith("@"):
-            raise ValueError(
-                f"Invalid patch key '{key}'. Expected '@' before location, got '{rest}'."
-            )
+            raise ValueError(f"Invalid patch key '{key}'. Expected '@' before location, got '{rest}'.")
         location = rest[1:]  # strip the '@'
         if not location:
             raise ValueError(f"Empty @location in patch key '{key}'.")
@@ -131,6 +131,7 @@ def _parse_patch_key(key: str) -> tuple[str | None, str | None]:
 
 # --- Patch resolution -------------------------------------------------------
 
+
 def resolve_patches(data: Any) -> Any:
     """Recursively resolve ``patch`` directives in a data tree.
 
@@ -223,6 +224,7 @@ def _load_patch(source: Any, modifier: str | None = None) -> Any:
         return source
 
     if isinstance(source, str):
+        note_dependency(source, "patch")
         if modifier == "yaml":
             return read_yaml(source)
         if modifier == "text":
@@ -279,8 +281,12 @@ def load_and_resolve(path: str) -> dict:
 
     Returns the fully resolved data dict ready for rendering.
     """
-    data = read_yaml(path)
-    data = resolve_patches(data)
-    data = apply_defaults(data)
-    data = expand(data)
+    with phase("parse"):
+        data = read_yaml(path)
+    with phase("patches"):
+        data = resolve_patches(data)
+    with phase("defaults"):
+        data = apply_defaults(data)
+    with phase("expand"):
+        data = expand(data)
     return data
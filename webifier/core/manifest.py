@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import contextlib
+import glob as _glob
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from importlib import metadata
+from typing import Any
+
+MANIFEST_VERSION = 2
+
+
+def digest_file(path: str) -> str:
+    """Return the sha256 of a file, or ``""`` when it does not exist."""
+    if path.startswith("glob:"):
+        matches = sorted(_glob.glob(path.removeprefix("glob:"), recursive=True))
+        return digest_value(matches)
+    if not os.path.isfile(path):
+        return ""
+    sha = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def digest_value(value: Any) -> str:
+    """Return a stable sha256 for a JSON-like value."""
+    encoded = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def extension_versions() -> dict[str, str]:
+    """Return the versions of every distribution shipping Webifier extensions."""
+    versions: dict[str, str] = {}
+    with contextlib.suppress(metadata.PackageNotFoundError):
+        versions["webifier"] = metadata.version("webifier")
+    with contextlib.suppress(Exception):
+        for ep in metadata.entry_points(group="webifier.extensions"):
+            dist = getattr(ep, "dist", None)
+            if dist is not None:
+                versions[dist.metadata["Name"]] = dist.version
+    return versions
+
+
+@dataclass
+class PageRecord:
+    """Inputs and side effects of one generated page."""
+
+    source: str
+    inputs: dict[str, str] = field(default_factory=dict)
+    dependencies: dict[str, str] = field(default_factory=dict)
+    children: list[dict[str, Any]] = field(default_factory=list)
+    search: dict[str, dict] = field(default_factory=dict)
+    summary: dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "source": self.source,
+            "inputs": self.inputs,
+            "dependencies": self.dependencies,
+            "children": self.children,
+            "search": self.search,
+            "summary": self.summary,
+        }
+
+
+class BuildManifest:
+    """Content-addressed record of the inputs behind every generated page.
+
+    The manifest lives in the output directory and maps each generated
+    file (relative to the output directory) to the hashes of the files it
+    was built from, the sub-pages it linked to, and the search entries it
+    contributed. A page is *fresh* when the site-wide fingerprint (config,
+    extension versions, templates) and all of its input hashes match the
+    previous build, and its output still exists.
+    """
+
+    FILENAME = ".webifier-manifest.json"
+
+    def __init__(self, output_dir: str) -> None:
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, self.FILENAME)
+        self.fingerprint = ""
+        self.previous: dict[str, Any] = {}
+        self.pages: dict[str, dict[str, Any]] = {}
+        self._stack: list[PageRecord] = []
+        self._digests: dict[str, str] = {}
+        self._templates_fresh: bool | None = None
+
+    # -- persistence -------------------------------------------------------
+
+    def load(self) -> None:
+        """Read the manifest written by the previous build, if any."""
+        self.previous = {}
+        # Files may have changed since the last build in this process.
+        self._digests = {}
+        self._templates_fresh = None
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path) as fh:
+                previous = json.load(fh)
+        except (OSError, ValueError):
+            return
+        if isinstance(previous, dict) and previous.get("version") == MANIFEST_VERSION:
+            self.previous = previous
+
+    def save(self, templates: Iterable[str] = ()) -> None:
+        """Write the manifest for the current build."""
+        template_paths = set(templates) | set(self.previous.get("templates", {}))
+        payload = {
+            "version": MANIFEST_VERSION,
+            "fingerprint": self.fingerprint,
+            "templates": {path: self.digest(path) for path in sorted(template_paths) if os.path.isfile(path)},
+            "pages": self.pages,
+        }
+        os.makedirs(self.output_dir or ".", exist_ok=True)
+        with open(self.path, "w") as fh:
+            json.dump(payload, fh, indent=1, sort_keys=True, default=str)
+        # Later rebuilds in the same process compare against this build.
+        self.previous = payload
+        self._templates_fresh = None
+
+    def invalidate(self, paths: Iterable[str]) -> None:
+        """Forget the cached digests of *paths* after they changed on disk."""
+        for path in paths:
+            self._digests.pop(path, None)
+            self._digests.pop(os.path.normpath(path), None)
+        self._templates_fresh = None
+
+    # -- freshness ---------------------------------------------------------
+
+    def digest(self, path: str) -> str:
+        if path not in self._digests:
+            self._digests[path] = digest_file(path)
+        return self._digests[path]
+
+    def is_fresh(self, output: str) -> bool:
+        """Return True when *output* can be reused from the previous build."""
+        entry = self.previous.get("pages", {}).get(output)
+        if entry is None or self.previous.get("fingerprint") != self.fingerprint:
+            return False
+        if not self._templates_unchanged():
+            return False
+        if not os.path.isfile(os.path.join(self.output_dir, output)):
+            return False
+        return all(self.digest(path) == digest for path, digest in entry["inputs"].items())
+
+    def _templates_unchanged(self) -> bool:
+        if self._templates_fresh is None:
+            self._templates_fresh = all(
+                self.digest(path) == digest for path, digest in self.previous.get("templates", {}).items()
+            )
+        return self._templates_fresh
+
+    def reuse(self, output: str) -> dict[str, Any]:
+        """Carry the previous record for *output* over into this build."""
+        entry = self.previous["pages"][output]
+        self.pages[output] = entry
+        return entry
+
+    # -- recording ---------------------------------------------------------
+
+    def push(self, source: str) -> PageRecord:
+        """Start recording the page built from *source*."""
+        record = PageRecord(source=source)
+        self._stack.append(record)
+        return record
+
+    def pop(self) -> None:
+        """Stop recording the innermost page."""
+        self._stack.pop()
+
+    def store(self, output: str, record: PageRecord, dependencies: dict[str, str]) -> None:
+        """Store *record* for *output*, hashing every dependency it read.
+
+        Plain links to other generated pages are not inputs: the linked
+        page has its own record.  All *dependencies* are kept with their
+        kinds so a reused page can restore its edges in the dependency graph.
+        """
+        record.dependencies = dict(sorted(dependencies.items()))
+        inputs = sorted(path for path, kind in dependencies.items() if kind != "link")
+        record.inputs = {path: self.digest(path) for path in inputs}
+        self.pages[output] = record.as_dict()
+
+    def note_child(self, kind: str, src: str, **details: Any) -> None:
+        """Note that the page being built links to a generated sub-page."""
+        if self._stack:
+            child = {"kind": kind, "src": src, **details}
+            if child not in self._stack[-1].children:
+                self._stack[-1].children.append(child)
+
+    def note_search(self, slug: str, entry: dict) -> None:
+        """Note the search entry the page being built contributed under *slug*."""
+        if self._stack:
+            self._stack[-1].search[slug] = dict(entry)
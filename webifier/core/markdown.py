@@ -1,34 +1,90 @@
 from __future__ import annotations
 
+import bisect
 import re
+import threading
 import typing as th
+from collections import OrderedDict
 from html import escape
 from urllib.parse import unquote
 
 import markdown
 
+from webifier.interface.io import collect_dependencies, note_dependency
+from webifier.interface.profiling import profiled
+
 from .html import process_html as html_processor
 
-MATH_PATTERNS = (
-    re.compile(r"(?<!\\)\$\$(.+?)(?<!\\)\$\$", re.DOTALL),
-    re.compile(r"\\\[(.+?)\\\]", re.DOTALL),
-    re.compile(r"\\\((.+?)\\\)", re.DOTALL),
-    re.compile(r"(?<!\\)\$\s*\\begin\{([a-zA-Z*]+)\}.*?\\end\{\1\}\s*(?<!\\)\$", re.DOTALL),
-    re.compile(r"\\begin\{([a-zA-Z*]+)\}.*?\\end\{\1\}", re.DOTALL),
-    re.compile(r"(?<!\\)(?<!\$)\$(?![\s$]|@@WEBIFIER_MATH_)(?:\\.|[^\n\\$])+?(?<![\s\\])\$(?!\$)"),
-)
-FENCED_CODE_PATTERN = re.compile(r"(^|\n)(`{3,}|~{3,})[^\n]*\n.*?\n\2[ \t]*(?=\n|$)", re.DOTALL)
-MERMAID_FENCE_PATTERN = re.compile(
-    r"(^|\n)(`{3,}|~{3,})mermaid[^\n]*\n(.*?)\n\2[ \t]*(?=\n|$)",
-    re.IGNORECASE | re.DOTALL,
-)
-INLINE_CODE_PATTERN = re.compile(r"(`+)(.+?)(?<!`)\1", re.DOTALL)
+_FENCE_OPENER = re.compile(r"(`{3,}|~{3,})([^\n]*)")
+_FENCE_CLOSER = re.compile(r"(`{3,}|~{3,})[ \t]*")
+_BACKTICKS = re.compile(r"`+")
+_BLANK_LINE = re.compile(r"\n[ \t]*\n")
+_SPECIAL = re.compile(r"[$\\<]")
+_INLINE_MATH_STOP = re.compile(r"[$\\\n`]")
+_ENV_OPENER = re.compile(r"\\begin\{([a-zA-Z*]+)\}")
+_DOLLAR_ENV_OPENER = re.compile(r"\$\s*\\begin\{([a-zA-Z*]+)\}")
+_DOLLAR_CLOSER = re.compile(r"\s*\$")
 GITHUB_MATH_IMAGE_PATTERN = re.compile(
-    r"<img\s+[^>]*src=(['\"])https://render\.githubusercontent\.com/render/math\?math=(.*?)\1[^>]*>",
-    re.IGNORECASE | re.DOTALL,
+    r"<img\s[^>]*?src=(['\"])https://render\.githubusercontent\.com/render/math\?math=([^>]*?)\1[^>]*>",
+    re.IGNORECASE,
 )
+MATH_PLACEHOLDER_PATTERN = re.compile(r"<p>@@WEBIFIER_MATH_(\d+)@@</p>|@@WEBIFIER_MATH_(\d+)@@")
+
+# Markdown instances are expensive to build (every extension is instantiated
+# and registered), so each thread keeps one per extension set and resets it
+# between documents.
+_converters = threading.local()
+
+
+def markdown_converter(extensions: th.Iterable[str]) -> markdown.Markdown:
+    """Return this thread's reset ``Markdown`` instance for *extensions*."""
+    key = tuple(extensions)
+    pool = getattr(_converters, "pool", None)
+    if pool is None:
+        pool = _converters.pool = {}
+    converter = pool.get(key)
+    if converter is None:
+        converter = pool[key] = markdown.Markdown(extensions=list(key))
+    return converter.reset()
+
 
+class MarkdownCache:
+    """Bounded LRU of rendered markdown fragments.
 
+    Only fragments whose rendering read no files are stored: a fragment that
+    copies an asset or builds a linked sub-page must be rendered again so
+    those side effects happen (and are recorded) for every page using it.
+    Texts longer than *max_text* are whole pages, rendered once anyway.
+    """
+
+    def __init__(self, maxsize: int = 2048, max_text: int = 8192) -> None:
+        self.maxsize = maxsize
+        self.max_text = max_text
+        self.entries: OrderedDict[tuple, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+
+    def get(self, key: tuple) -> str | None:
+        html = self.entries.get(key)
+        if html is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return html
+
+    def store(self, key: tuple, html: str) -> None:
+        self.entries[key] = html
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+@profiled("markdown")
 def build_markdown(
     raw: str,
     builder,
@@ -39,41 +95,45 @@ def build_markdown(
     search_links: bool = False,
 ) -> str:
     assets_target_dir = builder.assets_dir if assets_target_dir is None else assets_target_dir
-    code_spans: list[str] = []
-    math_spans: list[str] = []
-
-    def stash_code(match: re.Match[str]) -> str:
-        code_spans.append(match.group(0))
-        return f"@@WEBIFIER_CODE_{len(code_spans) - 1}@@"
-
-    def stash_math(match: re.Match[str]) -> str:
-        math_text = match.group(0)
-        if (
-            math_text.startswith("$")
-            and math_text[1:].lstrip().startswith("\\begin")
-            and math_text.rstrip().endswith("$")
-        ):
-            math_text = math_text[1 : len(math_text.rstrip()) - 1].strip()
-        math_spans.append(math_text)
-        return f"@@WEBIFIER_MATH_{len(math_spans) - 1}@@"
-
-    def render_mermaid(match: re.Match[str]) -> str:
-        return f'{match.group(1)}<div class="mermaid">\n{escape(match.group(3).strip())}\n</div>'
-
-    raw = GITHUB_MATH_IMAGE_PATTERN.sub(lambda match: f"\\({unquote(match.group(2))}\\)", raw)
-    raw = MERMAID_FENCE_PATTERN.sub(render_mermaid, raw)
-    protected = FENCED_CODE_PATTERN.sub(stash_code, raw)
-    protected = INLINE_CODE_PATTERN.sub(stash_code, protected)
-    for pattern in MATH_PATTERNS:
-        protected = pattern.sub(stash_math, protected)
-    for index, code in enumerate(code_spans):
-        protected = protected.replace(f"@@WEBIFIER_CODE_{index}@@", code)
-
-    body = markdown.markdown(protected, extensions=extensions if extensions else builder.markdown_extensions)
-    for index, math_text in enumerate(math_spans):
-        placeholder = f"@@WEBIFIER_MATH_{index}@@"
-        body = body.replace(f"<p>{placeholder}</p>", math_text)
-        body = body.replace(placeholder, math_text)
+    extensions = tuple(extensions or builder.markdown_extensions)
+    cache: MarkdownCache | None = getattr(builder, "markdown_cache", None)
+    if cache is None or len(raw) > cache.max_text:
+        return _render_markdown(raw, builder, assets_src_dir, assets_target_dir, extensions, process_html, search_links)
+
+    key = (
+        raw,
+        extensions,
+        assets_src_dir,
+        assets_target_dir,
+        getattr(builder, "base_url", None),
+        process_html,
+        search_links,
+    )
+    html = cache.get(key)
+    if html is not None:
+        return html
+    with collect_dependencies() as noted:
+        html = _render_markdown(raw, builder, assets_src_dir, assets_target_dir, extensions, process_html, search_links)
+    if noted:
+        cache.uncacheable += 1
+        for path, kind in noted.items():
+            note_dependency(path, kind)
+    else:
+        cache.store(key, html)
+    return html
+
+
+def _render_markdown(
+    raw: str,
+    builder,
+    assets_src_dir,
+    assets_target_dir,
+    extensions: tuple[str, ...],
+    process_html: bool,
+    search_links: bool,
+) -> str:
+    protected, math_spans = protect_markup(raw)
+    body = restore_math(markdown_converter(extensions).convert(protected), math_spans)
     if process_html:
         return html_processor(
             builder,
@@ -83,3 +143,305 @@ def build_markdown(
             search_links=search_links,
         )
     return body
+
+
+# ── Math and code protection ─────────────────────────────────────────────────
+#
+# Math has to reach MathJax untouched, so before conversion every math span is
+# swapped for a placeholder markdown leaves alone.  Spans are found in one
+# left-to-right walk: fenced blocks (line based), then code spans (never math),
+# then math delimiters.  Every closing delimiter is searched for at most once
+# past a given point, so the walk is linear even on unbalanced input.
+
+
+def protect_markup(raw: str) -> tuple[str, list[str]]:
+    """Replace math spans in *raw* with placeholders and render mermaid fences.
+
+    Returns the protected text and the math spans, to be put back into the
+    converted HTML with :func:`restore_math`.  Fenced and inline code are left
+    as they are but never searched for math; GitHub's rendered-math images
+    become ``\\(...\\)`` spans.
+    """
+    out: list[str] = []
+    math: list[str] = []
+    position = 0
+    for start, end, mermaid in _fenced_blocks(raw):
+        _InlineScanner(raw[position:start], out, math).run()
+        if mermaid is None:
+            out.append(raw[start:end])
+        else:
+            out.append(f'<div class="mermaid">\n{escape(mermaid.strip())}\n</div>')
+        position = end
+    _InlineScanner(raw[position:], out, math).run()
+    return "".join(out), math
+
+
+def restore_math(body: str, math: list[str]) -> str:
+    """Put the math spans stashed by :func:`protect_markup` back into *body*."""
+    if not math:
+        return body
+
+    def restore(match: re.Match[str]) -> str:
+        index = int(match.group(1) or match.group(2))
+        return math[index] if index < len(math) else match.group(0)
+
+    return MATH_PLACEHOLDER_PATTERN.sub(restore, body)
+
+
+def _fenced_blocks(text: str) -> th.Iterator[tuple[int, int, str | None]]:
+    """Yield ``(start, end, mermaid_source)`` for every closed code fence in *text*.
+
+    A fence closes on a later line holding the same fence (and trailing blanks
+    only) with at least one line in between; *mermaid_source* is
+    ``None`` for fences that are not ``mermaid`` diagrams.
+    """
+    lines = text.split("\n")
+    starts = [0] * len(lines)
+    closers: dict[str, list[int]] = {}
+    offset = 0
+    for number, line in enumerate(lines):
+        starts[number] = offset
+        offset += len(line) + 1
+        if line[:3] in ("```", "~~~") and (match := _FENCE_CLOSER.fullmatch(line)):
+            closers.setdefault(match.group(1), []).append(number)
+
+    number = 0
+    while number < len(lines):
+        match = _FENCE_OPENER.match(lines[number]) if lines[number][:3] in ("```", "~~~") else None
+        candidates = closers.get(match.group(1), ()) if match else ()
+        index = bisect.bisect_left(candidates, number + 2)
+        if index == len(candidates):
+            number += 1
+            continue
+        closer = candidates[index]
+        mermaid = None
+        if match.group(2)[:7].lower() == "mermaid":
+            mermaid = "\n".join(lines[number + 1 : closer])
+        yield starts[number], starts[closer] + len(lines[closer]), mermaid
+        number = closer + 1
+
+
+def _code_spans(text: str) -> list[tuple[int, int]]:
+    """``(start, end)`` of the backtick code spans in *text*, left to right."""
+    spans: list[tuple[int, int]] = []
+    if "`" not in text:
+        return spans
+    start = 0
+    for blank in _BLANK_LINE.finditer(text):
+        _pair_backticks(text, start, blank.start(), spans)
+        start = blank.end()
+    _pair_backticks(text, start, len(text), spans)
+    return spans
+
+
+def _pair_backticks(text: str, start: int, end: int, spans: list[tuple[int, int]]) -> None:
+    """Pair the backtick runs of one paragraph the way Python-Markdown does.
+
+    A run closes on the next run of the same length or, failing that, on the
+    first longest later run.  A backslash before a run escapes its first
+    backtick.
+    """
+    runs = [match.span() for match in _BACKTICKS.finditer(text, start, end)]
+    by_length: dict[int, list[int]] = {}
+    for index, (first, last) in enumerate(runs):
+        by_length.setdefault(last - first, []).append(index)
+    longest = [-1] * len(runs)
+    best = -1
+    for index in range(len(runs) - 1, 0, -1):
+        if best == -1 or runs[index][1] - runs[index][0] >= runs[best][1] - runs[best][0]:
+            best = index
+        longest[index - 1] = best
+
+    index = 0
+    while index < len(runs):
+        first, last = runs[index]
+        if first > 0 and text[first - 1] == "\\":
+            first += 1
+        same = by_length.get(last - first, ())
+        position = bisect.bisect_right(same, index)
+        close = same[position] if position < len(same) else longest[index]
+        if first == last or close == -1:
+            index += 1
+            continue
+        spans.append((first, runs[close][1]))
+        index = close + 1
+
+
+class _InlineScanner:
+    """Find the math spans in *text* (which holds no fenced blocks).
+
+    Protected text is appended to *out*, math spans to *math*.
+    """
+
+    def __init__(self, text: str, out: list[str], math: list[str]) -> None:
+        self.text = text
+        self.out = out
+        self.math = math
+        self.code = _code_spans(text)
+        self.code_starts = [start for start, _ in self.code]
+        # closer -> a position past which the closer is known not to occur
+        self.exhausted: dict[str, int] = {}
+
+    def run(self) -> None:
+        text, code = self.text, self.code
+        literal = 0  # start of text not yet appended to out
+        position = 0
+        next_code = 0
+        while True:
+            while next_code < len(code) and code[next_code][0] < position:
+                next_code += 1
+            special = _SPECIAL.search(text, position)
+            if special is None:
+                break
+            start = special.start()
+            if next_code < len(code) and code[next_code][0] < start:
+                position = code[next_code][1]
+                continue
+            end, math_text = self._span_at(start, literal)
+            if math_text is not None:
+                self.out.append(text[literal:start])
+                self.out.append(f"@@WEBIFIER_MATH_{len(self.math)}@@")
+                self.math.append(math_text)
+                literal = end
+            position = end
+        self.out.append(text[literal:])
+
+    def _span_at(self, start: int, literal: int) -> tuple[int, str | None]:
+        """Return where scanning resumes and the math span at *start*, if any."""
+        text = self.text
+        char = text[start]
+        following = text[start + 1 : start + 2]
+        if char == "<":
+            return self._github_math_image(start)
+        if char == "\\":
+            if following == "$":
+                return start + 2, None
+            if following in ("[", "("):
+                closer = "\\]" if following == "[" else "\\)"
+                end = self._find(closer, start + 3)
+                if end == -1:
+                    return start + 2, None
+                return end + 2, text[start : end + 2]
+            opener = _ENV_OPENER.match(text, start)
+            if opener is None:
+                return start + 1, None
+            closer = f"\\end{{{opener.group(1)}}}"
+            end = self._find(closer, opener.end())
+            if end == -1:
+                return opener.end(), None
+            return end + len(closer), text[start : end + len(closer)]
+
+        # char == "$"
+        if start > literal and text[start - 1] == "$":
+            return start + 1, None
+        if following == "$":
+            end = self._find("$$", start + 3, escapable=True)
+            if end == -1:
+                return start + 2, None
+            return end + 2, text[start : end + 2]
+        opener = _DOLLAR_ENV_OPENER.match(text, start)
+        if opener is not None:
+            span = self._dollar_environment(opener)
+            if span is not None:
+                return span
+        end = self._inline_math_end(start)
+        if end == -1:
+            return start + 1, None
+        return end, text[start:end]
+
+    def _find(self, closer: str, start: int, escapable: bool = False) -> int:
+        """Index of the next *closer* at or after *start* outside code spans, or -1.
+
+        With *escapable*, a closer right after a backslash does not count.
+        """
+        if self.exhausted.get(closer, len(self.text) + 1) <= start:
+            return -1
+        text = self.text
+        index = text.find(closer, start)
+        while index != -1:
+            span = self._code_span_at(index)
+            if span is not None:
+                index = text.find(closer, span[1])
+            elif escapable and text[index - 1] == "\\":
+                index = text.find(closer, index + 1)
+            else:
+                return index
+        self.exhausted[closer] = start
+        return -1
+
+    def _code_span_at(self, index: int) -> tuple[int, int] | None:
+        position = bisect.bisect_right(self.code_starts, index) - 1
+        if position >= 0 and index < self.code[position][1]:
+            return self.code[position]
+        return None
+
+    def _dollar_environment(self, opener: re.Match[str]) -> tuple[int, str | None] | None:
+        """``$\\begin{env}...\\end{env}$``, stashed without the dollars.
+
+        Returns ``None`` when the environment is not closed at all, so the
+        dollar may still open inline math.
+        """
+        text = self.text
+        closer = f"\\end{{{opener.group(1)}}}"
+        key = f"${closer}$"
+        if self.exhausted.get(key, len(text) + 1) > opener.start():
+            index = self._find(closer, opener.end())
+            while index != -1:
+                dollar = _DOLLAR_CLOSER.match(text, index + len(closer))
+                if dollar is not None:
+                    return dollar.end(), text[opener.start() + 1 : dollar.end() - 1].strip()
+                index = self._find(closer, index + len(closer))
+            self.exhausted[key] = opener.start()
+        if self._find(closer, opener.end()) == -1:
+            return None
+        # Not closed by a dollar: the environment itself is still math.
+        return opener.start() + 1, None
+
+    def _inline_math_end(self, start: int) -> int:
+        """End of the ``$...$`` span opened at *start*, or -1.
+
+        The span stays on one line, does not start or end with blanks, and
+        closes on the first unescaped ``$`` (which must not begin ``$$``).
+        """
+        text = self.text
+        position = start + 1
+        if position >= len(text) or text[position].isspace():
+            return -1
+        while True:
+            stop = _INLINE_MATH_STOP.search(text, position)
+            if stop is None:
+                return -1
+            index = stop.start()
+            char = text[index]
+            if char == "$":
+                if index == start + 1 or text[index - 1].isspace() or text[index - 1] == "\\":
+                    return -1
+                if text[index + 1 : index + 2] == "$":
+                    return -1
+                return index + 1
+            if char == "\\":
+                if text[index + 1 : index + 2] in ("", "\n"):
+                    return -1
+                position = index + 2
+            elif char == "`" and (span := self._code_span_at(index)) is not None:
+                position = span[1]
+            elif char == "`":
+                position = index + 1
+            else:
+                return -1
+
+    def _github_math_image(self, start: int) -> tuple[int, str | None]:
+        """GitHub's ``render/math`` images become ``\\(...\\)`` spans; other tags are skipped whole."""
+        text = self.text
+        if text[start : start + 4].lower() != "<img" or not text[start + 4 : start + 5].isspace():
+            return start + 1, None
+        end = self._find(">", start)
+        if end == -1:
+            return start + 1, None
+        next_code = bisect.bisect_right(self.code_starts, start)
+        if next_code < len(self.code) and self.code[next_code][0] < end:
+            return start + 1, None
+        image = GITHUB_MATH_IMAGE_PATTERN.fullmatch(text, start, end + 1)
+        if image is None:
+            return end + 1, None
+        return end + 1, f"\\({unquote(image.group(2))}\\)"
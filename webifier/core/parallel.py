@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from webifier.interface.profiling import Span
+
+from .base import NodeContext
+from .extensions import AssetMount
+
+if TYPE_CHECKING:
+    from .builder import Builder
+
+
+@dataclass
+class PageTask:
+    """A page to render in a worker.
+
+    *kind* is ``"index"`` for sub-index pages or the content renderer key for
+    content pages; *ctx* is the context of the link that claimed the page.
+    """
+
+    kind: str
+    src: str
+    ctx: NodeContext
+
+
+@dataclass
+class PageResult:
+    """Side effects of rendering one page in a worker, merged back by the parent.
+
+    *walk* lists, in order, the search entries the page added and the pages
+    it linked to (see :meth:`Builder._apply_walk`); the parent claims pages
+    and indexes them from it in the order a serial build would.
+    """
+
+    walk: list[tuple] = field(default_factory=list)
+    asset_mounts: list[AssetMount] = field(default_factory=list)
+    manifest_pages: dict[str, Any] = field(default_factory=dict)
+    graph_pages: dict[str, dict[str, str]] = field(default_factory=dict)
+    spans: list[Span] = field(default_factory=list)
+
+
+# Workers are forked from the parent, so they inherit the configured builder
+# (Jinja environment, extension registry, root data) instead of pickling it.
+_builder: Builder | None = None
+
+
+def fork_available() -> bool:
+    """Return True when worker processes can inherit the builder by forking."""
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _render(task: PageTask) -> PageResult:
+    return _builder._render_task(task)
+
+
+def render_parallel(builder: Builder, walk: list[tuple], output: str, jobs: int) -> None:
+    """Render every page reachable from the root page's *walk* across *jobs* processes.
+
+    The parent walks the tree in serial order (:meth:`Builder._apply_walk`),
+    waiting for each page it claims.  Every page a walk links to is rendered
+    ahead of time with the context of the first link seen; a page claimed
+    through a link with another context is rendered again once that first
+    render has finished.
+    """
+    global _builder
+    _builder = builder
+    try:
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+            submitted: dict[str, tuple[PageTask, Future]] = {}
+
+            def prefetch(events: list[tuple]) -> None:
+                for event in events:
+                    task = builder._walk_task(event)
+                    if task is not None and task.src not in submitted and builder._walk_pending(event):
+                        submitted[task.src] = (task, pool.submit(_render, task))
+
+            def render(task: PageTask) -> PageResult:
+                ahead = submitted.get(task.src)
+                if ahead is None or ahead[0] != task:
+                    if ahead is not None:
+                        # Let the early render finish so it cannot overwrite this one.
+                        ahead[1].result()
+                    ahead = submitted[task.src] = (task, pool.submit(_render, task))
+                result = ahead[1].result()
+                prefetch(result.walk)
+                return result
+
+            prefetch(walk)
+            builder._apply_walk(walk, output, render)
+    finally:
+        _builder = None
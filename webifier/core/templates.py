@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import hashlib
+import os
+
+import jinja2
+from jinja2.bccache import Bucket, FileSystemBytecodeCache
+
+TEMPLATE_SUFFIXES = (".html", ".htm", ".xml", ".j2", ".jinja", ".jinja2")
+
+
+def default_cache_dir() -> str:
+    """``$WEBIFIER_CACHE_DIR``, else ``webifier`` under the user's cache directory."""
+    if os.environ.get("WEBIFIER_CACHE_DIR"):
+        return os.environ["WEBIFIER_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "webifier")
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Compiled templates kept on disk between builds.
+
+    Entries are keyed by Jinja version, template file and source hash, so
+    upgrading Jinja or switching branches never loads stale code.  A cache
+    directory that cannot be written to is silently skipped.
+    """
+
+    def __init__(self, directory: str) -> None:
+        super().__init__(directory, "%s.cache")
+
+    def get_bucket(self, environment: jinja2.Environment, name: str, filename: str | None, source: str) -> Bucket:
+        checksum = self.get_source_checksum(source)
+        digest = hashlib.sha1(f"{jinja2.__version__}\0{filename or name}\0{checksum}".encode())
+        bucket = Bucket(environment, digest.hexdigest(), checksum)
+        self.load_bytecode(bucket)
+        return bucket
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+def precompile_templates(env: jinja2.Environment, exclude: tuple[str, ...] = ()) -> tuple[list[str], list[str]]:
+    """Compile every template in *env*'s search path, filling its bytecode cache.
+
+    Hidden directories and paths under *exclude* are skipped.  Returns the
+    compiled template names and the names that failed to compile (files
+    with a template suffix that are not templates, such as generated pages).
+    """
+    excluded = tuple(os.path.normpath(path) + os.sep for path in exclude)
+
+    def wanted(name: str) -> bool:
+        if not name.endswith(TEMPLATE_SUFFIXES) or any(part.startswith(".") for part in name.split("/")):
+            return False
+        return not (os.path.normpath(name) + os.sep).startswith(excluded)
+
+    compiled, failed = [], []
+    for name in env.list_templates(filter_func=wanted):
+        try:
+            env.get_template(name)
+        except jinja2.TemplateError:
+            failed.append(name)
+        else:
+            compiled.append(name)
+    return compiled, failed
+
+
+__all__ = ["TEMPLATE_SUFFIXES", "TemplateBytecodeCache", "default_cache_dir", "precompile_templates"]
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import sys
 from dataclasses import MISSING, dataclass, field, fields
 
 from webifier import __version__
 from webifier.core.builder import Builder
+from webifier.interface.io import COPY_MODES
+from webifier.interface.profiling import profiling
 
 
 @dataclass
@@ -37,42 +41,220 @@ class WebifierArgs:
             "help": 'templates base directory (default: ".")',
         },
     )
+    incremental: bool = field(
+        default=False,
+        metadata={
+            "flag": "--incremental",
+            "help": "only re-render pages whose inputs changed since the last build",
+        },
+    )
+    jobs: int = field(
+        default=1,
+        metadata={
+            "flag": "--jobs",
+            "help": "number of processes used to render sub-pages (default: 1)",
+        },
+    )
+    copy_mode: str = field(
+        default="copy",
+        metadata={
+            "flag": "--copy-mode",
+            "choices": COPY_MODES,
+            "help": 'how assets are placed in the output: "copy", "hardlink" or "reflink" (default: "copy")',
+        },
+    )
+    cache_dir: str | None = field(
+        default=None,
+        metadata={
+            "flag": "--cache-dir",
+            "help": "directory for caches kept across builds, such as highlighted code blocks "
+            "(compiled templates default to ~/.cache/webifier)",
+        },
+    )
+    no_template_cache: bool = field(
+        default=False,
+        metadata={
+            "flag": "--no-template-cache",
+            "help": "do not keep compiled templates between builds",
+        },
+    )
+    refresh_extensions: bool = field(
+        default=False,
+        metadata={
+            "flag": "--refresh-extensions",
+            "help": "scan installed extensions again instead of using the cached list",
+        },
+    )
+    profile: str | None = field(
+        default=None,
+        metadata={
+            "flag": "--profile",
+            "help": "time every build phase, print a summary and write a Chrome trace (JSON) to this path",
+        },
+    )
+
+    description = "build a static website from YAML and Markdown."
 
     @classmethod
     def make_parser(cls) -> argparse.ArgumentParser:
         """Generate an ``ArgumentParser`` from the dataclass fields."""
-        parser = argparse.ArgumentParser(
-            description=(
-                f"Webify ({__version__}) — build a static website from YAML and Markdown."
-            )
-        )
+        parser = argparse.ArgumentParser(description=f"Webify ({__version__}) — {cls.description}")
         for f in fields(cls):
             meta = f.metadata
             flag = meta.get("flag", f"--{f.name.replace('_', '-')}")
             kwargs: dict = {"dest": f.name, "help": meta.get("help", "")}
             if f.default is not MISSING:
                 kwargs["default"] = f.default
+            field_type = str(getattr(f.type, "__name__", f.type)).removesuffix(" | None")
+            if field_type == "bool":
+                kwargs["action"] = "store_true"
+            elif field_type == "int":
+                kwargs["type"] = int
+            if "choices" in meta:
+                kwargs["choices"] = meta["choices"]
             parser.add_argument(flag, **kwargs)
         return parser
 
     @classmethod
-    def from_argv(cls, argv: list[str] | None = None) -> WebifierArgs:
+    def from_argv(cls, argv: list[str] | None = None):
         """Parse *argv* (or ``sys.argv[1:]``) and return a populated instance."""
         parser = cls.make_parser()
         ns = parser.parse_args(argv)
         return cls(**vars(ns))
 
 
-def main():
-    """Entry point for the ``webify`` console command."""
-    args = WebifierArgs.from_argv()
+@dataclass
+class GraphArgs(WebifierArgs):
+    """Command-line arguments for ``webify graph``."""
 
-    print(f"webifier: {__version__}, baseurl: {args.base_url}")
+    description = "build the site and report what every page depends on."
 
-    builder = Builder(
+    format: str = field(
+        default="json",
+        metadata={"flag": "--format", "help": 'graph format: "json" or "dot" (default: "json")'},
+    )
+    affected: str | None = field(
+        default=None,
+        metadata={"flag": "--affected", "help": "list the pages that rebuild when this file changes"},
+    )
+    top: int | None = field(
+        default=None,
+        metadata={"flag": "--top", "help": "list the N dependencies with the most dependent pages"},
+    )
+
+
+@dataclass
+class PrecompileArgs(WebifierArgs):
+    """Command-line arguments for ``webify precompile``."""
+
+    description = "compile every template in the search path into the template cache."
+
+
+@dataclass
+class ServeArgs(WebifierArgs):
+    """Command-line arguments for ``webify serve``."""
+
+    description = "build the site, serve it locally and rebuild pages as sources change."
+
+    host: str = field(
+        default="127.0.0.1",
+        metadata={"flag": "--host", "help": 'address to listen on (default: "127.0.0.1")'},
+    )
+    port: int = field(
+        default=8000,
+        metadata={"flag": "--port", "help": "port to listen on (default: 8000)"},
+    )
+
+
+def make_builder(args: WebifierArgs) -> Builder:
+    return Builder(
         base_url=args.base_url,
         repo_full_name=args.repo_full_name,
         output_dir=args.output,
         templates_dir=args.templates_dir,
+        incremental=args.incremental,
+        jobs=args.jobs,
+        copy_mode=args.copy_mode,
+        cache_dir=args.cache_dir,
+        template_cache=not args.no_template_cache,
+        extension_cache=True,
+        refresh_extensions=args.refresh_extensions,
     )
-    builder.build(index_file=args.index)
+
+
+def run_build(builder: Builder, args: WebifierArgs) -> None:
+    """Build the site, profiling it when ``--profile`` was given."""
+    if not args.profile:
+        builder.build(index_file=args.index)
+        return
+    with profiling() as profiler:
+        builder.build(index_file=args.index)
+    profiler.write(args.profile)
+    cache = builder.markdown_cache
+    print(f"\n{profiler.format_summary()}\n")
+    print(f"Markdown cache: {cache.hits} hits, {cache.misses} misses ({cache.uncacheable} with side effects)")
+    print(f"Trace written to {args.profile}")
+
+
+def graph(argv: list[str]) -> None:
+    """``webify graph`` — build the site and print its dependency graph."""
+    args = GraphArgs.from_argv(argv)
+    builder = make_builder(args)
+    # Keep stdout for the graph itself.
+    with contextlib.redirect_stdout(sys.stderr):
+        run_build(builder, args)
+
+    if args.affected:
+        for page in builder.graph.affected_pages(args.affected):
+            print(page)
+    elif args.top:
+        for path, count in builder.graph.fan_in(args.top):
+            print(f"{count:6d}  {path}")
+    elif args.format == "dot":
+        sys.stdout.write(builder.graph.to_dot())
+    else:
+        print(builder.graph.dumps())
+
+
+def precompile(argv: list[str]) -> None:
+    """``webify precompile`` — compile every template into the bytecode cache."""
+    args = PrecompileArgs.from_argv(argv)
+    builder = make_builder(args)
+    if builder.jinja_env.bytecode_cache is None:
+        print("Template cache is disabled; nothing to precompile.")
+        return
+    compiled, failed = builder.precompile(index_file=args.index)
+    print(f"Precompiled {len(compiled)} templates into {builder.jinja_env.bytecode_cache.directory}")
+    for name in failed:
+        print(f"  Skipped (not a valid template): {name}")
+
+
+def serve(argv: list[str]) -> None:
+    """``webify serve`` — development server with live reload."""
+    from webifier.interface.serve import DevServer
+
+    args = ServeArgs.from_argv(argv)
+    server = DevServer(
+        lambda: make_builder(args),
+        index_file=args.index,
+        host=args.host,
+        port=args.port,
+    )
+    server.serve_forever()
+
+
+def main(argv: list[str] | None = None):
+    """Entry point for the ``webify`` console command."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "graph":
+        return graph(argv[1:])
+    if argv and argv[0] == "serve":
+        return serve(argv[1:])
+    if argv and argv[0] == "precompile":
+        return precompile(argv[1:])
+
+    args = WebifierArgs.from_argv(argv)
+
+    print(f"webifier: {__version__}, baseurl: {args.base_url}")
+
+    run_build(make_builder(args), args)
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
 import collections
+import contextlib
+import copy
+import filecmp
 import os
-import pathlib
 import shutil
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import yaml
 
+from .profiling import profiled
+
 # ── YAML helpers — preserve insertion order ───────────────────────────────
 
+# libyaml's C parser is several times faster than the pure-Python one; both
+# build the same documents.
+try:
+    from yaml import CFullLoader as _FullLoader
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import FullLoader as _FullLoader
+    from yaml import SafeLoader as _SafeLoader
+
 _mapping_tag = yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG
 
 
@@ -25,17 +40,183 @@ yaml.add_representer(collections.OrderedDict, _dict_representer)
 yaml.add_constructor(_mapping_tag, _dict_constructor)
 
 
+class _OrderedLoader(_FullLoader):
+    """Full loader that builds ``OrderedDict`` mappings, like the loaders patched above."""
+
+
+_OrderedLoader.add_constructor(_mapping_tag, _dict_constructor)
+
+
+def load_yaml(stream: Any) -> Any:
+    """Parse a YAML document (string or file) into ordered mappings."""
+    return yaml.load(stream, Loader=_OrderedLoader)
+
+
+def safe_load_yaml(stream: Any) -> Any:
+    """Parse a YAML document (string or file) with the safe loader."""
+    return yaml.load(stream, Loader=_SafeLoader)
+
+
+# ── Dependency collection ─────────────────────────────────────────────────
+
+_dependency_stack: list[dict[str, str]] = []
+
+
+@contextlib.contextmanager
+def collect_dependencies() -> Iterator[dict[str, str]]:
+    """Collect the paths read while the block runs, mapped to how they were used.
+
+    Collectors nest: a path is only noted on the innermost active
+    collector, so a page being built inside another page does not leak
+    its inputs into its parent.
+    """
+    collected: dict[str, str] = {}
+    _dependency_stack.append(collected)
+    try:
+        yield collected
+    finally:
+        _dependency_stack.pop()
+
+
+def note_dependency(path: str, kind: str = "file") -> None:
+    """Record *path* as a dependency of whatever is currently being built.
+
+    *kind* says how the path is used (``patch``, ``load``, ``glob``,
+    ``asset``, ``template``, ``link``, …); a specific kind wins over the
+    generic ``file`` when a path is noted more than once.  Besides file
+    paths, ``glob:<pattern>`` entries stand for the set of files a pattern
+    matched.
+    """
+    if _dependency_stack:
+        collected = _dependency_stack[-1]
+        if kind != "file" or path not in collected:
+            collected[path] = kind
+
+
+# ── Parsed YAML cache ─────────────────────────────────────────────────────
+
+
+class YamlCache:
+    """Parsed YAML documents keyed by path, invalidated by mtime and size.
+
+    Callers always receive a deep copy, so mutating a loaded document never
+    changes what the next reader of the same file sees.  File collections
+    (see :func:`load_files`) are the exception: their items are shared.
+    """
+
+    def __init__(self) -> None:
+        self.entries: dict[str, tuple[tuple[int, int], Any]] = {}
+        self.collections: dict[tuple, list[Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: str, parse: Callable[[str], Any]) -> Any:
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        key = os.path.abspath(path)
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            self.hits += 1
+        else:
+            self.misses += 1
+            entry = self.entries[key] = (stamp, parse(path))
+        return copy.deepcopy(entry[1])
+
+    def load_files(self, paths: Sequence[str], parse: Callable[[str, str], Any]) -> list[Any]:
+        signature = []
+        for path in paths:
+            stat = os.stat(path)
+            signature.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+        key = (parse, tuple(signature))
+        items = self.collections.get(key)
+        if items is None:
+            self.misses += 1
+            items = self.collections[key] = _load_files(paths, parse)
+        else:
+            self.hits += 1
+        return list(items)
+
+
+_yaml_cache: YamlCache | None = None
+
+
+@contextlib.contextmanager
+def cache_yaml(cache: YamlCache | None = None) -> Iterator[YamlCache]:
+    """Parse each YAML file at most once while the block runs.
+
+    Nested blocks share the outermost cache, which is dropped when it exits.
+    Pass a long-lived *cache* to keep parsed documents between blocks (e.g.
+    between dev-server rebuilds); only its file collections start over.
+    """
+    global _yaml_cache
+    if _yaml_cache is not None:
+        yield _yaml_cache
+        return
+    if cache is None:
+        cache = YamlCache()
+    else:
+        cache.collections.clear()
+    _yaml_cache = cache
+    try:
+        yield _yaml_cache
+    finally:
+        _yaml_cache = None
+
+
 # ── Standalone functions ──────────────────────────────────────────────────
 
 
+def _parse_yaml(path: str) -> Any:
+    with open(path) as fh:
+        return load_yaml(fh)
+
+
 def read_yaml(path: str) -> Any:
-    """Load a YAML file, preserving key order."""
+    """Load a YAML file, preserving key order.
+
+    Inside :func:`cache_yaml`, unchanged files are parsed only once.
+    """
+    note_dependency(path)
+    if _yaml_cache is not None:
+        return _yaml_cache.load(path, _parse_yaml)
+    return _parse_yaml(path)
+
+
+#: Below this many files, a thread pool costs more than it saves.
+_PARALLEL_READ_MIN = 16
+
+
+def load_files(paths: Sequence[str], parse: Callable[[str, str], Any]) -> list[Any]:
+    """Return ``[parse(path, text) for path in paths]`` for the files' texts.
+
+    Large sets are read on a thread pool; parsing stays on the calling
+    thread, as the YAML parser holds the GIL.  Inside :func:`cache_yaml`
+    the list is cached by *parse* and the paths' mtimes and sizes, and
+    every caller gets a new list of the *same* item objects: treat them as
+    read-only.
+    """
+    if _yaml_cache is not None:
+        return _yaml_cache.load_files(paths, parse)
+    return _load_files(paths, parse)
+
+
+def _read_text(path: str) -> str:
     with open(path) as fh:
-        return yaml.full_load(fh)
+        return fh.read()
+
+
+def _load_files(paths: Sequence[str], parse: Callable[[str, str], Any]) -> list[Any]:
+    if len(paths) < _PARALLEL_READ_MIN:
+        texts = [_read_text(path) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as pool:
+            texts = list(pool.map(_read_text, paths))
+    return [parse(path, text) for path, text in zip(paths, texts, strict=True)]
 
 
 def read_file(path: str) -> str:
     """Read a text file and return its content."""
+    note_dependency(path)
     with open(path) as fh:
         return fh.read()
 
@@ -86,10 +267,66 @@ def prepend_baseurl(
 
 # ── FileManager ───────────────────────────────────────────────────────────
 
+#: Ways :class:`FileManager` can place a file in the output tree.
+COPY_MODES = ("copy", "hardlink", "reflink")
+
+# Linux ``FICLONE`` ioctl: share the source's extents (btrfs, XFS, …).
+_FICLONE = 0x40049409
+
+
+def _reflink(src: str, dst: str) -> None:
+    """Clone *src* to *dst* copy-on-write, falling back to a plain copy."""
+    try:
+        import fcntl
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except (ImportError, OSError):
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _hardlink(src: str, dst: str) -> None:
+    """Hard-link *dst* to *src*, copying when linking is not possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def is_up_to_date(src: str, dst: str) -> bool:
+    """Return True when *dst* already holds the contents of *src*.
+
+    Matching size and modification time are trusted (copies keep the
+    source's mtime); when only the sizes match, the contents are compared.
+    """
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except OSError:
+        return False
+    if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+        return True
+    if src_stat.st_size != dst_stat.st_size:
+        return False
+    if src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+        return True
+    if filecmp.cmp(src, dst, shallow=False):
+        # Adopt the source's timestamps so the next build takes the fast path.
+        with contextlib.suppress(OSError):
+            shutil.copystat(src, dst)
+        return True
+    return False
+
 
 class FileManager:
     """Handles file copying and directory merging for a build.
 
+    Files whose destination already matches are not copied again, and a
+    destination is installed at most once per build and source (see
+    :meth:`reset`); when several sources map to one destination, the last
+    one installed wins.
+
     Parameters
     ----------
     output_dir:
@@ -98,6 +335,9 @@ class FileManager:
         Sub-directory (relative to *output_dir*) for copied assets.
     baseurl:
         URL prefix prepended to generated paths.
+    copy_mode:
+        ``"copy"`` (default), ``"hardlink"`` or ``"reflink"``.  Links fall
+        back to copying where the file system does not support them.
     """
 
     def __init__(
@@ -105,13 +345,46 @@ class FileManager:
         output_dir: str = "webified",
         assets_dir: str = "assets",
         baseurl: str = "",
+        copy_mode: str = "copy",
     ) -> None:
+        if copy_mode not in COPY_MODES:
+            raise ValueError(f"Unknown copy mode {copy_mode!r}; expected one of {', '.join(COPY_MODES)}")
         self.output_dir = output_dir
         self.assets_dir = assets_dir
         self.baseurl = baseurl
+        self.copy_mode = copy_mode
+        self.copied: dict[str, str] = {}
+        self.skipped = 0
+
+    def reset(self) -> None:
+        """Start a new build: forget which destinations were installed."""
+        self.copied = {}
+        self.skipped = 0
+
+    def install(self, src: str, dst: str) -> bool:
+        """Place *src* at *dst* using :attr:`copy_mode`; return False if skipped."""
+        key = os.path.normpath(dst)
+        source = os.path.normpath(src)
+        if self.copied.get(key) == source or is_up_to_date(src, dst):
+            self.copied[key] = source
+            self.skipped += 1
+            return False
+        # Never write through an existing file: it may be a hard link to a source.
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(dst)
+        os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
+        if self.copy_mode == "hardlink":
+            _hardlink(src, dst)
+        elif self.copy_mode == "reflink":
+            _reflink(src, dst)
+        else:
+            shutil.copy2(src, dst)
+        self.copied[key] = source
+        return True
 
     # -- single file -------------------------------------------------------
 
+    @profiled("assets")
     def copy_file(
         self,
         src: str,
@@ -132,21 +405,16 @@ class FileManager:
 
         if not os.path.isfile(full_src):
             raise FileNotFoundError(f"Source file does not exist: {full_src}")
-
-        # Compute destination directory from the target's parent segments
-        parent = str(pathlib.Path(target).parent)
-        parent = "" if parent == "." else parent
-
-        dest_dir = os.path.join(self.output_dir, target_dir, parent)
-        os.makedirs(dest_dir, exist_ok=True)
+        note_dependency(full_src, "asset")
 
         dest_path = os.path.join(target_dir, target)
-        shutil.copy2(full_src, os.path.join(self.output_dir, dest_path))
+        self.install(full_src, os.path.join(self.output_dir, dest_path))
 
         return prepend_baseurl(dest_path, self.baseurl, ensure_html=False)
 
     # -- directory merge ---------------------------------------------------
 
+    @profiled("assets")
     def merge_dirs(
         self,
         src_dir: str,
@@ -159,6 +427,7 @@ class FileManager:
 
         When *allow_list* is given, only top-level entries whose name
         appears in the list are copied (together with their subtrees).
+        Unchanged files are skipped even when *overwrite* is set.
         """
         if os.path.abspath(src_dir) == os.path.abspath(target_dir):
             return
@@ -179,7 +448,7 @@ class FileManager:
                     continue
                 dst_file = os.path.join(dst, fname)
                 if overwrite or not os.path.exists(dst_file):
-                    shutil.copy(os.path.join(dirpath, fname), dst)
+                    self.install(os.path.join(dirpath, fname), dst_file)
 
     # -- convenience -------------------------------------------------------
 
@@ -192,9 +461,17 @@ class FileManager:
 
 
 __all__ = [
+    "COPY_MODES",
     "FileManager",
+    "YamlCache",
+    "cache_yaml",
+    "collect_dependencies",
+    "is_up_to_date",
+    "load_yaml",
+    "note_dependency",
     "prepend_baseurl",
     "read_file",
     "read_yaml",
+    "safe_load_yaml",
     "strip_suffixes",
 ]
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import os
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+# ── Spans ─────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class Span:
+    """One timed phase of the build.
+
+    *page*, *renderer* and *extension* are inherited from the enclosing span
+    unless given, so a markdown span inside a content page is attributed to
+    that page.  *self_time* excludes nested spans; *outermost* is False when
+    a span with the same name encloses this one (recursive rendering), so
+    summing outermost durations never counts time twice.
+    """
+
+    name: str
+    start: float
+    duration: float
+    self_time: float
+    outermost: bool
+    pid: int
+    page: str | None = None
+    renderer: str | None = None
+    extension: str | None = None
+
+
+@dataclass
+class _Frame:
+    name: str
+    page: str | None
+    renderer: str | None
+    extension: str | None
+    children: float = 0.0
+
+
+class Profiler:
+    """Collect build phase timings and summarize them."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self.spans: list[Span] = []
+        self._stack: list[_Frame] = []
+
+    @contextlib.contextmanager
+    def phase(
+        self,
+        name: str,
+        *,
+        page: str | None = None,
+        renderer: str | None = None,
+        extension: str | None = None,
+    ) -> Iterator[None]:
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None:
+            page = page or parent.page
+            renderer = renderer or parent.renderer
+            extension = extension or parent.extension
+        outermost = all(frame.name != name for frame in self._stack)
+        frame = _Frame(name, page, renderer, extension)
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self._stack.pop()
+            if parent is not None:
+                parent.children += duration
+            self.spans.append(
+                Span(
+                    name=name,
+                    start=start - self.origin,
+                    duration=duration,
+                    self_time=max(duration - frame.children, 0.0),
+                    outermost=outermost,
+                    pid=os.getpid(),
+                    page=page,
+                    renderer=renderer,
+                    extension=extension,
+                )
+            )
+
+    # -- reporting ---------------------------------------------------------
+
+    def summary(self) -> dict[str, Any]:
+        """Aggregate spans by phase, page, renderer kind and extension.
+
+        Pages, renderers and extensions are ranked by self time, so nested
+        pages and renderers are not counted in their parents.
+        """
+        phases: dict[str, dict[str, Any]] = defaultdict(lambda: {"calls": 0, "total": 0.0, "self": 0.0})
+        groups: dict[str, dict[str, float]] = {"pages": {}, "renderers": {}, "extensions": {}}
+        for span in self.spans:
+            row = phases[span.name]
+            row["calls"] += 1
+            row["self"] += span.self_time
+            if span.outermost:
+                row["total"] += span.duration
+            for group, key in (("pages", span.page), ("renderers", span.renderer), ("extensions", span.extension)):
+                if key is not None:
+                    groups[group][key] = groups[group].get(key, 0.0) + span.self_time
+
+        ranked = {
+            group: sorted(
+                ({"name": key, "self": value} for key, value in totals.items()),
+                key=lambda row: row["self"],
+                reverse=True,
+            )
+            for group, totals in groups.items()
+        }
+        return {
+            "wall": max((span.start + span.duration for span in self.spans), default=0.0),
+            "phases": sorted(
+                ({"name": name, **row} for name, row in phases.items()),
+                key=lambda row: row["self"],
+                reverse=True,
+            ),
+            **ranked,
+        }
+
+    def format_summary(self, limit: int = 15) -> str:
+        """Render :meth:`summary` as plain-text tables."""
+        summary = self.summary()
+        lines = [f"Build profile ({summary['wall']:.3f}s wall)", ""]
+        lines.append(f"  {'phase':<28} {'calls':>7} {'total (s)':>10} {'self (s)':>10}")
+        for row in summary["phases"]:
+            lines.append(f"  {row['name']:<28} {row['calls']:>7} {row['total']:>10.3f} {row['self']:>10.3f}")
+        for group in ("pages", "renderers", "extensions"):
+            rows = summary[group][:limit]
+            if not rows:
+                continue
+            lines.extend(["", f"  {'slowest ' + group:<48} {'self (s)':>10}"])
+            for row in rows:
+                lines.append(f"  {row['name']:<48} {row['self']:>10.3f}")
+        return "\n".join(lines)
+
+    def trace_events(self) -> list[dict[str, Any]]:
+        """Return the spans as Chrome trace "complete" events."""
+        events = []
+        for span in sorted(self.spans, key=lambda span: span.start):
+            args = {
+                key: getattr(span, key) for key in ("page", "renderer", "extension") if getattr(span, key) is not None
+            }
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "webifier",
+                    "ph": "X",
+                    "ts": round(span.start * 1e6, 3),
+                    "dur": round(span.duration * 1e6, 3),
+                    "pid": span.pid,
+                    "tid": span.pid,
+                    "args": args,
+                }
+            )
+        return events
+
+    def write(self, path: str) -> None:
+        """Write a Chrome trace (``chrome://tracing``, Perfetto) with the summary embedded."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as fh:
+            json.dump(
+                {"traceEvents": self.trace_events(), "displayTimeUnit": "ms", "summary": self.summary()},
+                fh,
+                indent=1,
+            )
+
+
+# ── Active profiler ───────────────────────────────────────────────────────
+
+_profiler: Profiler | None = None
+_inactive = contextlib.nullcontext()
+
+
+@contextlib.contextmanager
+def profiling() -> Iterator[Profiler]:
+    """Profile the build phases that run inside the block."""
+    global _profiler
+    previous, _profiler = _profiler, Profiler()
+    try:
+        with _profiler.phase("build"):
+            yield _profiler
+    finally:
+        _profiler = previous
+
+
+def active_profiler() -> Profiler | None:
+    return _profiler
+
+
+def phase(name: str, **attribution: str | None) -> contextlib.AbstractContextManager:
+    """Time the block as *name* when profiling; a no-op otherwise.
+
+    *attribution* may set ``page``, ``renderer`` or ``extension``.
+    """
+    if _profiler is None:
+        return _inactive
+    return _profiler.phase(name, **attribution)
+
+
+def profiled(name: str) -> Callable[[Callable], Callable]:
+    """Decorator form of :func:`phase`."""
+
+    def decorate(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return fn(*args, **kwargs)
+            with _profiler.phase(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+__all__ = ["Profiler", "Span", "active_profiler", "phase", "profiled", "profiling"]
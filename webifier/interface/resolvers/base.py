@@ -49,8 +49,7 @@ class Resolver:
         if len(args) == 3:
             return self.transform(*args)
         raise TypeError(
-            f"{type(self).__name__} called with {len(args)} args "
-            f"(expected 2 for source or 3 for transform)"
+            f"{type(self).__name__} called with {len(args)} args (expected 2 for source or 3 for transform)"
         )
 
     def source(self, arg: str, ctx: Context) -> Any:
@@ -59,9 +58,23 @@ class Resolver:
         Override for resolvers that appear first in a pipeline
         (e.g. ``load``, ``env``, ``ref``).
         """
-        raise NotImplementedError(
-            f"{type(self).__name__} cannot be used as a source"
-        )
+        raise NotImplementedError(f"{type(self).__name__} cannot be used as a source")
+
+    def fuse(
+        self,
+        data: Any,
+        arg: str,
+        following: list[tuple[Any, str]],
+        ctx: Context,
+    ) -> tuple[Any, int] | None:
+        """Optionally transform *data* together with the steps after this one.
+
+        *following* lists the ``(resolver, arg)`` pairs still to run.
+        Return ``(result, consumed)`` when this resolver applied itself and
+        the first *consumed* of them at once, or ``None`` (the default) to
+        run as a plain :meth:`transform`.
+        """
+        return None
 
     def transform(self, data: Any, arg: str, ctx: Context) -> Any:
         """Transform piped *data*.
@@ -69,6 +82,4 @@ class Resolver:
         Override for resolvers that receive input from a previous
         step (e.g. ``sort``, ``filter``, ``limit``).
         """
-        raise NotImplementedError(
-            f"{type(self).__name__} cannot be used as a transform"
-        )
+        raise NotImplementedError(f"{type(self).__name__} cannot be used as a transform")
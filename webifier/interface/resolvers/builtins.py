@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import datetime
 import glob as _glob
+import heapq
 import os
+from collections.abc import Callable
 from typing import Any
 
+from webifier.interface.io import load_files, note_dependency, safe_load_yaml
+
 from .base import Context, Resolver
-from .utils import git_timestamp, resolve_path
+from .utils import git_index, git_timestamp, resolve_path
 
 # ── Source resolvers ──────────────────────────────────────────────────────
 
@@ -15,33 +19,36 @@ class Load(Resolver):
     """Load a YAML or text file: ``${load:path/to/file.yml}``"""
 
     def source(self, arg: str, ctx: Context) -> Any:
-        import yaml
-
+        note_dependency(arg, "load")
         if arg.endswith((".yml", ".yaml")):
             with open(arg) as f:
-                return yaml.safe_load(f) or {}
+                return safe_load_yaml(f) or {}
         with open(arg) as f:
             return f.read()
 
 
 class Glob(Resolver):
-    """Glob for files and load each: ``${glob:posts/*.yml}``"""
+    """Glob for files and load each: ``${glob:posts/*.yml}``
+
+    Within a build, the loaded items are shared by every page that globs
+    the same unchanged files.
+    """
 
     def source(self, arg: str, ctx: Context) -> list:
-        import yaml
-
-        results: list[Any] = []
-        for path in sorted(_glob.glob(arg, recursive=True)):
-            if path.endswith((".yml", ".yaml")):
-                with open(path) as f:
-                    item = yaml.safe_load(f) or {}
-                if isinstance(item, dict):
-                    item["_source"] = path
-                results.append(item)
-            else:
-                with open(path) as f:
-                    results.append({"content": f.read(), "_source": path})
-        return results
+        note_dependency(f"glob:{arg}", "glob")
+        paths = sorted(_glob.glob(arg, recursive=True))
+        for path in paths:
+            note_dependency(path, "glob")
+        return load_files(paths, _load_glob_item)
+
+
+def _load_glob_item(path: str, text: str) -> Any:
+    if path.endswith((".yml", ".yaml")):
+        item = safe_load_yaml(text) or {}
+        if isinstance(item, dict):
+            item["_source"] = path
+        return item
+    return {"content": text, "_source": path}
 
 
 class Env(Resolver):
@@ -89,11 +96,7 @@ class Asset(Resolver):
 
     def source(self, arg: str, ctx: Context) -> str:
         base = resolve_path(ctx.root, "config.baseurl", default="")
-        return (
-            f"/{base}/assets/{arg}".replace("//", "/")
-            if base
-            else f"/assets/{arg}"
-        )
+        return f"/{base}/assets/{arg}".replace("//", "/") if base else f"/assets/{arg}"
 
 
 class Md(Resolver):
@@ -101,6 +104,7 @@ class Md(Resolver):
 
     def source(self, arg: str, ctx: Context) -> str:
         if os.path.isfile(arg):
+            note_dependency(arg, "load")
             with open(arg) as f:
                 return f.read()
         return arg
@@ -109,6 +113,11 @@ class Md(Resolver):
 # ── Transform resolvers ──────────────────────────────────────────────────
 
 
+def _builtin(resolver: Any, *classes: type) -> bool:
+    """Whether *resolver* is one of *classes* itself (subclasses are never fused)."""
+    return type(resolver) in classes
+
+
 class Sort(Resolver):
     """Sort a list: ``${… | sort:name}`` or ``${… | sort:-date}``"""
 
@@ -119,23 +128,27 @@ class Sort(Resolver):
         key = arg.lstrip("-") or "name"
         return sorted(data, key=self._key_fn(key), reverse=desc)
 
+    def fuse(self, data: Any, arg: str, following: list, ctx: Context):
+        # ``sort | limit:N`` → the N first items, selected with a heap.
+        if not _builtin(self, Sort) or not isinstance(data, list) or not following:
+            return None
+        resolver, limit = following[0]
+        if not _builtin(resolver, Limit) or not limit.isdigit():
+            return None
+        key = self._key_fn(arg.lstrip("-") or "name")
+        select = heapq.nlargest if arg.startswith("-") else heapq.nsmallest
+        return select(int(limit), data, key=key), 1
+
     @staticmethod
     def _key_fn(key: str):
         if key == "name":
-            return lambda x: (
-                x.get("_source", "") if isinstance(x, dict) else str(x)
-            )
+            return lambda x: x.get("_source", "") if isinstance(x, dict) else str(x)
         if key == "modified":
-            return lambda x: (
-                os.path.getmtime(x["_source"])
-                if isinstance(x, dict) and "_source" in x
-                else 0
-            )
+            return lambda x: os.path.getmtime(x["_source"]) if isinstance(x, dict) and "_source" in x else 0
         if key.startswith("git"):
-            return lambda x: git_timestamp(x, key)
-        return lambda x: (
-            x.get(key, "") if isinstance(x, dict) else str(x)
-        )
+            index = git_index()
+            return lambda x: git_timestamp(x, key, index)
+        return lambda x: x.get(key, "") if isinstance(x, dict) else str(x)
 
 
 class Reverse(Resolver):
@@ -162,39 +175,76 @@ class Offset(Resolver):
             return data[int(arg) :]
         return data
 
+    def fuse(self, data: Any, arg: str, following: list, ctx: Context):
+        # ``offset:M | limit:N`` → one slice.
+        if not _builtin(self, Offset) or not isinstance(data, list) or not arg.isdigit() or not following:
+            return None
+        resolver, limit = following[0]
+        if not _builtin(resolver, Limit) or not limit.isdigit():
+            return None
+        start = int(arg)
+        return data[start : start + int(limit)], 1
+
 
 class Filter(Resolver):
     """Filter items: ``${… | filter:key=value}`` or ``${… | filter:key}``"""
 
+    keep = True  # keep the items that match
+
     def transform(self, data: Any, arg: str, ctx: Context) -> Any:
         if not isinstance(data, list):
             return data
-        if "=" in arg:
-            k, v = arg.split("=", 1)
-            return [
-                i
-                for i in data
-                if isinstance(i, dict) and str(i.get(k)) == v
-            ]
-        return [i for i in data if isinstance(i, dict) and i.get(arg)]
+        matches = _match(arg)
+        return [i for i in data if matches(i) is self.keep]
+
+    def fuse(self, data: Any, arg: str, following: list, ctx: Context):
+        # A run of ``filter``/``exclude`` steps → one pass over the items.
+        if not _builtin(self, Filter, Exclude) or not isinstance(data, list):
+            return None
+        tests = [(*_test(arg), self.keep)]
+        for resolver, next_arg in following:
+            if not _builtin(resolver, Filter, Exclude):
+                break
+            tests.append((*_test(next_arg), resolver.keep))
+        if len(tests) == 1:
+            return None
+        # Items that are not dicts match no test: only exclusions keep them.
+        keep_others = not any(keep for _, _, keep in tests)
+        kept = []
+        for item in data:
+            if not isinstance(item, dict):
+                if keep_others:
+                    kept.append(item)
+                continue
+            for key, value, keep in tests:
+                found = item.get(key)
+                if (bool(found) if value is None else str(found) == value) is not keep:
+                    break
+            else:
+                kept.append(item)
+        return kept, len(tests) - 1
 
 
-class Exclude(Resolver):
+class Exclude(Filter):
     """Exclude items: ``${… | exclude:key=value}``"""
 
-    def transform(self, data: Any, arg: str, ctx: Context) -> Any:
-        if not isinstance(data, list):
-            return data
-        if "=" in arg:
-            k, v = arg.split("=", 1)
-            return [
-                i
-                for i in data
-                if not (isinstance(i, dict) and str(i.get(k)) == v)
-            ]
-        return [
-            i for i in data if not (isinstance(i, dict) and i.get(arg))
-        ]
+    keep = False
+
+
+def _test(arg: str) -> tuple[str, str | None]:
+    """``(key, value)`` for ``key=value``, ``(key, None)`` for a truthy ``key``."""
+    if "=" in arg:
+        key, value = arg.split("=", 1)
+        return key, value
+    return arg, None
+
+
+def _match(arg: str) -> Callable[[Any], bool]:
+    """Item test for ``filter``/``exclude``."""
+    key, value = _test(arg)
+    if value is None:
+        return lambda i: isinstance(i, dict) and bool(i.get(key))
+    return lambda i: isinstance(i, dict) and str(i.get(key)) == value
 
 
 class Flatten(Resolver):
@@ -218,22 +268,46 @@ class Unique(Resolver):
     def transform(self, data: Any, arg: str, ctx: Context) -> Any:
         if not isinstance(data, list):
             return data
-        if arg:
-            seen: set[Any] = set()
-            result: list[Any] = []
-            for item in data:
-                val = item.get(arg) if isinstance(item, dict) else item
-                if val not in seen:
-                    seen.add(val)
-                    result.append(item)
-            return result
-        result = []
+        seen: set[Any] = set()
+        unhashable: list[Any] = []  # values without a canonical key, compared one by one
+        result: list[Any] = []
         for item in data:
-            if item not in result:
-                result.append(item)
+            val = item.get(arg) if arg and isinstance(item, dict) else item
+            try:
+                key = _canonical(val)
+            except TypeError:
+                if val in unhashable:
+                    continue
+                unhashable.append(val)
+            else:
+                if key in seen:
+                    continue
+                seen.add(key)
+            result.append(item)
         return result
 
 
+_DICT, _LIST = object(), object()
+
+
+def _canonical(value: Any) -> Any:
+    """A hashable key equal for exactly the values that compare equal.
+
+    Dicts become frozensets of their items and lists tagged tuples, so
+    ``{"a": 1, "b": 2}`` and ``{"b": 2, "a": 1}`` share a key while
+    ``[1]`` and ``(1,)`` do not.  Raises ``TypeError`` for other
+    unhashable values.
+    """
+    if isinstance(value, dict):
+        return _DICT, frozenset((k, _canonical(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return _LIST, tuple(_canonical(v) for v in value)
+    if isinstance(value, tuple):
+        return tuple(_canonical(v) for v in value)
+    hash(value)
+    return value
+
+
 class Map(Resolver):
     """Extract a key from each item: ``${… | map:title}``"""
 
@@ -258,12 +332,6 @@ class Group(Resolver):
             return data
         groups: dict[str, list] = {}
         for item in data:
-            k = (
-                str(item.get(arg, "other"))
-                if isinstance(item, dict)
-                else "other"
-            )
+            k = str(item.get(arg, "other")) if isinstance(item, dict) else "other"
             groups.setdefault(k, []).append(item)
         return groups
-
-
@@ -1,19 +1,18 @@
 from __future__ import annotations
 
-import re
 from collections.abc import Callable
 from typing import Any
 
 from .base import Context, Resolver
-from .utils import parse_step
-
-# Matches the *innermost* ${…} (no nested braces inside).
-# Resolving inside-out naturally handles ${${ref:.key}} etc.
-_INNER_RE = re.compile(r"\$\{([^{}]+)\}")
+from .expressions import Interpolation, Pipeline, compile_template, parse_pipeline
 
 #: Anything the engine can call: a Resolver instance *or* a plain function.
 ResolverLike = Resolver | Callable[..., Any]
 
+# How many times a substituted value may itself contain ``${}`` (guards
+# against references that include themselves).
+_MAX_DEPTH = 16
+
 
 class Engine:
     """Recursive ``${}`` resolver engine with pipe chaining.
@@ -49,7 +48,11 @@ class Engine:
         root: dict | None = None,
         current: dict | None = None,
     ) -> Any:
-        """Expand all ``${}`` interpolations in *data*."""
+        """Expand all ``${}`` interpolations in *data*.
+
+        Dicts and lists without interpolations are returned as they are,
+        not copied; the result may share them with *data*.
+        """
         if root is None:
             root = data if isinstance(data, dict) else {}
         if current is None:
@@ -58,54 +61,114 @@ class Engine:
 
     # -- recursive walk ----------------------------------------------------
 
+    # Containers are copied only once one of their values changes, so
+    # subtrees without interpolations come back as the very same objects.
+
     def _walk(self, data: Any, ctx: Context) -> Any:
         if isinstance(data, str):
-            return self._resolve_string(data, ctx)
+            return self._resolve_string(data, ctx) if "${" in data else data
         if isinstance(data, dict):
-            return {
-                k: self._walk(v, Context(ctx.root, data))
-                for k, v in data.items()
-            }
+            return self._walk_dict(data, ctx)
         if isinstance(data, list):
-            return [self._walk(item, ctx) for item in data]
+            return self._walk_list(data, ctx)
         return data
 
+    def _walk_dict(self, data: dict, ctx: Context) -> dict:
+        inner = Context(ctx.root, data)
+        result = None
+        for key, value in data.items():
+            if isinstance(value, str):
+                if "${" not in value:
+                    continue
+                new = self._resolve_string(value, inner)
+            elif isinstance(value, (dict, list)):
+                new = self._walk(value, inner)
+            else:
+                continue
+            if new is not value:
+                if result is None:
+                    result = dict(data)
+                result[key] = new
+        return data if result is None else result
+
+    def _walk_list(self, data: list, ctx: Context) -> list:
+        result = None
+        for index, item in enumerate(data):
+            if isinstance(item, str):
+                if "${" not in item:
+                    continue
+                new = self._resolve_string(item, ctx)
+            elif isinstance(item, (dict, list)):
+                new = self._walk(item, ctx)
+            else:
+                continue
+            if new is not item:
+                if result is None:
+                    result = list(data)
+                result[index] = new
+        return data if result is None else result
+
     # -- string resolution (handles nesting) -------------------------------
 
-    def _resolve_string(self, s: str, ctx: Context) -> Any:
+    def _resolve_string(self, s: str, ctx: Context, depth: int = 0) -> Any:
         """Resolve ``${}`` expressions inside-out for nesting support.
 
-        Iterates until no more innermost ``${…}`` remain, supporting
-        patterns like ``${${ref:.key}}`` and ``${load:${ref:.file}}``.
+        The string is parsed once (and cached) by :func:`compile_template`,
+        which supports patterns like ``${${ref:.key}}`` and
+        ``${load:${ref:.file}}``.  Evaluation walks the parsed segments
+        without rescanning the string; only a substituted value that itself
+        contains ``${`` is expanded, up to ``_MAX_DEPTH`` levels deep.
         """
-        prev = None
-        while "${" in s and s != prev:
-            prev = s
-            m = _INNER_RE.search(s)
-            if not m:
-                break
-
-            result = self._pipeline(m.group(1), ctx)
-
-            # Full-value: the *entire* string (ignoring whitespace) is one
-            # interpolation → return the resolved value with its original type
-            if not s[: m.start()].strip() and not s[m.end() :].strip():
-                return result
-
-            # Partial: stringify and keep resolving remaining expressions
-            text = str(result) if result is not None else ""
-            s = s[: m.start()] + text + s[m.end() :]
-
-        return s
+        if "${" not in s:
+            return s
+        template = compile_template(s)
+        if len(template.segments) == 1 and isinstance(template.segments[0], str):
+            return s  # no well-formed ``${…}`` in it
+
+        parts: list[str] = []
+        blank = True  # nothing but whitespace rendered so far
+        for index, segment in enumerate(template.segments):
+            if isinstance(segment, str):
+                text = segment
+            else:
+                result = self._interpolate(segment, ctx, depth)
+                # Full-value: the *entire* string (ignoring whitespace) is one
+                # interpolation → return the resolved value with its original type
+                if blank and index == template.tail and not isinstance(result, _Unresolved):
+                    return result
+                text = self._insert(result, ctx, depth)
+            parts.append(text)
+            if blank and text.strip():
+                blank = False
+        return "".join(parts)
+
+    def _interpolate(self, node: Interpolation, ctx: Context, depth: int) -> Any:
+        """Evaluate one ``${…}``, resolving nested interpolations in its body first."""
+        if node.pipeline is not None:
+            return self._pipeline(node.pipeline, ctx)
+        body = "".join(
+            segment if isinstance(segment, str) else self._insert(self._interpolate(segment, ctx, depth), ctx, depth)
+            for segment in node.body
+        )
+        if not body or "{" in body or "}" in body:
+            # The resolved body no longer forms an expression; keep it as text.
+            return _Unresolved("${" + body + "}")
+        return self._pipeline(parse_pipeline(body), ctx)
+
+    def _insert(self, value: Any, ctx: Context, depth: int) -> str:
+        """Text of a value substituted into a string, with its own ``${}`` expanded."""
+        text = str(value) if value is not None else ""
+        if "${" in text and depth < _MAX_DEPTH:
+            resolved = self._resolve_string(text, ctx, depth + 1)
+            text = str(resolved) if resolved is not None else ""
+        return text
 
     # -- pipeline evaluation -----------------------------------------------
 
-    def _pipeline(self, expr: str, ctx: Context) -> Any:
+    def _pipeline(self, pipeline: Pipeline, ctx: Context) -> Any:
         """Evaluate ``source:arg | transform:arg | …``."""
-        steps = [s.strip() for s in expr.split(" | ")]
-
         # First step — source call: resolver(arg, ctx)
-        name, arg = parse_step(steps[0])
+        name, arg = pipeline.steps[0]
         resolver = self._resolvers.get(name)
 
         if resolver:
@@ -115,13 +178,31 @@ class Engine:
             ref = self._resolvers.get("ref")
             value = ref(arg, ctx) if ref else arg
         else:
-            return expr  # unknown resolver, return raw
+            return pipeline.expr  # unknown resolver, return raw
 
         # Remaining steps — transform call: resolver(data, arg, ctx)
-        for step in steps[1:]:
-            name, arg = parse_step(step)
-            resolver = self._resolvers.get(name)
-            if resolver:
-                value = resolver(value, arg, ctx)
+        chain = [(resolver, arg) for name, arg in pipeline.steps[1:] if (resolver := self._resolvers.get(name))]
+        return self._apply_transforms(value, chain, ctx)
+
+    def _apply_transforms(self, value: Any, chain: list[tuple[ResolverLike, str]], ctx: Context) -> Any:
+        """Run transform steps, letting a :class:`Resolver` fuse with the steps after it.
 
+        ``sort`` followed by ``limit`` selects the top items with a heap,
+        ``offset`` followed by ``limit`` takes one slice, and runs of
+        ``filter``/``exclude`` test every item in a single pass.
+        """
+        index = 0
+        while index < len(chain):
+            resolver, arg = chain[index]
+            fused = resolver.fuse(value, arg, chain[index + 1 :], ctx) if isinstance(resolver, Resolver) else None
+            if fused is None:
+                value = resolver(value, arg, ctx)
+                index += 1
+            else:
+                value, consumed = fused
+                index += 1 + consumed
         return value
+
+
+class _Unresolved(str):
+    """Text of a ``${…}`` that stays literal once its nested values are in."""
@@ -0,0 +1,155 @@
+"""Parsed form of strings containing ``${}`` interpolations.
+
+A string is parsed once into a :class:`Template`: literal text segments and
+:class:`Interpolation` nodes.  An interpolation whose body is plain text
+carries its :class:`Pipeline` pre-split into ``(name, arg)`` steps; one with
+nested interpolations (``${load:${ref:.file}}``) keeps its body segments and
+parses the pipeline once the nested values are known.
+
+Parsing follows the innermost-first rule of the original regex engine: a
+body may not contain a bare ``{`` or ``}``, and a ``${`` that never closes
+cleanly is literal text, while the interpolations nested inside it still
+resolve.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+from .utils import parse_step
+
+# What ends a run of body text: a brace, or the start of a nested ``${``.
+_BODY_STOP = re.compile(r"\$\{|[{}]")
+# An interpolation without nesting: the common case, parsed in one pass.
+_SIMPLE = re.compile(r"\$\{([^{}]+)\}")
+_CACHE_SIZE = 1 << 16
+
+
+@dataclass(frozen=True)
+class Pipeline:
+    """``source:arg | transform:arg | …`` split into ``(name, arg)`` steps."""
+
+    expr: str
+    steps: tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True)
+class Interpolation:
+    """One ``${…}``: its body segments, and its pipeline when the body is static."""
+
+    body: tuple[str | Interpolation, ...]
+    pipeline: Pipeline | None
+
+
+@dataclass(frozen=True)
+class Template:
+    """A parsed string.
+
+    ``tail`` is the index of the last interpolation when only whitespace
+    follows it.  If everything rendered before it is blank too, that
+    interpolation is the whole value and keeps its type.
+    """
+
+    segments: tuple[str | Interpolation, ...]
+    tail: int
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_pipeline(expr: str) -> Pipeline:
+    """Split and parse a pipeline expression (the text between ``${`` and ``}``)."""
+    return Pipeline(expr, tuple(parse_step(step.strip()) for step in expr.split(" | ")))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def compile_template(text: str) -> Template:
+    """Parse *text* into a :class:`Template`; results are cached by string."""
+    matches = list(_SIMPLE.finditer(text))
+    # When every ``${`` opens a plain interpolation, nothing nests or fails.
+    simple = len(matches) == text.count("${")
+    segments = _simple_segments(text, matches) if simple else _Parser(text).parse()
+    tail = len(segments)
+    while tail and isinstance(segments[tail - 1], str) and not segments[tail - 1].strip():
+        tail -= 1
+    if tail and isinstance(segments[tail - 1], Interpolation):
+        tail -= 1
+    return Template(segments, tail)
+
+
+def _simple_segments(text: str, matches: list[re.Match]) -> tuple[str | Interpolation, ...]:
+    segments: list[str | Interpolation] = []
+    literal = 0
+    for match in matches:
+        if literal < match.start():
+            segments.append(text[literal : match.start()])
+        body = match.group(1)
+        segments.append(Interpolation((body,), parse_pipeline(body)))
+        literal = match.end()
+    if literal < len(text):
+        segments.append(text[literal:])
+    return tuple(segments)
+
+
+class _Parser:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        # Positions of ``${`` known not to close cleanly; they are literal text.
+        self.failed: set[int] = set()
+
+    def parse(self) -> tuple[str | Interpolation, ...]:
+        text = self.text
+        segments: list[str | Interpolation] = []
+        literal = 0
+        i = text.find("${")
+        while i != -1:
+            interpolation, end = self._interpolation(i)
+            if interpolation is None:
+                i = text.find("${", i + 2)
+                continue
+            if literal < i:
+                _append(segments, text[literal:i])
+            segments.append(interpolation)
+            literal = end
+            i = text.find("${", end)
+        if literal < len(text):
+            _append(segments, text[literal:])
+        return tuple(segments)
+
+    def _interpolation(self, start: int) -> tuple[Interpolation | None, int]:
+        """Parse the ``${`` at *start*; on failure mark it (and every open one inside) literal."""
+        if start in self.failed:
+            return None, start
+        text = self.text
+        body: list[str | Interpolation] = []
+        i = start + 2
+        while (match := _BODY_STOP.search(text, i)) is not None:
+            stop = match.start()
+            if i < stop:
+                _append(body, text[i:stop])
+            token = match.group()
+            if token == "}":
+                if not body:
+                    break  # ``${}`` is not an interpolation
+                static = len(body) == 1 and isinstance(body[0], str)
+                pipeline = parse_pipeline(body[0]) if static else None
+                return Interpolation(tuple(body), pipeline), stop + 1
+            if token == "{":
+                break
+            nested, end = self._interpolation(stop)
+            if nested is None:
+                break
+            body.append(nested)
+            i = end
+        self.failed.add(start)
+        return None, start
+
+
+def _append(segments: list[str | Interpolation], literal: str) -> None:
+    if segments and isinstance(segments[-1], str):
+        segments[-1] += literal
+    else:
+        segments.append(literal)
+
+
+__all__ = ["Interpolation", "Pipeline", "Template", "compile_template", "parse_pipeline"]
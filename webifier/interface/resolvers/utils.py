@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import contextlib
+import os
 import subprocess
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 _NO_DEFAULT = object()
@@ -34,7 +39,7 @@ def resolve_path(
         KeyError: If the path cannot be resolved and no *default* is given.
     """
     node = context
-    for part in path.split(separator):
+    for part in _split_path(path, separator):
         # try __getitem__ first (dicts, sequences, …)
         try:
             node = node[part]
@@ -52,13 +57,16 @@ def resolve_path(
         # neither worked
         if default is not _NO_DEFAULT:
             return default
-        raise KeyError(
-            f"Cannot resolve segment {part!r} in path {path!r}"
-        )
+        raise KeyError(f"Cannot resolve segment {part!r} in path {path!r}")
 
     return node
 
 
+@lru_cache(maxsize=4096)
+def _split_path(path: str, separator: str) -> tuple[str, ...]:
+    return tuple(path.split(separator))
+
+
 def place_at_path(
     root: dict,
     path: str,
@@ -88,11 +96,7 @@ def place_at_path(
         current = current[part]
 
     final = parts[-1]
-    if (
-        final in current
-        and isinstance(current[final], dict)
-        and isinstance(value, dict)
-    ):
+    if final in current and isinstance(current[final], dict) and isinstance(value, dict):
         current[final].update(value)
     else:
         current[final] = value
@@ -106,23 +110,126 @@ def parse_step(step: str) -> tuple[str, str]:
     return step.strip(), ""
 
 
-def git_timestamp(item: dict, key: str) -> float:
-    """Return a git timestamp for *item* (must have ``_source``)."""
+# ── Git metadata ──────────────────────────────────────────────────────────
+
+
+@dataclass
+class GitTimes:
+    """Timestamps of a tracked file, from its commit history."""
+
+    authored: float = 0
+    committed: float = 0
+    created: float = 0  # authored time of the commit that added the file, following renames
+
+
+class GitIndex:
+    """Authored, committed and created times of every file in a repository.
+
+    Built from a single ``git log --name-status`` pass over the repository
+    containing the working directory, instead of one ``git log`` per file.
+    Outside a git repository (or without git) the index is empty and every
+    lookup returns ``None``.
+    """
+
+    def __init__(self, cwd: str | None = None) -> None:
+        self.files: dict[str, GitTimes] = {}
+        self.root: str | None = None
+        try:
+            self._build(cwd)
+        except (OSError, subprocess.SubprocessError, ValueError):
+            self.files.clear()
+
+    def lookup(self, path: str) -> GitTimes | None:
+        """Times for *path* (relative to the working directory, or absolute)."""
+        return self.files.get(os.path.realpath(path)) if self.root else None
+
+    def _build(self, cwd: str | None) -> None:
+        root = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=_GIT_TIMEOUT,
+        )
+        if root.returncode != 0:
+            return
+        self.root = os.path.realpath(root.stdout.strip())
+        log = subprocess.run(
+            ["git", "log", "--reverse", "-M", "--name-status", "-z", "--format=%x01%at %ct"],
+            cwd=self.root,
+            capture_output=True,
+            text=True,
+            timeout=_GIT_TIMEOUT,
+        )
+        if log.returncode != 0:
+            return  # e.g. a repository without commits
+
+        # Oldest commit first: later commits overwrite the modification times.
+        for chunk in log.stdout.split("\x01")[1:]:
+            header, _, changes = chunk.partition("\0")
+            authored, committed = (float(value) for value in header.split())
+            tokens = changes.lstrip("\n").split("\0")
+            index = 0
+            while index < len(tokens) and tokens[index]:
+                status = tokens[index]
+                if status[0] in "RC":
+                    old, path = tokens[index + 1], tokens[index + 2]
+                    index += 3
+                else:
+                    old, path = None, tokens[index + 1]
+                    index += 2
+                if status[0] == "D":
+                    continue
+                times = self.files.get(path)
+                if times is None:
+                    times = self.files[path] = GitTimes()
+                    previous = self.files.get(old) if status[0] == "R" else None
+                    times.created = previous.created if previous else authored
+                times.authored, times.committed = authored, committed
+        self.files = {os.path.join(self.root, path): times for path, times in self.files.items()}
+
+
+_GIT_TIMEOUT = 60
+_git_index: GitIndex | None = None
+_git_scope_depth = 0
+
+
+@contextlib.contextmanager
+def cache_git_metadata() -> Iterator[None]:
+    """Share one lazily built :class:`GitIndex` while the block runs (e.g. a build)."""
+    global _git_index, _git_scope_depth
+    _git_scope_depth += 1
+    try:
+        yield
+    finally:
+        _git_scope_depth -= 1
+        if not _git_scope_depth:
+            _git_index = None
+
+
+def git_index() -> GitIndex:
+    """The index of the active :func:`cache_git_metadata` block, else a fresh one."""
+    global _git_index
+    if not _git_scope_depth:
+        return GitIndex()
+    if _git_index is None:
+        _git_index = GitIndex()
+    return _git_index
+
+
+def git_timestamp(item: dict, key: str, index: GitIndex | None = None) -> float:
+    """Return a git timestamp for *item* (must have ``_source``).
+
+    *key* is ``git:authored``, ``git:created`` or any other ``git…`` key for
+    the commit time.  Pass *index* when looking up many items.
+    """
     if not isinstance(item, dict) or "_source" not in item:
         return 0
-    src = item["_source"]
-    fmt = (
-        "--format=%at"
-        if key in ("git:authored", "git:created")
-        else "--format=%ct"
-    )
-    try:
-        cmd = ["git", "log", "-1", fmt, "--", src]
-        if key == "git:created":
-            cmd = [
-                "git", "log", "--follow", "--diff-filter=A", fmt, "--", src,
-            ]
-        r = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-        return float(r.stdout.strip() or 0)
-    except Exception:
+    times = (index or git_index()).lookup(item["_source"])
+    if times is None:
         return 0
+    if key == "git:created":
+        return times.created
+    if key == "git:authored":
+        return times.authored
+    return times.committed
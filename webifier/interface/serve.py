@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import functools
+import os
+import threading
+from collections.abc import Callable
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from webifier.core.builder import Builder
+from webifier.interface.io import strip_suffixes
+
+RELOAD_PATH = "/__webifier__/reload"
+RELOAD_SCRIPT = f'<script>new EventSource("{RELOAD_PATH}").onmessage = function () {{ location.reload(); }};</script>'
+
+# Directories never worth watching for source changes.
+_IGNORED_DIRS = frozenset({"__pycache__", "node_modules"})
+
+
+class SourceWatcher:
+    """Poll a source tree and report which files changed between scans."""
+
+    def __init__(self, root: str = ".", exclude: tuple[str, ...] = ()) -> None:
+        self.root = root
+        self.exclude = {os.path.abspath(path) for path in exclude}
+        self.snapshot = self.scan()
+
+    def scan(self) -> dict[str, tuple[int, int]]:
+        """Return ``{path: (mtime_ns, size)}`` for every watched file."""
+        found: dict[str, tuple[int, int]] = {}
+        for dirpath, dirs, files in os.walk(self.root):
+            dirs[:] = [
+                name
+                for name in dirs
+                if not name.startswith(".")
+                and name not in _IGNORED_DIRS
+                and os.path.abspath(os.path.join(dirpath, name)) not in self.exclude
+            ]
+            for name in files:
+                path = os.path.normpath(os.path.join(dirpath, name))
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                found[path] = (stat.st_mtime_ns, stat.st_size)
+        return found
+
+    def changes(self) -> list[str]:
+        """Return the files added, removed or modified since the last call."""
+        current = self.scan()
+        paths = current.keys() | self.snapshot.keys()
+        changed = {path for path in paths if current.get(path) != self.snapshot.get(path)}
+        self.snapshot = current
+        return sorted(changed)
+
+
+class DevServer:
+    """Serve the output directory, rebuild what changed, and reload browsers.
+
+    The builder stays in memory between rebuilds so a change only re-renders
+    the pages that depend on it (see :class:`~webifier.core.graph.DependencyGraph`).
+    Changes that affect the root page rebuild the whole site, since every page
+    inherits its config, nav and footer; editing the root index itself starts
+    from a fresh builder so extension config is re-read.
+    """
+
+    def __init__(
+        self,
+        make_builder: Callable[[], Builder],
+        index_file: str = "index.yml",
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        interval: float = 0.5,
+    ) -> None:
+        self.make_builder = make_builder
+        self.index_file = index_file if index_file.endswith((".yml", ".yaml")) else f"{index_file}.yml"
+        self.interval = interval
+        self.builder = make_builder()
+        self.builder.build(index_file=self.index_file)
+        self.watcher = SourceWatcher(exclude=(self.builder.output_dir,))
+        self.generation = 0
+        self.changed = threading.Condition()
+        self._stopped = threading.Event()
+
+        handler = functools.partial(_ReloadingHandler, server_state=self, directory=self.builder.output_dir)
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def address(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    # -- rebuilding --------------------------------------------------------
+
+    def rebuild(self, changed: list[str]) -> list[str]:
+        """Rebuild the pages affected by *changed* files; return what was rebuilt."""
+        graph = self.builder.graph
+        outputs = sorted({output for path in changed for output in graph.affected_pages(path)})
+        if not outputs:
+            return []
+
+        root_output = f"{strip_suffixes(self.index_file, ['.yml', '.yaml'])}.html"
+        if root_output in outputs:
+            if os.path.normpath(self.index_file) in {os.path.normpath(path) for path in changed}:
+                self.builder = self.make_builder()
+            else:
+                self.builder.reset()
+            self.builder.build(index_file=self.index_file)
+            return sorted(self.builder.graph.pages)
+
+        self.builder.rebuild_pages(outputs, changed, index_file=self.index_file)
+        return outputs
+
+    def poll(self) -> list[str]:
+        """Check the source tree once, rebuilding and notifying browsers on change."""
+        changed = self.watcher.changes()
+        if not changed:
+            return []
+        print(f"Changed: {', '.join(changed)}")
+        try:
+            rebuilt = self.rebuild(changed)
+        except Exception as exc:
+            print(f"  Rebuild failed: {exc}")
+            return []
+        if rebuilt:
+            self.notify()
+        return rebuilt
+
+    def notify(self) -> None:
+        """Tell connected browsers to reload."""
+        with self.changed:
+            self.generation += 1
+            self.changed.notify_all()
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def watch(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.poll()
+
+    def serve_forever(self) -> None:
+        print(f"Serving {self.builder.output_dir}/ at {self.address} (Ctrl+C to stop)")
+        threading.Thread(target=self.watch, daemon=True).start()
+        try:
+            self.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        self.notify()
+        self.httpd.server_close()
+
+
+class _ReloadingHandler(SimpleHTTPRequestHandler):
+    """Static file handler that injects the live-reload script into HTML pages."""
+
+    def __init__(self, *args, server_state: DevServer, **kwargs) -> None:
+        self.server_state = server_state
+        super().__init__(*args, **kwargs)
+
+    def log_message(self, format, *args) -> None:  # noqa: A002
+        pass
+
+    def translate_path(self, path: str) -> str:
+        # Pages link to /<baseurl>/…; serve them from the output root.
+        base = self.server_state.builder.base_url.strip("/")
+        url_path = urlsplit(path).path
+        if base and (url_path == f"/{base}" or url_path.startswith(f"/{base}/")):
+            path = url_path[len(base) + 1 :] or "/"
+        return super().translate_path(path)
+
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path == RELOAD_PATH:
+            self._stream_reloads()
+            return
+        page = self._html_file()
+        if page is None:
+            super().do_GET()
+            return
+        with open(page, "rb") as fh:
+            body = fh.read()
+        marker = body.lower().rfind(b"</body>")
+        script = RELOAD_SCRIPT.encode("utf-8")
+        body = body[:marker] + script + body[marker:] if marker >= 0 else body + script
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _html_file(self) -> str | None:
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            path = os.path.join(path, "index.html")
+        elif not os.path.exists(path) and os.path.isfile(f"{path}.html"):
+            path = f"{path}.html"
+        return path if path.endswith(".html") and os.path.isfile(path) else None
+
+    def _stream_reloads(self) -> None:
+        state = self.server_state
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        with state.changed:
+            seen = state.generation
+        try:
+            while not state._stopped.is_set():
+                with state.changed:
+                    state.changed.wait(timeout=15)
+                    generation = state.generation
+                if generation != seen and not state._stopped.is_set():
+                    seen = generation
+                    self.wfile.write(b"data: reload\n\n")
+                else:
+                    self.wfile.write(b": keep-alive\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass